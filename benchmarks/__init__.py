@@ -0,0 +1 @@
+"""Benchmarks for the job aggregation and ranking pipeline."""
@@ -0,0 +1,57 @@
+"""Cohort ranking with ``Ranker.rank_batch`` versus one ``rank_top_k`` per resume.
+
+Run from the repository root::
+
+    python -m benchmarks.batch_ranking --resumes 1000 --jobs 50000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+from internship_bot.ranker import Ranker
+from internship_bot.table import JobTable
+
+from .synthetic import generate_listings, generate_resumes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--check", type=int, default=10, help="resumes compared against rank_top_k")
+    args = parser.parse_args()
+
+    jobs = list(generate_listings(args.jobs))
+    resumes = generate_resumes(args.resumes)
+    now = datetime(2026, 1, 15)
+    ranker = Ranker(clock=lambda: now)
+
+    started = time.perf_counter()
+    table = JobTable.from_listings(jobs)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = ranker.rank_batch(table, resumes, args.top)
+    batch = time.perf_counter() - started
+
+    checked = resumes[: args.check]
+    started = time.perf_counter()
+    for resume, got in zip(checked, results):
+        want = ranker.rank_top_k(jobs, resume, args.top)
+        assert [(r.job.id, r.score, r.explanation) for r in want] == [
+            (r.job.id, r.score, r.explanation) for r in got
+        ]
+    per_resume = (time.perf_counter() - started) / max(len(checked), 1)
+
+    print(f"Top {args.top} for {args.resumes:,} resumes x {args.jobs:,} jobs")
+    print(f"  JobTable.from_listings       {build:8.2f} s")
+    print(f"  rank_batch                   {batch:8.2f} s")
+    print(f"  rank_top_k per resume        {per_resume:8.2f} s (checked {len(checked)} resumes)")
+    print(f"  rank_top_k, all (estimated)  {per_resume * args.resumes:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
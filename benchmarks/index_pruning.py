@@ -0,0 +1,68 @@
+"""Candidate pruning with :class:`JobIndex` on a synthetic corpus.
+
+Run from the repository root::
+
+    python -m benchmarks.index_pruning --count 500000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from internship_bot.job_index import JobIndex
+from internship_bot.ranker import Ranker
+
+from .synthetic import generate_listings, sample_resume
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--min-score", type=float, default=30.0)
+    args = parser.parse_args()
+
+    jobs = list(generate_listings(args.count, args.seed))
+    resume = sample_resume(args.seed)
+    now = datetime(2026, 1, 15)
+    ranker = Ranker(clock=lambda: now)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = JobIndex(Path(tmp) / "index.sqlite3")
+        started = time.perf_counter()
+        index.add(jobs)
+        build = time.perf_counter() - started
+
+        print(f"Pruning {args.count:,} listings (index built in {build:.2f} s)")
+        for label, run in (
+            (
+                f"rank_top_k(k={args.top})",
+                lambda idx: ranker.rank_top_k(jobs, resume, args.top, index=idx),
+            ),
+            (
+                f"rank(min_score={args.min_score:g})",
+                lambda idx: ranker.rank(jobs, resume, min_score=args.min_score, index=idx),
+            ),
+        ):
+            started = time.perf_counter()
+            expected = run(None)
+            plain = time.perf_counter() - started
+            started = time.perf_counter()
+            actual = run(index)
+            pruned = time.perf_counter() - started
+            assert [(r.job.id, r.score, r.explanation) for r in expected] == [
+                (r.job.id, r.score, r.explanation) for r in actual
+            ]
+            print(
+                f"  {label:<24} {plain:7.3f} s -> {pruned:7.3f} s ({plain / pruned:4.1f}x), "
+                f"{ranker.last_pruned:,} pruned ({ranker.last_pruned / len(jobs):.0%})"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
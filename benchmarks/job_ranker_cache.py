@@ -0,0 +1,53 @@
+"""Cold vs. warm ``job_ranker.py --stream --cache`` runs on a synthetic jobs file.
+
+Run from the repository root::
+
+    python -m benchmarks.job_ranker_cache --count 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import job_ranker
+
+from .job_ranker_workers import PROFILE, write_jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, array in (("NDJSON", False), ("JSON array", True)):
+            path = Path(tmp) / ("jobs.json" if array else "jobs.ndjson")
+            write_jobs(path, args.count, args.seed, array)
+
+            started = time.perf_counter()
+            expected = job_ranker.top_jobs(PROFILE, job_ranker.iter_jobs(path), args.top)
+            uncached = time.perf_counter() - started
+            timings = []
+            for _ in ("cold", "warm"):
+                started = time.perf_counter()
+                cached = job_ranker.open_cached_jobs(path)
+                ranked = cached.top(PROFILE, args.top)
+                cached.close()
+                timings.append(time.perf_counter() - started)
+                assert ranked == expected
+            sidecar = path.with_name(path.name + job_ranker.CACHE_SUFFIX)
+            print(
+                f"{label}: {args.count:,} jobs, {path.stat().st_size / 2**20:.0f} MiB "
+                f"(cache {sidecar.stat().st_size / 2**20:.0f} MiB)"
+            )
+            print(f"  no cache   {uncached:7.2f} s")
+            print(f"  cold cache {timings[0]:7.2f} s")
+            print(f"  warm cache {timings[1]:7.2f} s ({uncached / timings[1]:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
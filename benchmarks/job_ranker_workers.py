@@ -0,0 +1,77 @@
+"""``job_ranker.py --stream`` with and without ``--workers`` on a synthetic jobs file.
+
+Run from the repository root::
+
+    python -m benchmarks.job_ranker_workers --count 1000000 --workers 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import job_ranker
+
+from .synthetic import LOCATIONS, ROLES, SKILL_WEIGHTS, SKILLS, WORD_WEIGHTS, WORDS
+
+PROFILE = {
+    "name": "Benchmark",
+    "skills": {"python", "sql", "react", "docker", "aws"},
+    "locations": ["Remote", "New York, NY"],
+    "roles": ["Backend", "Data"],
+}
+
+
+def write_jobs(path: Path, count: int, seed: int, array: bool) -> None:
+    """Write ``count`` job_ranker-style jobs as a JSON array or as NDJSON."""
+
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as out:
+        out.write("[\n" if array else "")
+        for index in range(count):
+            job = {
+                "id": index,
+                "title": rng.choice(ROLES),
+                "location": rng.choice(LOCATIONS),
+                "technologies": sorted(set(rng.choices(SKILLS, weights=SKILL_WEIGHTS, k=rng.randint(2, 6)))),
+                "description": " ".join(rng.choices(WORDS, weights=WORD_WEIGHTS, k=30)),
+            }
+            separator = ",\n" if array and index < count - 1 else "\n"
+            out.write(json.dumps(job) + separator)
+        out.write("]\n" if array else "")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, array in (("NDJSON", False), ("JSON array", True)):
+            path = Path(tmp) / ("jobs.json" if array else "jobs.ndjson")
+            write_jobs(path, args.count, args.seed, array)
+            size = path.stat().st_size / 2**20
+            print(f"{label}: {args.count:,} jobs, {size:.0f} MiB, {os.cpu_count()} CPU(s)")
+
+            started = time.perf_counter()
+            expected = job_ranker.top_jobs(PROFILE, job_ranker.iter_jobs(path), args.top)
+            single = time.perf_counter() - started
+            print(f"  {'1 process':<12} {single:7.2f} s")
+            for workers in args.workers:
+                started = time.perf_counter()
+                ranked = job_ranker.top_jobs_parallel(PROFILE, path, args.top, workers)
+                elapsed = time.perf_counter() - started
+                assert ranked == expected, f"--workers {workers} changed the ranking"
+                print(f"  {f'{workers} workers':<12} {elapsed:7.2f} s ({single / elapsed:4.2f}x)")
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Per-listing memory of the plain vs. compact JobListing representation.
+
+Run from the repository root::
+
+    python -m benchmarks.listing_memory --count 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import resource
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from internship_bot.schemas import ListingCompactor
+
+from .synthetic import generate_raw_items, to_listing
+
+
+@dataclass
+class _PlainRequirement:
+    skill: str
+    level: Optional[str] = None
+    required: bool = True
+
+
+@dataclass
+class _PlainListing:
+    """Replica of the original ``__dict__``-based listing with raw metadata."""
+
+    provider: str
+    id: str
+    company: str
+    role: str
+    location: Optional[str]
+    description: str
+    requirements: Sequence[_PlainRequirement] = field(default_factory=list)
+    technologies: Sequence[str] = field(default_factory=list)
+    apply_url: Optional[str] = None
+    posted_at: Optional[datetime] = None
+    metadata: dict = field(default_factory=dict)
+
+
+def _plain(item: dict) -> _PlainListing:
+    return _PlainListing(
+        provider="LinkedIn",
+        id=str(item["id"]),
+        company=item["companyName"],
+        role=item["title"],
+        location=item["formattedLocation"],
+        description=item["descriptionSnippet"],
+        requirements=[_PlainRequirement(skill=skill) for skill in item["skills"]],
+        technologies=list(item["skills"]),
+        apply_url=item["applyMethod"]["companyApplyUrl"],
+        posted_at=datetime.utcfromtimestamp(item["listedAt"] / 1000),
+        metadata=item,
+    )
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _build_and_report(count: int, variant: str, results: "multiprocessing.Queue[float]") -> None:
+    build = VARIANTS[variant]
+    gc.collect()
+    before = _peak_rss_bytes()
+    listings: List[object] = [build(item) for item in generate_raw_items(count)]
+    gc.collect()
+    results.put((_peak_rss_bytes() - before) / len(listings))
+
+
+def measure(count: int, variant: str) -> float:
+    """Return resident bytes per listing for ``count`` listings of ``variant``.
+
+    Each variant is built in a fresh process so peak RSS is not shared.
+    """
+
+    context = multiprocessing.get_context("fork")
+    results: "multiprocessing.Queue[float]" = context.Queue()
+    process = context.Process(target=_build_and_report, args=(count, variant, results))
+    process.start()
+    per_listing = results.get()
+    process.join()
+    return per_listing
+
+
+_compactor = ListingCompactor(keep_metadata=False)
+
+VARIANTS: Dict[str, Callable[[dict], object]] = {
+    "plain (dict, raw payload)": _plain,
+    "slots, raw payload": to_listing,
+    "compact (slots, interned, no raw)": lambda item: _compactor(to_listing(item, keep_raw=False)),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    results = {variant: measure(args.count, variant) for variant in VARIANTS}
+    print(f"Per-listing memory at {args.count:,} listings")
+    for label, per_listing in results.items():
+        print(f"  {label:<36} {per_listing:8.0f} B")
+
+
+if __name__ == "__main__":
+    main()
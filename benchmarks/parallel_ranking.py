@@ -0,0 +1,60 @@
+"""Scaling of ``Ranker.rank``/``rank_top_k`` with ``workers`` on a synthetic corpus.
+
+Run from the repository root::
+
+    python -m benchmarks.parallel_ranking --count 200000 --workers 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from internship_bot.ranker import Ranker
+
+from .synthetic import generate_listings, sample_resume
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs = list(generate_listings(args.count, args.seed))
+    resume = sample_resume(args.seed)
+    now = datetime(2026, 1, 15)
+    ranker = Ranker(clock=lambda: now)
+
+    print(f"Ranking {args.count:,} listings on {os.cpu_count()} CPU(s), best of {args.repeat}")
+    print(f"{'workers':>8} {'rank':>9} {'speedup':>8} {f'top {args.top}':>9} {'speedup':>8}")
+    expected = None
+    baseline = None
+    for workers in args.workers:
+        timings = []
+        for run in (
+            lambda: ranker.rank(jobs, resume, workers=workers),
+            lambda: ranker.rank_top_k(jobs, resume, args.top, workers=workers),
+        ):
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = run()
+                best = min(best, time.perf_counter() - started)
+            timings.append(best)
+        signature = [(r.job.id, r.score) for r in result]
+        if expected is None:
+            expected, baseline = signature, timings
+        assert signature == expected, f"workers={workers} changed the ranking"
+        print(
+            f"{workers:>8} {timings[0]:>8.3f}s {baseline[0] / timings[0]:>7.2f}x "
+            f"{timings[1]:>8.3f}s {baseline[1] / timings[1]:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
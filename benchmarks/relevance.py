@@ -0,0 +1,55 @@
+"""BM25 relevance queries against :class:`RelevanceIndex` as the corpus grows.
+
+Run from the repository root::
+
+    python -m benchmarks.relevance --count 200000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from internship_bot.relevance import RelevanceIndex
+
+from .synthetic import generate_listings, sample_resume
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    jobs = list(generate_listings(args.count, args.seed))
+    resume = sample_resume(args.seed)
+    terms = [*resume.skills, *resume.interests]
+    rare = [resume.interests[0]] if resume.interests else terms[:1]
+    step = args.count // args.steps
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = RelevanceIndex(Path(tmp) / "relevance.sqlite3")
+        print(f"{'listings':>10} {'add':>9} {'profile query':>14} {'one term':>10} {'matches':>9}")
+        for stop in range(step, args.count + 1, step):
+            started = time.perf_counter()
+            index.add(jobs[stop - step : stop])
+            added = time.perf_counter() - started
+            timings = []
+            for query in (terms, rare):
+                best = float("inf")
+                for _ in range(5):
+                    started = time.perf_counter()
+                    docs, _ = index.scores(query)
+                    best = min(best, time.perf_counter() - started)
+                timings.append((best, docs.size))
+            print(
+                f"{stop:>10,} {added:>8.2f}s {timings[0][0] * 1e3:>12.1f}ms "
+                f"{timings[1][0] * 1e3:>8.1f}ms {timings[0][1]:>9,}"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Timing and memory suite for aggregation and ranking, with baseline comparison.
+
+Run from the repository root::
+
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite compare baseline.json results.json
+
+``run`` measures, for every size, ``JobAggregator.search_jobs`` over stub
+connectors, ``Ranker.rank`` and ``Ranker.rank_top_k`` (best of ``--repeat``)
+and the peak resident memory of the process running the pipeline,
+interpreter and imports included.  Each size runs in a freshly spawned
+process so memory is not shared between sizes; a size whose process dies
+(e.g. killed for running out of memory) or exceeds ``--timeout`` is
+recorded with an ``error`` instead of metrics.  ``compare`` exits with
+status 1 when a metric got worse than the baseline by more than
+``--threshold``.  ``benchmarks/baseline.json`` holds a reference run; its
+``meta`` block records the machine it came from.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from internship_bot.aggregator import JobAggregator
+from internship_bot.ranker import Ranker
+
+from .synthetic import sample_resume, stub_connectors
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+NOW = datetime(2026, 1, 15)
+QUERY = "software engineering intern"
+
+# Metric -> differences below this are noise whatever the ratio.
+METRICS: Dict[str, float] = {
+    "search_jobs_s": 0.005,
+    "rank_s": 0.005,
+    "rank_top_k_s": 0.005,
+    "peak_rss_mb": 2.0,
+}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _best_of(repeat: int, run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _measure_size(size: int, seed: int, repeat: int, results: "multiprocessing.Queue[dict]") -> None:
+    aggregator = JobAggregator(stub_connectors(size, seed))
+    resume = sample_resume(seed)
+    ranker = Ranker(clock=lambda: NOW)
+    jobs = aggregator.search_jobs(QUERY)
+    metrics = {
+        "listings": len(jobs),
+        "search_jobs_s": _best_of(repeat, lambda: aggregator.search_jobs(QUERY)),
+        "rank_s": _best_of(repeat, lambda: ranker.rank(jobs, resume)),
+        "rank_top_k_s": _best_of(repeat, lambda: ranker.rank_top_k(jobs, resume, 10)),
+    }
+    metrics["peak_rss_mb"] = _peak_rss_mb()
+    results.put(metrics)
+
+
+def measure(size: int, seed: int = 0, repeat: int = 3, timeout: Optional[float] = None) -> dict:
+    """Return the metrics for ``size`` listings, measured in a fresh process.
+
+    Raises :class:`RuntimeError` when the process exits without reporting
+    or runs longer than ``timeout`` seconds.
+    """
+
+    # A spawned child starts from a bare interpreter, so its peak RSS is not
+    # inflated by whatever the parent had allocated.
+    context = multiprocessing.get_context("spawn")
+    results: "multiprocessing.Queue[dict]" = context.Queue()
+    process = context.Process(target=_measure_size, args=(size, seed, repeat, results))
+    process.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                metrics = results.get(timeout=1.0)
+                break
+            except queue.Empty:
+                pass
+            if not process.is_alive():
+                try:
+                    # The result may have been queued just before the exit.
+                    metrics = results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    raise RuntimeError(
+                        f"measurement process for {size:,} listings exited with code {process.exitcode}"
+                    ) from None
+            if deadline is not None and time.monotonic() > deadline:
+                raise RuntimeError(f"measurement of {size:,} listings exceeded {timeout:g}s")
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+    return metrics
+
+
+def run(sizes: List[int], seed: int, repeat: int, timeout: Optional[float] = None) -> dict:
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": {},
+    }
+    print(f"{'size':>10} {'search_jobs':>12} {'rank':>9} {'rank_top_k':>11} {'peak RSS':>10}")
+    for size in sizes:
+        try:
+            metrics = measure(size, seed, repeat, timeout)
+        except RuntimeError as exc:
+            report["results"][str(size)] = {"error": str(exc)}
+            print(f"{size:>10,} failed: {exc}")
+            continue
+        report["results"][str(size)] = metrics
+        print(
+            f"{size:>10,} {metrics['search_jobs_s']:>11.3f}s {metrics['rank_s']:>8.3f}s "
+            f"{metrics['rank_top_k_s']:>10.3f}s {metrics['peak_rss_mb']:>7.1f} MB"
+        )
+    return report
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Print a metric-by-metric comparison and return the regressions found."""
+
+    regressions: List[str] = []
+    print(f"{'size':>10} {'metric':<14} {'baseline':>10} {'current':>10} {'change':>8}")
+    for size, metrics in current["results"].items():
+        reference = baseline["results"].get(size)
+        if reference is None:
+            continue
+        if "error" in metrics and "error" not in reference:
+            regressions.append(f"{int(size):,} listings failed: {metrics['error']}")
+            print(f"{int(size):>10,} failed: {metrics['error']}")
+            continue
+        for metric, noise in METRICS.items():
+            if metric not in metrics or metric not in reference:
+                continue
+            old, new = reference[metric], metrics[metric]
+            change = (new - old) / old if old else 0.0
+            status = ""
+            if change > threshold and new - old > noise:
+                status = "REGRESSION"
+                regressions.append(f"{metric} at {int(size):,} listings: {old:.4g} -> {new:.4g}")
+            elif change < -threshold and old - new > noise:
+                status = "improved"
+            print(f"{int(size):>10,} {metric:<14} {old:>10.4g} {new:>10.4g} {change:>+7.1%} {status}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="measure and write results as JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--timeout", type=float, help="seconds allowed per size")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args.sizes, args.seed, args.repeat, args.timeout)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Results written to {args.output}")
+        return
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
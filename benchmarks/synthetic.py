@@ -0,0 +1,168 @@
+"""Seeded synthetic job listings and resumes for benchmarks.
+
+Skills, description words and locations follow Zipf-like popularity (a few
+technologies and phrases dominate, with a long tail) and description lengths
+are log-normal, so posting lists, vocabularies and match rates are skewed
+the way real crawls are.
+"""
+from __future__ import annotations
+
+import json
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from internship_bot.connectors.base import JobConnector
+from internship_bot.schemas import JobListing, JobRequirement, ResumeProfile
+
+COMPANIES = [f"{prefix} {suffix}" for prefix in (
+    "Redwood", "Northwind", "Celestial", "Harbor", "Summit", "Quantum", "Lattice", "Beacon",
+    "Granite", "Aurora", "Cobalt", "Meridian", "Atlas", "Juniper", "Orbit", "Vertex",
+) for suffix in ("Labs", "Dynamics", "Systems", "Robotics", "Analytics", "Health", "Capital", "AI")]
+LOCATIONS = [
+    "Remote - US", "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA", "Boston, MA",
+    "Chicago, IL", "Denver, CO", "Atlanta, GA", "Los Angeles, CA", "Pittsburgh, PA", "Remote",
+]
+ROLES = [
+    "Software Engineering Intern", "Data Science Intern", "Machine Learning Intern",
+    "Platform Engineering Intern", "Backend Engineering Intern", "Frontend Engineering Intern",
+    "AI Research Intern", "Infrastructure Intern", "Security Engineering Intern", "Product Analyst Intern",
+]
+SKILLS = [
+    "python", "java", "c++", "go", "rust", "typescript", "react", "sql", "postgresql", "aws",
+    "docker", "kubernetes", "pytorch", "tensorflow", "spark", "machine learning", "data analysis",
+    "fastapi", "django", "graphql", "redis", "linux", "terraform", "scala", "pandas",
+]
+WORDS = (
+    "build ship scale design own prototype improve measure deploy maintain services pipelines "
+    "models dashboards tooling platform customers teams data infrastructure reliability research "
+    "open-source product features latency quality experiments mentors interns summer "
+    "collaborate engineers stakeholders production systems team cloud backend frontend apis "
+    "testing automation analytics insights users scalable distributed real-time internal "
+    "support development code reviews documentation projects impact learning growth "
+    "cross-functional agile fast-paced environment hands-on problem solving communication"
+).split()
+PROVIDERS = ["LinkedIn", "Indeed", "Handshake", "Greenhouse"]
+
+
+def _zipf(count: int, exponent: float = 1.0) -> List[float]:
+    return [1 / (rank + 1) ** exponent for rank in range(count)]
+
+
+SKILL_WEIGHTS = _zipf(len(SKILLS))
+WORD_WEIGHTS = _zipf(len(WORDS), 0.8)
+LOCATION_WEIGHTS = _zipf(len(LOCATIONS), 0.7)
+
+
+def _weighted_sample(rng: random.Random, population: Sequence[str], weights: Sequence[float], k: int) -> List[str]:
+    """``k`` distinct items, each drawn with probability proportional to its weight."""
+
+    # Efraimidis-Spirakis: keep the k largest u ** (1 / weight).
+    keys = sorted(range(len(population)), key=lambda i: rng.random() ** (1 / weights[i]), reverse=True)
+    return [population[i] for i in keys[:k]]
+
+
+def _description(rng: random.Random, skills: Sequence[str]) -> str:
+    length = min(max(int(rng.lognormvariate(math.log(30), 0.5)), 12), 200)
+    words = rng.choices(WORDS, weights=WORD_WEIGHTS, k=length)
+    # Most postings name some of their stack in the prose too.
+    for skill in skills:
+        if rng.random() < 0.4:
+            words.insert(rng.randrange(len(words) + 1), f"experience with {skill}")
+    return " ".join(words)
+
+
+def generate_raw_items(count: int, seed: int = 0) -> Iterator[dict]:
+    """Yield LinkedIn-style API items; each one is freshly decoded JSON."""
+
+    rng = random.Random(seed)
+    epoch = datetime(2026, 1, 1)
+    for index in range(count):
+        item = {
+            "id": index,
+            "companyName": rng.choice(COMPANIES),
+            "title": rng.choice(ROLES),
+            "formattedLocation": rng.choices(LOCATIONS, weights=LOCATION_WEIGHTS)[0],
+            "skills": _weighted_sample(rng, SKILLS, SKILL_WEIGHTS, rng.randint(2, 6)),
+            "listedAt": int((epoch - timedelta(hours=rng.randint(0, 24 * 60))).timestamp() * 1000),
+            "applyMethod": {"companyApplyUrl": f"https://jobs.example.com/{index}"},
+            "workRemoteAllowed": rng.random() < 0.3,
+            "trackingUrn": f"urn:li:jobPosting:{index}",
+        }
+        item["descriptionSnippet"] = _description(rng, item["skills"])
+        yield json.loads(json.dumps(item))
+
+
+def to_listing(item: dict, keep_raw: bool = True, provider: str = "LinkedIn") -> JobListing:
+    """Normalize a raw item the way the connectors do."""
+
+    requirements: List[JobRequirement] = [JobRequirement(skill=skill) for skill in item["skills"]]
+    return JobListing(
+        provider=provider,
+        id=str(item["id"]),
+        company=item["companyName"],
+        role=item["title"],
+        location=item["formattedLocation"],
+        description=item["descriptionSnippet"],
+        requirements=requirements,
+        technologies=list(item["skills"]),
+        apply_url=item["applyMethod"]["companyApplyUrl"],
+        posted_at=datetime.utcfromtimestamp(item["listedAt"] / 1000),
+        metadata=item if keep_raw else {},
+    )
+
+
+def generate_listings(count: int, seed: int = 0, provider: str = "LinkedIn") -> Iterator[JobListing]:
+    for item in generate_raw_items(count, seed):
+        yield to_listing(item, keep_raw=False, provider=provider)
+
+
+def sample_resume(seed: int = 0) -> ResumeProfile:
+    """Return a seeded candidate profile drawing on the same vocabularies."""
+
+    rng = random.Random(seed)
+    return ResumeProfile(
+        name=f"Candidate {seed}",
+        graduation_date=datetime(2027, 5, 15),
+        skills=_weighted_sample(rng, SKILLS, SKILL_WEIGHTS, rng.randint(5, 10)),
+        interests=_weighted_sample(rng, WORDS, WORD_WEIGHTS, 3),
+        preferred_locations=[
+            location.split(",")[0] for location in _weighted_sample(rng, LOCATIONS, LOCATION_WEIGHTS, 2)
+        ],
+        target_role_keywords=rng.sample(["engineering", "data", "machine learning", "research", "backend"], 2),
+    )
+
+
+def generate_resumes(count: int, seed: int = 0) -> List[ResumeProfile]:
+    return [sample_resume(seed + offset) for offset in range(count)]
+
+
+class StubConnector(JobConnector):
+    """Connector serving a fixed list of listings, for timing the aggregator alone."""
+
+    def __init__(self, provider_name: str, jobs: Iterable[JobListing], timeout: Optional[float] = None) -> None:
+        super().__init__(provider_name=provider_name, timeout=timeout)
+        self.jobs = list(jobs)
+
+    def fetch_jobs(self, query: str) -> Iterable[JobListing]:
+        return self.jobs
+
+
+def stub_connectors(count: int, seed: int = 0, overlap: float = 0.1) -> List[StubConnector]:
+    """Split ``count`` listings over :data:`PROVIDERS`, repeating ``overlap`` of each provider's ids.
+
+    Repeated ``provider:id`` keys exercise the aggregator's exact dedup the
+    way overlapping result pages do.
+    """
+
+    connectors = []
+    share = -(-count // len(PROVIDERS))
+    for offset, provider in enumerate(PROVIDERS):
+        size = min(share, count - offset * share)
+        if size <= 0:
+            break
+        jobs = list(generate_listings(size, seed + offset, provider=provider))
+        jobs.extend(jobs[: int(size * overlap)])
+        connectors.append(StubConnector(provider, jobs))
+    return connectors
@@ -0,0 +1,67 @@
+"""Scalar ``Ranker.rank`` vs. vectorized ``Ranker.rank_table`` on synthetic listings.
+
+Run from the repository root::
+
+    python -m benchmarks.vectorized_ranking --count 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+from internship_bot.ranker import Ranker
+from internship_bot.table import JobTable
+
+from .synthetic import generate_listings, sample_resume
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    jobs = list(generate_listings(args.count, args.seed))
+    resume = sample_resume(args.seed)
+    now = datetime(2026, 1, 15)
+    ranker = Ranker(clock=lambda: now)
+
+    started = time.perf_counter()
+    expected = ranker.rank(jobs, resume)
+    scalar = time.perf_counter() - started
+
+    started = time.perf_counter()
+    table = JobTable.from_listings(jobs)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ranker.score_table(table, resume)
+    first = time.perf_counter() - started  # includes the lazy description term index
+
+    started = time.perf_counter()
+    ranker.score_table(table, resume)
+    scored = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ranker.rank_table(table, resume, k=10)
+    top_k = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = ranker.rank_table(table, resume)
+    full = time.perf_counter() - started
+
+    assert len(expected) == len(actual)
+    for want, got in zip(expected, actual):
+        assert (want.job.id, want.score, want.explanation) == (got.job.id, got.score, got.explanation)
+
+    print(f"Ranking {args.count:,} listings (results identical)")
+    print(f"  rank (scalar)              {scalar:8.3f} s")
+    print(f"  JobTable.from_listings     {build:8.3f} s")
+    print(f"  score_table (first call)   {first:8.3f} s")
+    print(f"  score_table                {scored:8.3f} s  ({scalar / scored:5.1f}x)")
+    print(f"  rank_table k=10            {top_k:8.3f} s  ({scalar / top_k:5.1f}x)")
+    print(f"  rank_table (all rows)      {full:8.3f} s  ({scalar / full:5.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,456 @@
 """Job aggregation utilities."""
 from __future__ import annotations
 
+import asyncio
+import logging
+import queue
+import threading
+import time
 from collections import OrderedDict
-from typing import Iterable, List, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, List, Optional, Sequence, Set
 
 from .connectors.base import JobConnector
-from .schemas import JobListing
+from .crawl_state import CrawlState
+from .dedup import NearDuplicateDetector
+from .job_index import JobIndex
+from .relevance import RelevanceIndex
+from .schemas import JobListing, ListingCompactor
+from .table import JobTable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectorOutcome:
+    """Result of running a single connector during a concurrent search."""
+
+    provider: str
+    jobs: List[JobListing] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+
+    @property
+    def partial(self) -> bool:
+        return self.timed_out or self.error is not None
 
 
 class JobAggregator:
     """Aggregate job listings from multiple connectors."""
 
-    def __init__(self, connectors: Sequence[JobConnector]) -> None:
+    def __init__(
+        self,
+        connectors: Sequence[JobConnector],
+        *,
+        concurrent: bool = False,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        deduplicator: Optional[NearDuplicateDetector] = None,
+        incremental: bool = False,
+        state: Optional[CrawlState] = None,
+        compact: bool = False,
+        index: Optional[JobIndex] = None,
+        relevance: Optional[RelevanceIndex] = None,
+    ) -> None:
         self.connectors = connectors
+        self.concurrent = concurrent
+        self.timeout = timeout
+        self.max_workers = max_workers
+        # Optional cross-provider near-duplicate stage run after the exact dedup.
+        self.deduplicator = deduplicator
+        # Incremental mode only returns listings that are new or changed since
+        # the previous run recorded in ``state``.
+        self.incremental = incremental
+        self.state = state if state is not None or not incremental else CrawlState()
+        # Compact mode interns repeated strings and shares requirement objects.
+        self.compactor: Optional[ListingCompactor] = ListingCompactor() if compact else None
+        # Inverted index kept up to date with every search, for Ranker pruning.
+        self.index = index
+        # BM25 index over role and description text, fed the same listings.
+        self.relevance = relevance
+        self.last_outcomes: List[ConnectorOutcome] = []
 
     def search_jobs(self, query: str) -> List[JobListing]:
+        complete: Optional[Set[str]] = None
+        if self.concurrent:
+            self.last_outcomes = self._fan_out(query)
+            batches: Iterable[Iterable[JobListing]] = [o.jobs for o in self.last_outcomes]
+            # Only providers read to completion may advance their high-water mark.
+            complete = {o.provider for o in self.last_outcomes} - {
+                o.provider for o in self.last_outcomes if o.partial
+            }
+        else:
+            batches = (
+                _fetch(connector, query, self._since(connector, query))
+                for connector in self.connectors
+            )
+
         combined: "OrderedDict[str, JobListing]" = OrderedDict()
-        for connector in self.connectors:
-            for job in connector.fetch_jobs(query):
-                combined[f"{job.provider}:{job.id}"] = job
-        return list(combined.values())
+        compactor = self.compactor
+        for batch in batches:
+            for job in batch:
+                combined[f"{job.provider}:{job.id}"] = compactor(job) if compactor else job
+        jobs: Iterable[JobListing] = combined.values()
+        if self.deduplicator is not None:
+            jobs = self.deduplicator.merge(jobs)
+        if self.index is not None or self.relevance is not None:
+            jobs = list(jobs)
+            for index in (self.index, self.relevance):
+                if index is not None:
+                    index.add(jobs)
+        if self.incremental:
+            jobs = self.state.filter_changed(query, jobs, complete)
+        return list(jobs)
+
+    def search_table(self, query: str) -> JobTable:
+        """Run :meth:`search_jobs` and return the results as a columnar table."""
+
+        return JobTable.from_listings(self.search_jobs(query))
+
+    def iter_jobs(self, query: str, *, max_seen: int = 100_000) -> Iterator[JobListing]:
+        """Yield deduplicated listings as soon as any connector produces them.
+
+        Every connector runs on the thread pool and feeds a shared queue, so the
+        first listings arrive within the latency of the fastest provider.  The
+        first occurrence of each ``provider:id`` key wins.  Only the most recent
+        ``max_seen`` keys are remembered, which bounds memory on huge crawls.
+        Per-connector deadlines apply as in :meth:`search_jobs`; listings that
+        arrive after a connector's deadline are dropped.  Yielded listings are
+        added to ``index`` and ``relevance`` in batches.
+        """
+
+        # Filled with the providers whose stream ended without an error or deadline.
+        complete: Set[str] = set()
+        jobs = self._iter_unique(query, max_seen, complete)
+        if self.deduplicator is not None:
+            jobs = self.deduplicator.filter_stream(jobs)
+        if self.index is not None or self.relevance is not None:
+            jobs = self._feed_indexes(jobs)
+        if self.incremental:
+            jobs = self.state.filter_changed(query, jobs, complete)
+        yield from jobs
+
+    def _feed_indexes(self, jobs: Iterable[JobListing], batch_size: int = 500) -> Iterator[JobListing]:
+        """Pass ``jobs`` through, adding them to the indexes in batches.
+
+        Listings not yet written are simply missing from the index, which
+        :class:`Ranker` treats as unbounded, so pruning stays safe meanwhile.
+        """
+
+        indexes = [index for index in (self.index, self.relevance) if index is not None]
+        batch: List[JobListing] = []
+        try:
+            for job in jobs:
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    for index in indexes:
+                        index.add(batch)
+                    batch = []
+                yield job
+        finally:
+            if batch:
+                for index in indexes:
+                    index.add(batch)
+
+    def _iter_unique(self, query: str, max_seen: int, complete: Set[str]) -> Iterator[JobListing]:
+        if not self.connectors:
+            return
+        events: "queue.Queue[tuple]" = queue.Queue()
+        cancelled: Set[int] = set()
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers or len(self.connectors),
+            thread_name_prefix="job-connector",
+        )
+        loop = _EventLoop() if any(connector.is_async for connector in self.connectors) else None
+        started = time.monotonic()
+        deadlines: Dict[int, Optional[float]] = {}
+        for index, connector in enumerate(self.connectors):
+            deadline = self._deadline_for(connector)
+            deadlines[index] = None if deadline is None else started + deadline
+            since = self._since(connector, query)
+            if loop is not None and connector.is_async:
+                loop.submit(_stream_async(index, connector, query, since, events, cancelled, deadline))
+            else:
+                pool.submit(_stream_connector, index, connector, query, since, events, cancelled)
+
+        seen = _RecentKeys(max_seen)
+        pending = set(deadlines)
+        partial: Set[str] = set()
+        try:
+            while pending:
+                now = time.monotonic()
+                for index in [i for i in pending if deadlines[i] is not None and deadlines[i] <= now]:
+                    pending.discard(index)
+                    cancelled.add(index)
+                    partial.add(self.connectors[index].provider_name)
+                    logger.warning(
+                        "Connector %s exceeded its deadline; stopped streaming",
+                        self.connectors[index].provider_name,
+                    )
+                if not pending:
+                    break
+                timers = [deadlines[i] for i in pending if deadlines[i] is not None]
+                wait = max(min(timers) - now, 0.0) if timers else None
+                try:
+                    index, job, error = events.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                if index not in pending:
+                    continue
+                if job is None:
+                    pending.discard(index)
+                    provider = self.connectors[index].provider_name
+                    (complete if error is None else partial).add(provider)
+                    if error is not None:
+                        logger.warning(
+                            "Connector %s failed (%s); keeping streamed results",
+                            self.connectors[index].provider_name,
+                            error,
+                        )
+                    continue
+                if seen.add(f"{job.provider}:{job.id}"):
+                    yield self.compactor(job) if self.compactor else job
+            complete.difference_update(partial)
+        finally:
+            cancelled.update(range(len(self.connectors)))
+            pool.shutdown(wait=False, cancel_futures=True)
+            if loop is not None:
+                loop.close()
+
+    # ------------------------------------------------------------------
+    # concurrent fan-out
+
+    def _fan_out(self, query: str) -> List[ConnectorOutcome]:
+        """Run every connector at once and collect what each produced in time.
+
+        Outcomes are returned in connector order so the downstream dedup keeps
+        the same insertion order as the sequential path.
+        """
+
+        if not self.connectors:
+            return []
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers or len(self.connectors),
+            thread_name_prefix="job-connector",
+        )
+        # Native async connectors share one event loop instead of a thread each.
+        loop = _EventLoop() if any(connector.is_async for connector in self.connectors) else None
+        started = time.monotonic()
+        sinks: List[List[JobListing]] = [[] for _ in self.connectors]
+        # Each worker appends its own finish time, so a fast connector collected
+        # after a slow one still reports how long it took.
+        finish_times: List[List[float]] = [[] for _ in self.connectors]
+        futures: List[Future] = []
+        for connector, sink, finished in zip(self.connectors, sinks, finish_times):
+            since = self._since(connector, query)
+            if loop is not None and connector.is_async:
+                deadline = self._deadline_for(connector)
+                futures.append(
+                    loop.submit(_run_async_connector(connector, query, since, sink.append, finished, deadline))
+                )
+            else:
+                futures.append(pool.submit(_run_connector, connector, query, since, sink.append, finished))
+        outcomes: List[ConnectorOutcome] = []
+        try:
+            for connector, sink, finished, future in zip(self.connectors, sinks, finish_times, futures):
+                outcome = ConnectorOutcome(provider=connector.provider_name)
+                deadline = self._deadline_for(connector)
+                remaining = None if deadline is None else max(deadline - (time.monotonic() - started), 0.0)
+                try:
+                    future.result(timeout=remaining)
+                except (FutureTimeoutError, asyncio.TimeoutError):
+                    outcome.timed_out = True
+                    logger.warning(
+                        "Connector %s exceeded its %.1fs deadline; keeping %d partial results",
+                        connector.provider_name,
+                        deadline,
+                        len(sink),
+                    )
+                except Exception as exc:  # noqa: BLE001 - one provider must not sink the search
+                    outcome.error = exc
+                    logger.warning(
+                        "Connector %s failed (%s); keeping %d partial results",
+                        connector.provider_name,
+                        exc,
+                        len(sink),
+                    )
+                outcome.jobs = list(sink)
+                # A connector still running past its deadline has no finish time.
+                outcome.elapsed = (finished[0] if finished else time.monotonic()) - started
+                outcomes.append(outcome)
+        finally:
+            # Never block on stragglers; their late results are discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+            if loop is not None:
+                loop.close()
+        return outcomes
+
+    def _deadline_for(self, connector: JobConnector) -> Optional[float]:
+        return connector.timeout if connector.timeout is not None else self.timeout
+
+    def _since(self, connector: JobConnector, query: str) -> Optional[datetime]:
+        if not self.incremental:
+            return None
+        return self.state.high_water_mark(connector.provider_name, query)
+
+
+def _fetch(connector: JobConnector, query: str, since: Optional[datetime]) -> Iterable[JobListing]:
+    if since is not None:
+        return connector.fetch_jobs_since(query, since)
+    return connector.fetch_jobs(query)
+
+
+def _run_connector(
+    connector: JobConnector,
+    query: str,
+    since: Optional[datetime],
+    emit: Callable[[JobListing], None],
+    finished: Optional[List[float]] = None,
+) -> None:
+    """Drive one connector to completion, emitting listings as they appear.
+
+    When given, ``finished`` receives the ``time.monotonic()`` at which the
+    connector returned or raised.
+    """
+
+    try:
+        for job in _fetch(connector, query, since):
+            emit(job)
+    finally:
+        if finished is not None:
+            finished.append(time.monotonic())
+
+
+async def _run_async_connector(
+    connector: JobConnector,
+    query: str,
+    since: Optional[datetime],
+    emit: Callable[[JobListing], None],
+    finished: Optional[List[float]] = None,
+    timeout: Optional[float] = None,
+) -> None:
+    """Async counterpart of :func:`_run_connector`, cut off after ``timeout`` seconds.
+
+    Listings emitted before the deadline stay emitted; the deadline then
+    surfaces as :class:`asyncio.TimeoutError`.
+    """
+
+    async def drain() -> None:
+        async for job in connector.afetch_jobs(query, since):
+            emit(job)
+
+    try:
+        await asyncio.wait_for(drain(), timeout)
+    finally:
+        if finished is not None:
+            finished.append(time.monotonic())
+
+
+class _EventLoop:
+    """An asyncio event loop running on its own daemon thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="job-connector-async", daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine: Coroutine[Any, Any, None]) -> "Future[None]":
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def close(self) -> None:
+        """Cancel whatever is still running and stop the loop, without waiting."""
+
+        self.loop.call_soon_threadsafe(self._cancel_all)
+
+    def _cancel_all(self) -> None:
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self.loop.stop()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        # Let cancelled tasks unwind before the loop is closed.
+        pending = asyncio.all_tasks(self.loop)
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+
+class _Cancelled(Exception):
+    """Raised inside a streaming worker once its consumer stopped listening."""
+
+
+def _stream_connector(
+    index: int,
+    connector: JobConnector,
+    query: str,
+    since: Optional[datetime],
+    events: "queue.Queue[tuple]",
+    cancelled: Set[int],
+) -> None:
+    def emit(job: JobListing) -> None:
+        if index in cancelled:
+            raise _Cancelled
+        events.put((index, job, None))
+
+    try:
+        _run_connector(connector, query, since, emit)
+    except _Cancelled:
+        return
+    except Exception as exc:  # noqa: BLE001 - reported by the consumer
+        events.put((index, None, exc))
+    else:
+        events.put((index, None, None))
+
+
+async def _stream_async(
+    index: int,
+    connector: JobConnector,
+    query: str,
+    since: Optional[datetime],
+    events: "queue.Queue[tuple]",
+    cancelled: Set[int],
+    timeout: Optional[float],
+) -> None:
+    def emit(job: JobListing) -> None:
+        if index in cancelled:
+            raise _Cancelled
+        events.put((index, job, None))
+
+    try:
+        await _run_async_connector(connector, query, since, emit, timeout=timeout)
+    except (_Cancelled, asyncio.TimeoutError):
+        # On a timeout the consumer has already stopped waiting for this index.
+        return
+    except Exception as exc:  # noqa: BLE001 - reported by the consumer
+        events.put((index, None, exc))
+    else:
+        events.put((index, None, None))
+
+
+class _RecentKeys:
+    """Set of the most recently added keys, capped at ``maxsize`` entries."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, key: str) -> bool:
+        """Record ``key`` and return ``True`` if it was not already present."""
+
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+        return True
 
 
-__all__ = ["JobAggregator"]
+__all__ = ["ConnectorOutcome", "JobAggregator"]
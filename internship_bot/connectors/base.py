@@ -1,23 +1,137 @@
 """Base classes and utilities for job source connectors."""
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import Iterable
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional
 
 from ..schemas import JobListing
+from .cache import CachedResponse, ResponseCache
+from .ratelimit import RateLimiter
 
 
 class JobConnector(ABC):
     """Abstract connector for fetching raw job listings from a provider."""
 
     provider_name: str
+    # Whether the provider honours If-None-Match / If-Modified-Since.
+    supports_revalidation: bool = True
 
-    def __init__(self, provider_name: str) -> None:
+    def __init__(
+        self,
+        provider_name: str,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         self.provider_name = provider_name
+        # Per-connector deadline (seconds) used by the concurrent aggregator.
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
 
     @abstractmethod
     def fetch_jobs(self, query: str) -> Iterable[JobListing]:
         """Return an iterable of normalized job listings for the query."""
 
+    def fetch_jobs_since(self, query: str, since: Optional[datetime]) -> Iterable[JobListing]:
+        """Return listings for the query, possibly stopping at ``since``.
+
+        ``since`` is the newest ``posted_at`` seen by the previous incremental
+        crawl.  Providers that return results newest-first may stop early once
+        they reach it; the default simply fetches everything.
+        """
+
+        return self.fetch_jobs(query)
+
+    def afetch_jobs(self, query: str, since: Optional[datetime] = None) -> AsyncIterator[JobListing]:
+        """Native async variant of :meth:`fetch_jobs_since`.
+
+        Connectors built on non-blocking I/O override this with an async
+        generator yielding listings as they arrive; the aggregator drives all
+        of them on one shared event loop, and a connector cut off at its
+        deadline keeps what it yielded.  Everything else runs on the
+        aggregator's thread pool via :meth:`fetch_jobs_since`.
+
+        This default is never called: the aggregator only uses
+        :meth:`afetch_jobs` when :attr:`is_async` reports an override.
+        """
+
+        raise NotImplementedError
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the connector provides a native :meth:`afetch_jobs`."""
+
+        return type(self).afetch_jobs is not JobConnector.afetch_jobs
+
+    def _get(
+        self,
+        session: Any,
+        url: str,
+        *,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10,
+    ) -> CachedResponse:
+        """Issue a GET through the response cache when one is configured."""
+
+        if self.cache is None:
+            response = self._send(session, url, params=params, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return CachedResponse.from_response(response)
+
+        key = self.cache.make_key(self.provider_name, query, url, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(self.provider_name, entry):
+            return entry
+
+        request_headers = dict(headers or {})
+        if entry is not None and self.supports_revalidation:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+        response = self._send(session, url, params=params, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key)
+            return entry
+        response.raise_for_status()
+        fresh = CachedResponse.from_response(response)
+        self.cache.put(key, self.provider_name, fresh)
+        return fresh
+
+    def _send(
+        self,
+        session: Any,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        timeout: float,
+    ) -> Any:
+        """Perform the HTTP GET, pacing and retrying through the rate limiter."""
+
+        limiter = self.rate_limiter
+        if limiter is None:
+            return session.get(url, params=params, headers=headers, timeout=timeout)
+        attempt = 0
+        while True:
+            limiter.acquire()
+            started = time.monotonic()
+            status: Optional[int] = None
+            retry_after: Optional[str] = None
+            try:
+                response = session.get(url, params=params, headers=headers, timeout=timeout)
+                status = response.status_code
+                retry_after = response.headers.get("Retry-After")
+            finally:
+                retry = limiter.release(status, time.monotonic() - started, retry_after, attempt)
+            if not retry:
+                return response
+            attempt += 1
+
 
 __all__ = ["JobConnector"]
@@ -0,0 +1,131 @@
+"""On-disk HTTP response cache shared by job connectors."""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from hashlib import sha1
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_CACHE_PATH = Path.home() / ".internship_bot" / "http_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    body TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """Body and validators of a provider response."""
+
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    @classmethod
+    def from_response(cls, response: Any) -> "CachedResponse":
+        return cls(
+            body=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=time.time(),
+        )
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """SQLite-backed response store with a per-provider TTL.
+
+    Entries younger than the provider's TTL are served without touching the
+    network.  Older entries are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` when the stored response carried validators.  Setting
+    ``refresh`` skips the TTL check so every request goes back to the provider.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        *,
+        default_ttl: float = 6 * 60 * 60,
+        ttls: Optional[Mapping[str, float]] = None,
+        refresh: bool = False,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def make_key(provider: str, query: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Return a stable key for a provider request."""
+
+        material = json.dumps(
+            [provider, query, url, sorted((str(k), str(v)) for k, v in (params or {}).items())]
+        )
+        return sha1(material.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, provider: str) -> float:
+        return self.ttls.get(provider, self.default_ttl)
+
+    def is_fresh(self, provider: str, entry: CachedResponse) -> bool:
+        if self.refresh:
+            return False
+        return time.time() - entry.fetched_at < self.ttl_for(provider)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(body=row[0], etag=row[1], last_modified=row[2], fetched_at=row[3])
+
+    def put(self, key: str, provider: str, entry: CachedResponse) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, body, etag, last_modified, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, entry.body, entry.etag, entry.last_modified, entry.fetched_at),
+            )
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly revalidated (HTTP 304)."""
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def clear(self, provider: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            if provider is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE provider = ?", (provider,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["CachedResponse", "DEFAULT_CACHE_PATH", "ResponseCache"]
@@ -2,37 +2,122 @@
 from __future__ import annotations
 
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Iterable, List
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..schemas import JobListing, JobRequirement
 from .base import JobConnector
+from .cache import ResponseCache
+from .ratelimit import RateLimiter
 
 
 class LinkedInConnector(JobConnector):
-    """Fetch internship listings from LinkedIn."""
+    """Fetch internship listings from LinkedIn.
 
-    def __init__(self, base_url: str | None = None) -> None:
-        super().__init__(provider_name="LinkedIn")
+    Results are paginated with ``start``/``count``.  Up to ``prefetch`` pages are
+    requested ahead of the consumer over a keep-alive connection pool, and
+    listings are yielded page by page until ``max_results`` is reached or the
+    API reports no further results.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        token: Optional[str] = None,
+        page_size: int = 25,
+        max_results: int = 250,
+        prefetch: int = 4,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        keep_raw: bool = False,
+    ) -> None:
+        super().__init__(
+            provider_name="LinkedIn", timeout=timeout, cache=cache, rate_limiter=rate_limiter
+        )
         self.base_url = base_url or "https://www.linkedin.com/voyager/api/jobSearch"
-        self.session = requests.Session()
-        self.token = os.getenv("LINKEDIN_API_TOKEN")
+        self.page_size = page_size
+        self.max_results = max_results
+        self.prefetch = max(prefetch, 1)
+        self.session = self._build_session(self.prefetch)
+        self.token = token or os.getenv("LINKEDIN_API_TOKEN")
+        # Raw API items are large; only keep them in ``metadata`` when asked.
+        self.keep_raw = keep_raw
+
+    @staticmethod
+    def _build_session(pool_size: int) -> requests.Session:
+        """Return a session whose pool keeps one warm connection per prefetch slot."""
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+        return session
 
     def fetch_jobs(self, query: str) -> Iterable[JobListing]:
-        params = {"keywords": query, "f_E": "2", "count": 25}
         if not self.token:
             return self._mock_jobs(query)
+        return self._iter_pages(query)
+
+    def fetch_jobs_since(self, query: str, since: Optional[datetime]) -> Iterable[JobListing]:
+        """Walk results newest-first and stop after the first page older than ``since``."""
+
+        if not self.token or since is None:
+            return self.fetch_jobs(query)
+        return self._iter_pages(query, since)
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/json",
-        }
-        response = self.session.get(self.base_url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        payload = response.json()
-        return [self._to_job_listing(item) for item in payload.get("elements", [])]
+    def _iter_pages(self, query: str, since: Optional[datetime] = None) -> Iterator[JobListing]:
+        window: Deque[Tuple[int, int, "Future[Tuple[List[dict], Optional[int]]]"]] = deque()
+        next_start = 0
+        limit = self.max_results
+        # The first page is fetched alone so ``paging.total`` can bound the prefetch.
+        depth = 1
+        with ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="linkedin-page") as pool:
+
+            def refill() -> None:
+                nonlocal next_start
+                while len(window) < depth and next_start < limit:
+                    count = min(self.page_size, limit - next_start)
+                    future = pool.submit(self._fetch_page, query, next_start, count, since is not None)
+                    window.append((next_start, count, future))
+                    next_start += count
+
+            refill()
+            try:
+                while window:
+                    start, count, future = window.popleft()
+                    elements, total = future.result()
+                    page = [self._to_job_listing(item) for item in elements[:count]]
+                    yield from page
+                    if len(elements) < count or (total is not None and start + count >= total):
+                        break
+                    if since is not None and all(job.posted_at and job.posted_at <= since for job in page):
+                        break
+                    if total is not None:
+                        limit = min(limit, total)
+                    depth = self.prefetch
+                    refill()
+            finally:
+                for _, _, pending in window:
+                    pending.cancel()
+
+    def _fetch_page(
+        self, query: str, start: int, count: int, newest_first: bool = False
+    ) -> Tuple[List[dict], Optional[int]]:
+        params = {"keywords": query, "f_E": "2", "start": start, "count": count}
+        if newest_first:
+            params["sortBy"] = "DD"
+        headers = {"Authorization": f"Bearer {self.token}"}
+        payload = self._get(self.session, self.base_url, query=query, params=params, headers=headers).json()
+        total = (payload.get("paging") or {}).get("total")
+        return payload.get("elements", []), total
 
     def _mock_jobs(self, query: str) -> List[JobListing]:
         requirements = [
@@ -66,9 +151,18 @@ class LinkedInConnector(JobConnector):
             requirements=[],
             technologies=[],
             apply_url=item.get("applyMethod", {}).get("companyApplyUrl"),
-            posted_at=None,
-            metadata=item,
+            posted_at=_listed_at(item),
+            metadata=item if self.keep_raw else {},
         )
 
 
+def _listed_at(item: dict) -> Optional[datetime]:
+    """Convert LinkedIn's ``listedAt`` epoch milliseconds to a naive UTC datetime."""
+
+    listed_at = item.get("listedAt")
+    if not isinstance(listed_at, (int, float)):
+        return None
+    return datetime.utcfromtimestamp(listed_at / 1000)
+
+
 __all__ = ["LinkedInConnector"]
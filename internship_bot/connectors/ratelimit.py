@@ -0,0 +1,149 @@
+"""Token-bucket rate limiting with adaptive concurrency for connectors."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class LimiterStats:
+    """Counters describing how a connector spent its time.
+
+    Durations are summed over every calling thread.
+    """
+
+    requests: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    request_seconds: float = 0.0
+
+    @property
+    def wait_ratio(self) -> float:
+        """Share of total time spent blocked on the limiter."""
+
+        total = self.wait_seconds + self.request_seconds
+        return self.wait_seconds / total if total else 0.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Return the delay in seconds requested by a ``Retry-After`` header."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = now if now is not None else time.time()
+    return max(when.timestamp() - current, 0.0)
+
+
+class RateLimiter:
+    """Token bucket plus an AIMD concurrency window for one provider.
+
+    Requests take a token (refilled at ``rate`` per second up to ``burst``) and
+    an in-flight slot.  A 429 or 5xx halves both the rate and the window and
+    blocks every caller until ``Retry-After`` (or an exponential backoff)
+    elapses; each success grows them back additively up to their maximums.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 5,
+        max_concurrency: int = 4,
+        *,
+        min_rate: float = 0.2,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.stats = LimiterStats()
+        self._rate = rate
+        self._window = float(max_concurrency)
+        self._tokens = float(burst)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._refilled_at = time.monotonic()
+        self._cond = threading.Condition()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def concurrency(self) -> int:
+        return max(int(self._window), 1)
+
+    def acquire(self) -> None:
+        """Block until a token and an in-flight slot are available."""
+
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay: Optional[float] = self._blocked_until - now
+                elif self._in_flight >= self.concurrency:
+                    delay = None  # woken by release()
+                elif self._tokens < 1:
+                    delay = (1 - self._tokens) / self._rate
+                else:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    break
+                self._cond.wait(timeout=delay)
+            self.stats.wait_seconds += time.monotonic() - started
+
+    def release(
+        self,
+        status: Optional[int],
+        elapsed: float,
+        retry_after: Optional[str] = None,
+        attempt: int = 0,
+    ) -> bool:
+        """Record a finished request and return whether it should be retried."""
+
+        with self._cond:
+            self._in_flight -= 1
+            self.stats.requests += 1
+            self.stats.request_seconds += elapsed
+            retry = status in RETRYABLE_STATUSES
+            if retry:
+                self.stats.throttled += 1
+                self._rate = max(self._rate / 2, self.min_rate)
+                self._window = max(self._window / 2, 1.0)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = self.backoff_factor * (2**attempt)
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                self._tokens = min(self._tokens, 0.0)
+            elif status is not None:
+                self._rate = min(self._rate + self.max_rate / 10, self.max_rate)
+                self._window = min(self._window + 1 / self._window, float(self.max_concurrency))
+            self._cond.notify_all()
+        return retry and attempt < self.max_retries
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._tokens + (now - self._refilled_at) * self._rate, float(self.burst))
+        self._refilled_at = now
+
+
+__all__ = ["LimiterStats", "RETRYABLE_STATUSES", "RateLimiter", "parse_retry_after"]
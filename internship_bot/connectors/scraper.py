@@ -1,52 +1,174 @@
 """Custom HTML scraper for job boards without APIs."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable, List, Sequence
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import sha1
+from typing import Callable, Iterable, List, Optional, Sequence
 
 import bs4
+import requests
+import soupsieve
 
 from ..schemas import JobListing, JobRequirement
 from .base import JobConnector
+from .cache import ResponseCache
+from .ratelimit import RateLimiter
+
+try:  # pragma: no cover - optional dependency guard
+    import lxml  # noqa: F401
+
+    PARSER_BACKEND = "lxml"
+except Exception:  # pragma: no cover - fall back to the stdlib parser
+    PARSER_BACKEND = "html.parser"
+
+_SIMPLE_CLASS = re.compile(r"^\.([\w-]+)$")
+
+
+@dataclass(frozen=True)
+class SelectorSpec:
+    """CSS selectors describing where job fields live inside a page."""
+
+    card: str = ".job-card"
+    title: str = ".job-title"
+    company: str = ".company"
+    location: str = ".location"
+    description: str = ".description"
+    apply_link: str = "a.apply"
+    requirements: str = ".requirements li"
+
+
+class _CompiledSpec:
+    """Soupsieve patterns for a :class:`SelectorSpec`, compiled once per process."""
+
+    def __init__(self, spec: SelectorSpec) -> None:
+        self.card = soupsieve.compile(spec.card)
+        self.title = soupsieve.compile(spec.title)
+        self.company = soupsieve.compile(spec.company)
+        self.location = soupsieve.compile(spec.location)
+        self.description = soupsieve.compile(spec.description)
+        self.apply_link = soupsieve.compile(spec.apply_link)
+        self.requirements = soupsieve.compile(spec.requirements)
+        # Only build the card subtrees when the card selector is a bare class.
+        match = _SIMPLE_CLASS.match(spec.card)
+        self.strainer = bs4.SoupStrainer(class_=_has_class(match.group(1))) if match else None
+
+
+def _has_class(name: str) -> Callable[[Optional[str]], bool]:
+    # A plain string only matches the whole attribute value, which drops
+    # cards such as ``class="job-card featured"``; compare single classes.
+    def matches(value: Optional[str]) -> bool:
+        return value is not None and name in value.split()
+
+    return matches
+
+
+@lru_cache(maxsize=None)
+def _compile(spec: SelectorSpec) -> _CompiledSpec:
+    return _CompiledSpec(spec)
+
+
+def content_id(provider: str, *parts: Optional[str]) -> str:
+    """Return a listing ID derived from its content rather than its position."""
+
+    digest = sha1("\x1f".join([provider, *(part or "" for part in parts)]).encode("utf-8"))
+    return f"{provider}-{digest.hexdigest()[:16]}"
+
+
+def parse_page(provider: str, html: str, spec: SelectorSpec = SelectorSpec()) -> List[JobListing]:
+    """Extract every job card from one HTML page."""
+
+    compiled = _compile(spec)
+    soup = bs4.BeautifulSoup(html, PARSER_BACKEND, parse_only=compiled.strainer)
+    listings: List[JobListing] = []
+    for card in compiled.card.select(soup):
+        title = compiled.title.select_one(card)
+        company = compiled.company.select_one(card)
+        description = compiled.description.select_one(card)
+        apply_link = compiled.apply_link.select_one(card)
+        location = compiled.location.select_one(card)
+        requirements = [
+            JobRequirement(skill=req.get_text(strip=True).lower())
+            for req in compiled.requirements.select(card)
+        ]
+        company_text = company.get_text(strip=True) if company else "Unknown"
+        role_text = title.get_text(strip=True) if title else "Intern"
+        location_text = location.get_text(strip=True) if location else None
+        description_text = description.get_text(strip=True) if description else ""
+        apply_url = apply_link["href"] if apply_link else None
+        listings.append(
+            JobListing(
+                provider=provider,
+                id=content_id(provider, company_text, role_text, location_text, apply_url, description_text),
+                company=company_text,
+                role=role_text,
+                location=location_text,
+                description=description_text,
+                requirements=requirements,
+                technologies=[req.skill for req in requirements],
+                apply_url=apply_url,
+                # Pages carry no posting date; the scrape time is not one.
+                posted_at=None,
+                metadata={"scraped": True},
+            )
+        )
+    return listings
 
 
 class CustomHTMLScraper(JobConnector):
-    """Scrape job listings from arbitrary HTML sources."""
+    """Scrape job listings from arbitrary HTML sources.
+
+    ``html_pages`` may hold raw HTML or ``http(s)://`` URLs; URLs are fetched
+    through the connector's response cache when one is configured.  With
+    ``workers > 1`` pages are parsed on a process pool.
+    """
 
-    def __init__(self, provider_name: str, html_pages: Sequence[str]) -> None:
-        super().__init__(provider_name=provider_name)
+    def __init__(
+        self,
+        provider_name: str,
+        html_pages: Sequence[str],
+        *,
+        selectors: SelectorSpec = SelectorSpec(),
+        workers: int = 1,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        super().__init__(
+            provider_name=provider_name, timeout=timeout, cache=cache, rate_limiter=rate_limiter
+        )
         self.html_pages = html_pages
+        self.selectors = selectors
+        self.workers = workers
+        self._session: Optional[requests.Session] = None
 
     def fetch_jobs(self, query: str) -> Iterable[JobListing]:
-        listings: List[JobListing] = []
-        for index, html in enumerate(self.html_pages):
-            soup = bs4.BeautifulSoup(html, "html.parser")
-            for card in soup.select(".job-card"):
-                title = card.select_one(".job-title")
-                company = card.select_one(".company")
-                description = card.select_one(".description")
-                apply_link = card.select_one("a.apply")
-                location = card.select_one(".location")
-                requirements = [
-                    JobRequirement(skill=req.get_text(strip=True).lower())
-                    for req in card.select(".requirements li")
-                ]
-                listings.append(
-                    JobListing(
-                        provider=self.provider_name,
-                        id=f"{self.provider_name}-{index}-{len(listings)}",
-                        company=company.get_text(strip=True) if company else "Unknown",
-                        role=(title.get_text(strip=True) if title else "Intern"),
-                        location=location.get_text(strip=True) if location else None,
-                        description=description.get_text(strip=True) if description else "",
-                        requirements=requirements,
-                        technologies=[req.skill for req in requirements],
-                        apply_url=apply_link["href"] if apply_link else None,
-                        posted_at=datetime.utcnow(),
-                        metadata={"scraped": True},
-                    )
-                )
-        return listings
-
-
-__all__ = ["CustomHTMLScraper"]
+        pages = [self._load_page(page, query) for page in self.html_pages]
+        if self.workers <= 1 or len(pages) <= 1:
+            batches: Iterable[List[JobListing]] = (
+                parse_page(self.provider_name, html, self.selectors) for html in pages
+            )
+            return [job for batch in batches for job in batch]
+
+        chunksize = max(len(pages) // (self.workers * 4), 1)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            batches = pool.map(
+                parse_page,
+                [self.provider_name] * len(pages),
+                pages,
+                [self.selectors] * len(pages),
+                chunksize=chunksize,
+            )
+            return [job for batch in batches for job in batch]
+
+    def _load_page(self, page: str, query: str) -> str:
+        if not page.lstrip().startswith(("http://", "https://")):
+            return page
+        if self._session is None:
+            self._session = requests.Session()
+        return self._get(self._session, page.strip(), query=query).body
+
+
+__all__ = ["CustomHTMLScraper", "PARSER_BACKEND", "SelectorSpec", "content_id", "parse_page"]
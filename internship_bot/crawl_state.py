@@ -0,0 +1,156 @@
+"""Persistent crawl state used for incremental aggregation."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+from hashlib import sha1
+from pathlib import Path
+from typing import Container, Dict, Iterable, Iterator, Optional
+
+from .schemas import JobListing
+
+DEFAULT_STATE_PATH = Path.home() / ".internship_bot" / "crawl_state.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS watermarks (
+        provider TEXT NOT NULL,
+        query TEXT NOT NULL,
+        newest_posted_at TEXT,
+        PRIMARY KEY (provider, query)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS seen (
+        provider TEXT NOT NULL,
+        query TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        PRIMARY KEY (provider, query, job_id)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def fingerprint(job: JobListing) -> str:
+    """Hash the fields whose change should make a listing count as updated.
+
+    ``posted_at`` is left out: several providers only report when the listing
+    was fetched, which would make every listing look updated on every run.
+    """
+
+    parts = [
+        job.company,
+        job.role,
+        job.location or "",
+        job.description,
+        job.apply_url or "",
+        "|".join(sorted(req.skill for req in job.requirements)),
+        "|".join(sorted(job.technologies)),
+    ]
+    return sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class CrawlState:
+    """Record, per provider and query, the newest ``posted_at`` and the seen IDs."""
+
+    def __init__(self, path: str | Path = DEFAULT_STATE_PATH, *, commit_every: int = 500) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_every = commit_every
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def high_water_mark(self, provider: str, query: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_posted_at FROM watermarks WHERE provider = ? AND query = ?",
+                (provider, query),
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromisoformat(row[0])
+
+    def filter_changed(
+        self, query: str, jobs: Iterable[JobListing], complete: Optional[Container[str]] = None
+    ) -> Iterator[JobListing]:
+        """Yield only listings that are new or changed since the last run.
+
+        Each yielded listing is recorded as seen; writes are committed every
+        ``commit_every`` listings and when the iterator is exhausted or closed.
+
+        High-water marks only move once ``jobs`` has been exhausted, and then
+        only for providers in ``complete`` (when given; it is read after
+        exhaustion).  A provider cut short by a deadline, an error or a consumer
+        that stopped early keeps its old mark, so the next run fetches the
+        pages it missed.
+        """
+
+        newest: Dict[str, datetime] = {}
+        pending = 0
+        exhausted = False
+        try:
+            for job in jobs:
+                if job.posted_at and (job.provider not in newest or job.posted_at > newest[job.provider]):
+                    newest[job.provider] = job.posted_at
+                digest = fingerprint(job)
+                with self._lock:
+                    row = self._conn.execute(
+                        "SELECT fingerprint FROM seen WHERE provider = ? AND query = ? AND job_id = ?",
+                        (job.provider, query, job.id),
+                    ).fetchone()
+                    if row is not None and row[0] == digest:
+                        continue
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO seen (provider, query, job_id, fingerprint) VALUES (?, ?, ?, ?)",
+                        (job.provider, query, job.id, digest),
+                    )
+                    pending += 1
+                    if pending >= self.commit_every:
+                        self._conn.commit()
+                        pending = 0
+                yield job
+            exhausted = True
+        finally:
+            with self._lock:
+                if exhausted:
+                    for provider, posted_at in newest.items():
+                        if complete is None or provider in complete:
+                            self._advance_watermark(provider, query, posted_at)
+                self._conn.commit()
+
+    def _advance_watermark(self, provider: str, query: str, posted_at: datetime) -> None:
+        row = self._conn.execute(
+            "SELECT newest_posted_at FROM watermarks WHERE provider = ? AND query = ?",
+            (provider, query),
+        ).fetchone()
+        if row is not None and row[0] is not None and datetime.fromisoformat(row[0]) >= posted_at:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO watermarks (provider, query, newest_posted_at) VALUES (?, ?, ?)",
+            (provider, query, posted_at.isoformat()),
+        )
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Forget crawl history, for one provider or for all of them."""
+
+        with self._lock, self._conn:
+            if provider is None:
+                self._conn.execute("DELETE FROM watermarks")
+                self._conn.execute("DELETE FROM seen")
+            else:
+                self._conn.execute("DELETE FROM watermarks WHERE provider = ?", (provider,))
+                self._conn.execute("DELETE FROM seen WHERE provider = ?", (provider,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["CrawlState", "DEFAULT_STATE_PATH", "fingerprint"]
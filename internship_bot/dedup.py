@@ -0,0 +1,239 @@
+"""Cross-provider near-duplicate detection for job listings."""
+from __future__ import annotations
+
+import random
+import re
+import zlib
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .schemas import JobListing, JobRequirement
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except Exception:  # pragma: no cover - fall back to the pure Python signature
+    np = None
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_UINT64_MASK = (1 << 64) - 1
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "gmbh", "plc"}
+
+
+def normalize_text(value: Optional[str]) -> List[str]:
+    """Lower-case ``value`` and split it into alphanumeric tokens."""
+
+    return _TOKEN_RE.findall(value.lower()) if value else []
+
+
+def shingles(job: JobListing, size: int = 3) -> Set[str]:
+    """Return the shingle set used to compare two listings.
+
+    Company, role and location contribute tagged whole-field and token shingles
+    so that two postings of the same role at the same employer stay close even
+    when their descriptions are short; the description contributes word
+    ``size``-grams.
+    """
+
+    company = _company_tokens(job)
+    role = normalize_text(job.role)
+    location = normalize_text(job.location)
+    description = normalize_text(job.description)
+
+    result: Set[str] = {"c:" + " ".join(company), "r:" + " ".join(role)}
+    result.update("r:" + tok for tok in role)
+    result.update("l:" + tok for tok in location)
+    if len(description) < size:
+        result.update("d:" + tok for tok in description)
+    else:
+        result.update(
+            "d:" + " ".join(description[i : i + size]) for i in range(len(description) - size + 1)
+        )
+    return result
+
+
+def _company_tokens(job: JobListing) -> List[str]:
+    return [tok for tok in normalize_text(job.company) if tok not in _COMPANY_SUFFIXES]
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH S-curve midpoint is closest to ``threshold``."""
+
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateDetector:
+    """Find and merge near-duplicate listings with MinHash signatures and LSH.
+
+    Each listing is reduced to a ``num_perm``-entry MinHash signature over its
+    shingles.  Signatures are split into bands; listings that share a band bucket
+    become candidates and are merged when their estimated Jaccard similarity
+    reaches ``threshold``.  Work per listing is constant, so the whole pass stays
+    close to linear in the number of listings.
+
+    Only postings from different providers are merged, and only when their
+    normalized company names match and their normalized locations match or one
+    of them has none: a provider listing the same role in two cities is
+    publishing two openings, however similar the text.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ) -> None:
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        rng = random.Random(seed)
+        # h(x) = ((a * x + b) mod 2**64) mod p; the 64-bit wrap matches uint64
+        # arithmetic so both signature paths agree bit for bit.
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+    def signature(self, job: JobListing) -> array:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(job, self.shingle_size)]
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            mins = ((self._a_np * values + self._b_np) % np.uint64(_MERSENNE_PRIME)).min(axis=1)
+            return array("Q", mins.tolist())
+        return array(
+            "Q",
+            (
+                min(((a * x + b) & _UINT64_MASK) % _MERSENNE_PRIME for x in hashes)
+                for a, b in zip(self._a, self._b)
+            ),
+        )
+
+    def merge(self, jobs: Iterable[JobListing]) -> List[JobListing]:
+        """Collapse near-duplicates, keeping the first listing of each group."""
+
+        index = _LSHIndex(self)
+        return [job for job in jobs if index.observe(job) is None]
+
+    def filter_stream(self, jobs: Iterable[JobListing]) -> Iterator[JobListing]:
+        """Streaming variant of :meth:`merge`.
+
+        Duplicates that arrive after their canonical listing was yielded are
+        folded into it in place, so its provenance keeps growing.
+        """
+
+        index = _LSHIndex(self)
+        for job in jobs:
+            if index.observe(job) is None:
+                yield job
+
+
+class _LSHIndex:
+    """Band buckets and signatures for one dedup pass."""
+
+    def __init__(self, detector: NearDuplicateDetector) -> None:
+        self.detector = detector
+        self.buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(detector.bands)]
+        self.signatures: List[array] = []
+        self.canonicals: List[JobListing] = []
+        self.blocks: List[Tuple[str, str]] = []
+
+    def observe(self, job: JobListing) -> Optional[JobListing]:
+        """Register ``job``; return its canonical listing if it is a duplicate."""
+
+        detector = self.detector
+        signature = detector.signature(job)
+        raw = signature.tobytes()
+        width = detector.rows * signature.itemsize
+        keys = [hash(raw[band * width : (band + 1) * width]) for band in range(detector.bands)]
+
+        candidates: Set[int] = set()
+        for band, key in enumerate(keys):
+            candidates.update(self.buckets[band].get(key, ()))
+        company, location = block = _block(job)
+        best: Optional[int] = None
+        best_similarity = detector.threshold
+        for candidate in sorted(candidates):
+            other_company, other_location = self.blocks[candidate]
+            if other_company != company or (location and other_location and other_location != location):
+                continue
+            if job.provider in _providers(self.canonicals[candidate]):
+                continue
+            other = self.signatures[candidate]
+            similarity = sum(x == y for x, y in zip(signature, other)) / detector.num_perm
+            if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                best, best_similarity = candidate, similarity
+        if best is not None:
+            canonical = self.canonicals[best]
+            _fold_into(canonical, job)
+            self.blocks[best] = _block(canonical)
+            return canonical
+
+        position = len(self.canonicals)
+        self.signatures.append(signature)
+        self.canonicals.append(job)
+        self.blocks.append(block)
+        for band, key in enumerate(keys):
+            self.buckets[band][key].append(position)
+        return None
+
+
+def _block(job: JobListing) -> Tuple[str, str]:
+    """Return the normalized (company, location) a duplicate must agree on."""
+
+    return " ".join(_company_tokens(job)), " ".join(normalize_text(job.location))
+
+
+def _providers(canonical: JobListing) -> List[str]:
+    return list(canonical.metadata.get("providers") or [canonical.provider])
+
+
+def _fold_into(canonical: JobListing, duplicate: JobListing) -> None:
+    """Record ``duplicate``'s provenance on ``canonical`` and fill its gaps."""
+
+    metadata = dict(canonical.metadata)
+    providers = _providers(canonical)
+    if duplicate.provider not in providers:
+        providers.append(duplicate.provider)
+    metadata["providers"] = providers
+    metadata["duplicates"] = list(metadata.get("duplicates") or []) + [
+        f"{duplicate.provider}:{duplicate.id}"
+    ]
+    canonical.metadata = metadata
+
+    canonical.apply_url = canonical.apply_url or duplicate.apply_url
+    canonical.location = canonical.location or duplicate.location
+    if duplicate.posted_at and (not canonical.posted_at or duplicate.posted_at > canonical.posted_at):
+        canonical.posted_at = duplicate.posted_at
+    canonical.technologies = _union(canonical.technologies, duplicate.technologies)
+    known = {req.skill.lower() for req in canonical.requirements}
+    extra: Sequence[JobRequirement] = [
+        req for req in duplicate.requirements if req.skill.lower() not in known
+    ]
+    if extra:
+        canonical.requirements = list(canonical.requirements) + list(extra)
+
+
+def _union(first: Sequence[str], second: Sequence[str]) -> List[str]:
+    seen = {value.lower() for value in first}
+    merged = list(first)
+    for value in second:
+        if value.lower() not in seen:
+            seen.add(value.lower())
+            merged.append(value)
+    return merged
+
+
+__all__ = ["NearDuplicateDetector", "normalize_text", "shingles"]
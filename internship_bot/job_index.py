@@ -0,0 +1,224 @@
+"""Persistent inverted index used to prune jobs that cannot score highly."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from hashlib import sha1
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .schemas import JobListing
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except Exception:  # pragma: no cover - gracefully degrade when dependency missing
+    np = None
+
+DEFAULT_INDEX_PATH = Path.home() / ".internship_bot" / "job_index.sqlite3"
+
+# Posting kinds.  Skills and locations are indexed as whole lower-cased values,
+# role and description as lower-cased whitespace-delimited terms.
+SKILL, LOCATION, ROLE, DESCRIPTION = range(4)
+
+_SKILL = attrgetter("skill")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        doc INTEGER PRIMARY KEY,
+        job_key TEXT NOT NULL UNIQUE,
+        fingerprint TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS postings (
+        kind INTEGER NOT NULL,
+        term TEXT NOT NULL,
+        docs BLOB NOT NULL,
+        PRIMARY KEY (kind, term)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def job_key(job: JobListing) -> str:
+    return f"{job.provider}:{job.id}"
+
+
+def _snapshot(job: JobListing) -> tuple:
+    # The fields postings are built from; see JobIndex.doc_id.
+    return (
+        job.role,
+        job.location,
+        job.description,
+        tuple(job.technologies),
+        tuple(map(_SKILL, job.requirements)),
+    )
+
+
+def _digest(snapshot: tuple) -> str:
+    """Hash a :func:`_snapshot`; other fields never change the postings."""
+
+    role, location, description, technologies, skills = snapshot
+    parts = [role, location or "", description, "|".join(sorted(technologies)), "|".join(sorted(skills))]
+    return sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _terms(job: JobListing) -> Iterable[Tuple[int, str]]:
+    for skill in {req.skill.lower() for req in job.requirements} | {t.lower() for t in job.technologies}:
+        yield SKILL, skill
+    if job.location:
+        yield LOCATION, job.location.lower()
+    for term in set(job.role_lower.split()):
+        yield ROLE, term
+    for term in set(job.description_lower.split()):
+        yield DESCRIPTION, term
+
+
+class JobIndex:
+    """Map skills, locations and role/description terms to the jobs containing them.
+
+    Each listing gets a dense document number; posting lists are stored per
+    ``(kind, term)`` as packed int64 document numbers.  Postings are append
+    only: when a listing changes, its new terms are added and its old ones
+    stay, which can only loosen the upper bounds computed from the index, so
+    pruning stays safe; a document is never appended to a posting list that
+    already holds it.  Listings whose indexed fields (role, location,
+    description, technologies and requirement skills) are unchanged are
+    skipped by :meth:`add`.  A listing edited after it was added has no
+    document until it is added again, see :meth:`doc_id`.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX_PATH) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for JobIndex. Install via 'pip install numpy'.")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            # job_key -> (doc, fingerprint of the indexed content)
+            self._docs: Dict[str, Tuple[int, str]] = {
+                key: (doc, digest)
+                for key, doc, digest in self._conn.execute("SELECT job_key, doc, fingerprint FROM jobs")
+            }
+        # job_key -> _snapshot() of the listing last found to match its digest.
+        self._verified: Dict[str, tuple] = {}
+        # Number of document slots, i.e. the length of arrays returned by mask().
+        self.size = max((doc for doc, _ in self._docs.values()), default=-1) + 1
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def doc_id(self, job: JobListing) -> Optional[int]:
+        """Document number of ``job``, or ``None`` if it is not indexed as it is now.
+
+        A listing changed since it was last added may have terms its postings
+        lack, so it has no document until it is added again.  Fields are first
+        compared with those of the listing last verified under the same key;
+        the digest is only computed when one differs.
+        """
+
+        key = job_key(job)
+        entry = self._docs.get(key)
+        if entry is None:
+            return None
+        snapshot = _snapshot(job)
+        if self._verified.get(key) != snapshot:
+            if _digest(snapshot) != entry[1]:
+                return None
+            self._verified[key] = snapshot
+        return entry[0]
+
+    def add(self, jobs: Iterable[JobListing]) -> int:
+        """Index new or changed listings and return how many were written."""
+
+        pending: Dict[Tuple[int, str], List[int]] = {}
+        with self._lock, self._conn:
+            written = 0
+            for job in jobs:
+                key = job_key(job)
+                snapshot = _snapshot(job)
+                entry = self._docs.get(key)
+                if entry is not None and self._verified.get(key) == snapshot:
+                    continue
+                digest = _digest(snapshot)
+                self._verified[key] = snapshot
+                if entry is None:
+                    doc = self._conn.execute(
+                        "INSERT INTO jobs (job_key, fingerprint) VALUES (?, ?)", (key, digest)
+                    ).lastrowid
+                    self.size = max(self.size, doc + 1)
+                elif entry[1] == digest:
+                    continue
+                else:
+                    doc = entry[0]
+                    self._conn.execute("UPDATE jobs SET fingerprint = ? WHERE doc = ?", (digest, doc))
+                self._docs[key] = (doc, digest)
+                for posting in _terms(job):
+                    pending.setdefault(posting, []).append(doc)
+                written += 1
+            for (kind, term), docs in pending.items():
+                row = self._conn.execute(
+                    "SELECT docs FROM postings WHERE kind = ? AND term = ?", (kind, term)
+                ).fetchone()
+                added = np.array(list(dict.fromkeys(docs)), dtype=np.int64)
+                if row:
+                    added = added[~np.isin(added, np.frombuffer(row[0], dtype=np.int64))]
+                    if not added.size:
+                        continue
+                packed = added.tobytes()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO postings (kind, term, docs) VALUES (?, ?, ?)",
+                    (kind, term, (row[0] + packed) if row else packed),
+                )
+        return written
+
+    def lookup(self, kind: int, term: str, *, substring: bool = False) -> "np.ndarray":
+        """Return the sorted documents containing ``term``.
+
+        With ``substring=True`` every indexed term of ``kind`` that contains
+        ``term`` matches, mirroring the ``in`` tests used by :class:`Ranker`.
+        """
+
+        term = term.lower()
+        with self._lock:
+            if substring:
+                rows = self._conn.execute(
+                    "SELECT docs FROM postings WHERE kind = ? AND instr(term, ?) > 0", (kind, term)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT docs FROM postings WHERE kind = ? AND term = ?", (kind, term)
+                ).fetchall()
+        if not rows:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate([np.frombuffer(row[0], dtype=np.int64) for row in rows]))
+
+    def mask(self, kind: int, terms: Iterable[str], *, substring: bool = False) -> "np.ndarray":
+        """Boolean array over documents containing any of ``terms``."""
+
+        hit = np.zeros(self.size, dtype=bool)
+        for term in terms:
+            hit[self.lookup(kind, term, substring=substring)] = True
+        return hit
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs")
+            self._conn.execute("DELETE FROM postings")
+            self._docs.clear()
+            self._verified.clear()
+            self.size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["DESCRIPTION", "DEFAULT_INDEX_PATH", "JobIndex", "LOCATION", "ROLE", "SKILL", "job_key"]
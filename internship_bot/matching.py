@@ -0,0 +1,26 @@
+"""Case-insensitive multi-substring matching for resume terms."""
+from __future__ import annotations
+
+from typing import Iterable, List, Set, Tuple
+
+
+class PatternMatcher:
+    """Report which of a fixed set of substrings occur in a text.
+
+    Patterns are lower-cased and de-duplicated once, so a term listed both as a
+    role keyword and as an interest is searched for a single time per text.
+    :meth:`find` expects text that is already lower-cased and returns the
+    lower-cased patterns it contains.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: List[str] = list(patterns)
+        # ``lowered[i]`` is ``patterns[i].lower()``; ``needles`` drops repeats.
+        self.lowered: Tuple[str, ...] = tuple(pattern.lower() for pattern in self.patterns)
+        self.needles: Tuple[str, ...] = tuple(dict.fromkeys(self.lowered))
+
+    def find(self, text: str) -> Set[str]:
+        return {needle for needle in self.needles if needle in text}
+
+
+__all__ = ["PatternMatcher"]
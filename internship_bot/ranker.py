@@ -1,77 +1,973 @@
 """Ranking heuristics for internship listings."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import bisect
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from math import exp
-from typing import Iterable, List, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+from .job_index import DESCRIPTION, LOCATION, ROLE, SKILL, JobIndex, job_key
+from .matching import PatternMatcher
+from .relevance import RelevanceIndex
 from .schemas import JobListing, ResumeProfile
+from .table import NO_DATE, JobTable, to_epoch_us
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except Exception:  # pragma: no cover - vectorized scoring unavailable
+    np = None
+
+_DAY_US = 86_400_000_000
+
+
+class ScoreComponent(NamedTuple):
+    """One additive part of a job's score.
+
+    ``component`` is one of ``"skills"``, ``"role_keyword"``, ``"location"``,
+    ``"interest"``, ``"relevance"`` or ``"recency"``.  ``detail`` holds the matched skills
+    (sorted), the matched keyword or interest, or the job's location.  A
+    tuple rather than a dataclass: records holding only strings and numbers
+    are untracked by the cyclic garbage collector, which matters when every
+    ranked job carries several of them.
+    """
+
+    component: str
+    points: float
+    detail: Union[str, Tuple[str, ...], None] = None
+
+    def describe(self) -> str:
+        kind = self.component
+        if kind == "skills":
+            return f"{len(self.detail)} skill matches (+{self.points})"
+        if kind == "role_keyword":
+            return f"Role keyword '{self.detail}' (+{self.points})"
+        if kind == "location":
+            return f"Preferred location match (+{self.points})"
+        if kind == "interest":
+            return f"Interest '{self.detail}' (+{self.points})"
+        if kind == "relevance":
+            return f"Text relevance (+{self.points:.2f})"
+        return "Recency bonus applied"
+
+    def as_dict(self) -> Dict[str, Any]:
+        detail = list(self.detail) if isinstance(self.detail, tuple) else self.detail
+        return {"component": self.component, "points": self.points, "detail": detail}
 
 
 @dataclass
 class RankedJob:
     job: JobListing
     score: float
-    explanation: str
+    # Produces the score components on first access; shared by every job of
+    # one ranking call so bulk ranking allocates nothing per job for them.
+    explainer: Optional[Callable[[JobListing], List[ScoreComponent]]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_components(
+        cls, job: JobListing, score: float, components: List[ScoreComponent]
+    ) -> "RankedJob":
+        ranked = cls(job=job, score=score)
+        ranked.__dict__["components"] = components
+        return ranked
+
+    @cached_property
+    def components(self) -> List[ScoreComponent]:
+        return self.explainer(self.job) if self.explainer is not None else []
+
+    @property
+    def explanation(self) -> str:
+        """Human-readable explanation, formatted from ``components`` on access."""
+
+        return "; ".join(component.describe() for component in self.components)
+
+    @property
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """Machine-readable score components for the UI and API."""
+
+        return [component.as_dict() for component in self.components]
+
+
+class _Explainer:
+    """Recompute a job's score components exactly as one ranking call scored it."""
+
+    def __init__(
+        self,
+        ranker: "Ranker",
+        resume: ResumeProfile,
+        compiled: "_CompiledResume",
+        now: datetime,
+        relevance: Optional[Callable[[JobListing], float]] = None,
+    ) -> None:
+        self.ranker = ranker
+        self.resume = resume
+        self.compiled = compiled
+        self.now = now
+        self.relevance = relevance
+
+    def __call__(self, job: JobListing) -> List[ScoreComponent]:
+        components: List[ScoreComponent] = []
+        self.ranker._score(job, self.resume, self.compiled, self.now, components, self.relevance)
+        return components
+
+
+@dataclass
+class _TableScores:
+    """Per-row score components computed for a :class:`JobTable`."""
+
+    skill_matches: "np.ndarray"
+    keyword_hits: "np.ndarray"  # (rows, keywords) bool
+    location_hit: "np.ndarray"
+    interest_index: "np.ndarray"  # index of the first matching interest, -1 if none
+    relevance: "np.ndarray"
+    recency: "np.ndarray"
+    total: "np.ndarray"
+
+
+class _CompiledResume:
+    """Resume fields prepared once for scoring many jobs.
+
+    ``terms`` matches the role keywords and the interests together, so each
+    description is searched once for both; ``keywords`` alone is used for
+    the role.
+    """
+
+    def __init__(self, resume: ResumeProfile) -> None:
+        self.key = _resume_key(resume)
+        self.skills = frozenset(resume.normalized_skills())
+        self.locations = tuple(loc.lower() for loc in resume.preferred_locations)
+        self.keywords = PatternMatcher(resume.target_role_keywords)
+        self.interests = PatternMatcher(resume.interests)
+        self.terms = PatternMatcher([*resume.target_role_keywords, *resume.interests])
+        # Query for the BM25 relevance component.
+        self.profile_terms = (*resume.skills, *resume.interests)
+
+
+def _resume_key(resume: ResumeProfile) -> Tuple[Tuple[str, ...], ...]:
+    return (
+        tuple(resume.skills),
+        tuple(resume.preferred_locations),
+        tuple(resume.target_role_keywords),
+        tuple(resume.interests),
+    )
+
+
+class _BatchFeatures:
+    """Job x term hit matrices and resume x term weights for :meth:`Ranker.rank_batch`.
+
+    Each distinct skill, keyword, location and interest of the cohort becomes
+    a column; per resume weights count how often it lists that term, so one
+    matrix product yields every resume's points for a block of jobs.
+    """
+
+    def __init__(self, table: JobTable, resumes: Sequence[ResumeProfile]) -> None:
+        self.table = table
+        self.compiled = [_CompiledResume(resume) for resume in resumes]
+        count = len(resumes)
+
+        # Skills: resumes x skill vocabulary, one per distinct normalized skill.
+        vocabulary = table.skill_ids
+        self.skill_weights = np.zeros((len(vocabulary), count), dtype=np.float32)
+        for column, compiled in enumerate(self.compiled):
+            for skill in compiled.skills:
+                code = vocabulary.get(skill)
+                if code is not None:
+                    self.skill_weights[code, column] = 1
+        self.skill_indptr, self.skill_indices = table.skill_matrix()
+
+        # Keywords hit the role or the description; every listed keyword counts.
+        keywords = _columns_of(compiled.keywords.lowered for compiled in self.compiled)
+        roles = [role.lower() for role in table.roles]
+        by_role = np.array(
+            [[keyword in role for keyword in keywords] for role in roles], dtype=bool
+        ).reshape(len(roles), len(keywords))
+        self.keyword_hits = by_role[table.role_codes]
+        for column, keyword in enumerate(keywords):
+            self.keyword_hits[:, column] |= table.description_mask(keyword)
+        self.keyword_weights = _weights(keywords, (c.keywords.lowered for c in self.compiled), count)
+
+        # Locations: one test per distinct location and preferred location.
+        preferred = _columns_of(compiled.locations for compiled in self.compiled)
+        location_terms = np.array(
+            [[bool(value) and loc in value.lower() for loc in preferred] for value in table.locations]
+            + [[False] * len(preferred)],  # code -1, no location
+            dtype=bool,
+        ).reshape(len(table.locations) + 1, len(preferred))
+        location_weights = _weights(preferred, (c.locations for c in self.compiled), count)
+        self.location_hits = (location_terms.astype(np.float32) @ location_weights) > 0
+        self.location_codes = table.location_codes
+
+        # Interests: any interest found in a non-empty description.
+        interests = _columns_of(compiled.interests.needles for compiled in self.compiled)
+        self.interest_hits = np.zeros((len(table), len(interests)), dtype=bool)
+        for column, interest in enumerate(interests):
+            self.interest_hits[:, column] = table.description_mask(interest)
+        self.interest_hits &= (table.description_lengths > 0)[:, None]
+        self.interest_weights = _weights(interests, (c.interests.needles for c in self.compiled), count)
+
+    def base_scores(self, start: int, stop: int) -> "np.ndarray":
+        """Points other than recency for jobs ``start:stop`` x every resume."""
+
+        rows = stop - start
+        indptr = self.skill_indptr
+        lo, hi = indptr[start], indptr[stop]
+        block = np.zeros((rows, self.skill_weights.shape[0]), dtype=np.float32)
+        block[np.repeat(np.arange(rows), np.diff(indptr[start : stop + 1])), self.skill_indices[lo:hi]] = 1
+        skills = block @ self.skill_weights
+        keywords = self.keyword_hits[start:stop].astype(np.float32) @ self.keyword_weights
+        locations = self.location_hits[self.location_codes[start:stop]]
+        interests = (self.interest_hits[start:stop].astype(np.float32) @ self.interest_weights) > 0
+        return (skills * 5 + keywords * 3 + locations * 4).astype(np.float64) + interests * 1.5
+
+
+def _columns_of(groups: Iterable[Iterable[str]]) -> List[str]:
+    return list(dict.fromkeys(term for group in groups for term in group))
+
+
+def _weights(columns: List[str], groups: Iterable[Iterable[str]], count: int) -> "np.ndarray":
+    position = {term: index for index, term in enumerate(columns)}
+    weights = np.zeros((len(columns), count), dtype=np.float32)
+    for column, group in enumerate(groups):
+        for term in group:
+            weights[position[term], column] += 1
+    return weights
 
 
 class Ranker:
-    """Apply matching heuristics/ML-inspired scoring."""
+    """Apply matching heuristics/ML-inspired scoring.
+
+    With a ``relevance`` index, every job indexed there also earns up to
+    ``relevance_weight`` points for the BM25 relevance of its role and
+    description to the resume's skills and interests, scaled by the best
+    score those terms could reach.
+    """
 
-    def __init__(self, decay_half_life_days: float = 15.0) -> None:
+    def __init__(
+        self,
+        decay_half_life_days: float = 15.0,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        relevance: Optional[RelevanceIndex] = None,
+        relevance_weight: float = 5.0,
+    ) -> None:
         self.decay_half_life_days = decay_half_life_days
+        self.clock = clock
+        self.relevance = relevance
+        self.relevance_weight = relevance_weight
+        self._compiled: Optional[_CompiledResume] = None
+        # Jobs skipped by the most recent index-pruned rank()/rank_top_k().
+        self.last_pruned = 0
+
+    def rank(
+        self,
+        jobs: Sequence[JobListing],
+        resume: ResumeProfile,
+        *,
+        min_score: Optional[float] = None,
+        index: Optional[JobIndex] = None,
+        workers: int = 1,
+    ) -> List[RankedJob]:
+        """Score and sort ``jobs`` by descending score.
+
+        With ``min_score`` only jobs scoring at least that much are returned;
+        an ``index`` holding the jobs then lets jobs whose upper bound is below
+        ``min_score`` be skipped without scoring them.  ``workers > 1`` scores
+        on a process pool (see :meth:`_score_parallel`); the result is the same
+        for every worker count.
+        """
 
-    def rank(self, jobs: Sequence[JobListing], resume: ResumeProfile) -> List[RankedJob]:
         ranked: List[RankedJob] = []
+        compiled = self._compile(resume)
+        now = self.clock()
+        relevance = self._relevance(compiled)
+        explainer = _Explainer(self, resume, compiled, now, relevance)
+        self.last_pruned = 0
+        if workers > 1:
+            jobs = _as_sequence(jobs, index)
+            floor = float("-inf") if min_score is None else min_score
+            scored = self._score_parallel(jobs, resume, now, relevance, workers, floor, None)
+            return [RankedJob(jobs[position], -negated, explainer) for negated, position in scored]
+        bound = self._upper_bound(index, resume, compiled) if min_score is not None else None
         for job in jobs:
-            score, explanation = self._score_job(job, resume)
-            ranked.append(RankedJob(job=job, score=score, explanation=explanation))
+            if bound is not None and bound(job) < min_score:
+                self.last_pruned += 1
+                continue
+            score = self._score(job, resume, compiled, now, relevance=relevance)
+            if min_score is not None and score < min_score:
+                continue
+            ranked.append(RankedJob(job, score, explainer))
         return sorted(ranked, key=lambda item: item.score, reverse=True)
 
-    def _score_job(self, job: JobListing, resume: ResumeProfile) -> Tuple[float, str]:
-        score = 0.0
-        reasons: List[str] = []
+    def rank_top_k(
+        self,
+        jobs: Iterable[JobListing],
+        resume: ResumeProfile,
+        k: int = 10,
+        *,
+        min_score: Optional[float] = None,
+        index: Optional[JobIndex] = None,
+        workers: int = 1,
+    ) -> List[RankedJob]:
+        """Return the best ``k`` jobs, ordered exactly as :meth:`rank` would.
 
-        normalized_skills = resume.normalized_skills()
+        ``jobs`` may be any iterable and is consumed once.  Only a size-``k``
+        heap of (score, job) pairs is kept, so memory is O(k) and the cost is
+        O(n log k); score components are only computed when a result is explained.  With an
+        ``index``, jobs whose upper bound cannot beat ``min_score`` or the
+        current k-th best score are skipped without being scored.  With
+        ``workers > 1`` each worker keeps the top ``k`` of its chunks and the
+        per-chunk lists are merged (see :meth:`_score_parallel`).
+        """
+
+        if k <= 0:
+            return []
+        compiled = self._compile(resume)
+        floor = float("-inf") if min_score is None else min_score
+        now = self.clock()
+        relevance = self._relevance(compiled)
+        self.last_pruned = 0
+        if workers > 1:
+            jobs = _as_sequence(jobs, index)
+            explainer = _Explainer(self, resume, compiled, now, relevance)
+            scored = self._score_parallel(jobs, resume, now, relevance, workers, floor, k)
+            return [RankedJob(jobs[position], -negated, explainer) for negated, position in scored]
+        bound = self._upper_bound(index, resume, compiled)
+        # Same (score, -arrival) ordering as iter_top_k; see there.
+        heap: List[Tuple[float, int, JobListing]] = []
+        for arrival, job in enumerate(jobs):
+            if bound is not None:
+                # A later arrival never displaces an equal score, hence ``<=``.
+                limit = bound(job)
+                if limit < floor or (len(heap) >= k and limit <= heap[0][0]):
+                    self.last_pruned += 1
+                    continue
+            score = self._score(job, resume, compiled, now, relevance=relevance)
+            if score < floor:
+                continue
+            entry = (score, -arrival, job)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        explainer = _Explainer(self, resume, compiled, now, relevance)
+        return [
+            RankedJob(job, score, explainer)
+            for score, _, job in sorted(heap, key=lambda e: e[:2], reverse=True)
+        ]
+
+    def iter_top_k(
+        self, jobs: Iterable[JobListing], resume: ResumeProfile, k: int = 10
+    ) -> Iterator[List[RankedJob]]:
+        """Consume a job stream and yield the running top ``k`` whenever it changes.
+
+        Pair with :meth:`JobAggregator.iter_jobs` so the best matches so far are
+        available while slower providers are still responding.  Each snapshot is
+        ordered exactly like :meth:`rank` would order the jobs seen so far.
+        """
+
+        if k <= 0:
+            return
+        # Min-heap of (score, -arrival, ranked): the root is the entry that
+        # would be evicted first, i.e. the lowest score and, on ties, the
+        # latest arrival, matching the stable sort used by ``rank``.
+        heap: List[Tuple[float, int, RankedJob]] = []
+        compiled = self._compile(resume)
+        now = self.clock()
+        relevance = self._relevance(compiled)
+        explainer = _Explainer(self, resume, compiled, now, relevance)
+        for arrival, job in enumerate(jobs):
+            score = self._score(job, resume, compiled, now, relevance=relevance)
+            if len(heap) >= k and (score, -arrival) <= heap[0][:2]:
+                continue
+            entry = (score, -arrival, RankedJob(job, score, explainer))
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
+            yield [ranked for _, _, ranked in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+    def _score_parallel(
+        self,
+        jobs: Sequence[JobListing],
+        resume: ResumeProfile,
+        now: datetime,
+        relevance: Optional[Callable[[JobListing], float]],
+        workers: int,
+        floor: float,
+        k: Optional[int],
+    ) -> List[Tuple[float, int]]:
+        """Score ``jobs`` on ``workers`` processes and return sorted ``(-score, position)`` pairs.
+
+        The jobs, the resume and the scoring settings reach each worker once,
+        through the pool initializer (inherited without copying where the
+        platform forks); tasks are position ranges, about four per worker.
+        Each task returns its jobs scoring at least ``floor`` (its best ``k``
+        when given) sorted by descending score then position, and a k-way
+        merge of those lists yields exactly the sequential order.
+        """
+
+        points = None
+        if relevance is not None:
+            # Workers have no index connection; send the points each job earns.
+            points = {}
+            for job in jobs:
+                value = relevance(job)
+                if value:
+                    points[job_key(job)] = value
+        size = -(-len(jobs) // (workers * 4)) or 1
+        starts = range(0, len(jobs), size)
+        stops = [min(start + size, len(jobs)) for start in starts]
+        settings = (self.decay_half_life_days, now, points)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(jobs, resume, settings)
+        ) as pool:
+            parts = list(pool.map(_score_range, starts, stops, [floor] * len(stops), [k] * len(stops)))
+        merged = heapq.merge(*parts)
+        return list(merged if k is None else islice(merged, k))
+
+    def _score_job(
+        self, job: JobListing, resume: ResumeProfile, compiled: Optional[_CompiledResume] = None
+    ) -> Tuple[float, str]:
+        compiled = compiled or self._compile(resume)
+        components: List[ScoreComponent] = []
+        score = self._score(job, resume, compiled, self.clock(), components, self._relevance(compiled))
+        return score, RankedJob.from_components(job, score, components).explanation
+
+    def _score(
+        self,
+        job: JobListing,
+        resume: ResumeProfile,
+        compiled: _CompiledResume,
+        now: datetime,
+        components: Optional[List[ScoreComponent]] = None,
+        relevance: Optional[Callable[[JobListing], float]] = None,
+    ) -> float:
+        """Score ``job`` as of ``now``, appending its :class:`ScoreComponent` records when given a list."""
+
+        score = self._static_score(job, resume, compiled, components, relevance)
+        recency = self._recency_bonus(job, now)
+        score += recency
+        if components is not None:
+            components.append(ScoreComponent("recency", recency))
+        return score
+
+    def _static_score(
+        self,
+        job: JobListing,
+        resume: ResumeProfile,
+        compiled: _CompiledResume,
+        components: Optional[List[ScoreComponent]] = None,
+        relevance: Optional[Callable[[JobListing], float]] = None,
+    ) -> float:
+        """Every component except recency, which is the only one that depends on the clock."""
+
+        score = 0.0
         job_requirements = [req.skill.lower() for req in job.requirements]
         job_technologies = [tech.lower() for tech in job.technologies]
         job_skill_pool = set(job_requirements + job_technologies)
-        skill_matches = len(set(normalized_skills) & job_skill_pool)
+        matched = compiled.skills & job_skill_pool
+        skill_matches = len(matched)
         if skill_matches:
             points = skill_matches * 5
             score += points
-            reasons.append(f"{skill_matches} skill matches (+{points})")
+            if components is not None:
+                components.append(ScoreComponent("skills", points, tuple(sorted(matched))))
 
-        for keyword in resume.target_role_keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in job.role.lower() or keyword_lower in job.description.lower():
+        role_hits = compiled.keywords.find(job.role_lower)
+        description_hits = compiled.terms.find(job.description_lower)
+        for keyword, needle in zip(resume.target_role_keywords, compiled.keywords.lowered):
+            if needle in role_hits or needle in description_hits:
                 score += 3
-                reasons.append(f"Role keyword '{keyword}' (+3)")
+                if components is not None:
+                    components.append(ScoreComponent("role_keyword", 3, keyword))
 
-        if resume.preferred_locations and job.location:
-            if any(loc.lower() in job.location.lower() for loc in resume.preferred_locations):
+        if compiled.locations and job.location:
+            location = job.location.lower()
+            if any(loc in location for loc in compiled.locations):
                 score += 4
-                reasons.append("Preferred location match (+4)")
+                if components is not None:
+                    components.append(ScoreComponent("location", 4, job.location))
 
         if resume.interests and job.description:
-            for interest in resume.interests:
-                if interest.lower() in job.description.lower():
+            for interest, needle in zip(resume.interests, compiled.interests.lowered):
+                if needle in description_hits:
                     score += 1.5
-                    reasons.append(f"Interest '{interest}' (+1.5)")
+                    if components is not None:
+                        components.append(ScoreComponent("interest", 1.5, interest))
                     break
 
-        score += self._recency_bonus(job)
-        reasons.append("Recency bonus applied")
+        if relevance is not None:
+            points = relevance(job)
+            if points:
+                score += points
+                if components is not None:
+                    components.append(ScoreComponent("relevance", points))
+        return score
+
+    def _upper_bound(
+        self, index: Optional[JobIndex], resume: ResumeProfile, compiled: _CompiledResume
+    ) -> Optional[Callable[[JobListing], float]]:
+        """Return a function bounding each job's score from above using ``index``.
+
+        Skill and location points come straight from the postings.  Keywords
+        and interests without whitespace occur in a text exactly when they
+        occur inside one of its whitespace-delimited terms, so their postings
+        are exact too; any other keyword or interest, and recency, are assumed
+        to score fully.  Jobs missing from the index, or changed since they
+        were indexed, are unbounded.
+        """
 
-        return score, "; ".join(reasons)
+        if index is None:
+            return None
+        counts = np.zeros(index.size, dtype=np.int64)
+        for skill in compiled.skills:
+            counts[index.lookup(SKILL, skill)] += 1
+        bounds = counts * 5.0
+        if compiled.locations:
+            bounds += 4 * index.mask(LOCATION, compiled.locations, substring=True)
+        for needle in compiled.keywords.lowered:
+            if not needle or any(char.isspace() for char in needle):
+                bounds += 3
+            else:
+                bounds += 3 * (
+                    index.mask(ROLE, [needle], substring=True)
+                    | index.mask(DESCRIPTION, [needle], substring=True)
+                )
+        interests = compiled.interests.needles
+        if interests:
+            if any(not needle or any(char.isspace() for char in needle) for needle in interests):
+                bounds += 1.5
+            else:
+                bounds += 1.5 * index.mask(DESCRIPTION, interests, substring=True)
+        if self.relevance is not None:
+            bounds += self.relevance_weight
+        bounds += 10  # the largest possible recency bonus
+        values = bounds.tolist()
+        size = len(values)
 
-    def _recency_bonus(self, job: JobListing) -> float:
+        def bound(job: JobListing) -> float:
+            doc = index.doc_id(job)
+            return float("inf") if doc is None or doc >= size else values[doc]
+
+        return bound
+
+    def _relevance_points(self, compiled: _CompiledResume) -> "Tuple[np.ndarray, np.ndarray]":
+        """Relevance points of the indexed documents matching the resume, as ``(docs, points)``."""
+
+        index = self.relevance
+        docs, scores = index.scores(compiled.profile_terms)
+        ceiling = index.max_score(compiled.profile_terms)
+        if not docs.size or ceiling <= 0:
+            return docs, np.zeros(docs.size, dtype=np.float64)
+        return docs, scores * (self.relevance_weight / ceiling)
+
+    def _relevance(self, compiled: _CompiledResume) -> Optional[Callable[[JobListing], float]]:
+        """Return a function giving each job's relevance points, or ``None`` without an index."""
+
+        index = self.relevance
+        if index is None:
+            return None
+        docs, points = self._relevance_points(compiled)
+        lookup = dict(zip(docs.tolist(), points.tolist()))
+
+        def relevance(job: JobListing) -> float:
+            return lookup.get(index.doc_id(job), 0.0)
+
+        return relevance
+
+    def _compile(self, resume: ResumeProfile) -> _CompiledResume:
+        cached = self._compiled
+        if cached is None or cached.key != _resume_key(resume):
+            cached = self._compiled = _CompiledResume(resume)
+        return cached
+
+    def _recency_bonus(self, job: JobListing, now: datetime) -> float:
         if not job.posted_at:
             return 0.0
-        days_old = max((datetime.utcnow() - job.posted_at).days, 0)
+        return self._decay(self._days_old(job, now))
+
+    @staticmethod
+    def _days_old(job: JobListing, now: datetime) -> int:
+        return max((now - job.posted_at).days, 0)
+
+    def _decay(self, days_old: int) -> float:
         decay_factor = 0.5 ** (days_old / self.decay_half_life_days)
         return 10 * decay_factor
 
+    # ------------------------------------------------------------------
+    # vectorized scoring over a JobTable
+
+    def score_table(self, table: JobTable, resume: ResumeProfile) -> "np.ndarray":
+        """Return the score of every row of ``table``, identical to :meth:`rank`."""
+
+        return self._table_scores(table, resume, self.clock()).total
+
+    def rank_table(
+        self, table: JobTable, resume: ResumeProfile, k: Optional[int] = None
+    ) -> List[RankedJob]:
+        """Vectorized equivalent of :meth:`rank` for a columnar :class:`JobTable`.
+
+        Skills are matched through the table's shared vocabulary and CSR skill
+        matrix, and the location bonus and recency decay are evaluated once per
+        distinct location and age.  Scores, explanations and ordering match
+        :meth:`rank`; only the first ``k`` rows are materialized when given.
+        """
+
+        now = self.clock()
+        total = self._table_scores(table, resume, now).total
+        order = np.argsort(-total, kind="stable")
+        if k is not None:
+            order = order[:k]
+        compiled = self._compile(resume)
+        explainer = _Explainer(self, resume, compiled, now, self._relevance(compiled))
+        return [RankedJob(table[position], float(total[position]), explainer) for position in order.tolist()]
+
+    def _table_scores(self, table: JobTable, resume: ResumeProfile, now: datetime) -> _TableScores:
+        if np is None:
+            raise RuntimeError("numpy is required for vectorized ranking. Install via 'pip install numpy'.")
+        rows = len(table)
+
+        # Skill overlap: mark the resume's skills in the vocabulary, then count
+        # marked entries per CSR row with a prefix sum.
+        vocabulary = table.skill_ids
+        marked = np.zeros(len(vocabulary), dtype=np.int64)
+        for skill in set(resume.normalized_skills()):
+            code = vocabulary.get(skill)
+            if code is not None:
+                marked[code] = 1
+        indptr, indices = table.skill_matrix()
+        prefix = np.concatenate(([0], np.cumsum(marked[indices])))
+        skill_matches = prefix[indptr[1:]] - prefix[indptr[:-1]]
+
+        # Role keywords: role hits are evaluated once per distinct role and
+        # description hits through the table's description search.
+        keywords = resume.target_role_keywords
+        keyword_hits = np.zeros((rows, len(keywords)), dtype=bool)
+        if keywords:
+            roles = [role.lower() for role in table.roles]
+            by_role = np.array(
+                [[keyword.lower() in role for keyword in keywords] for role in roles], dtype=bool
+            ).reshape(len(roles), len(keywords))
+            keyword_hits = by_role[table.role_codes]
+            for column, keyword in enumerate(keywords):
+                keyword_hits[:, column] |= table.description_mask(keyword)
+
+        # Location: one substring test per distinct location.
+        location_hit = np.zeros(rows, dtype=bool)
+        if resume.preferred_locations:
+            preferred = [loc.lower() for loc in resume.preferred_locations]
+            # An empty location never matches, as in ``_score_job``; code -1
+            # (no location) indexes the trailing False.
+            per_code = [
+                bool(value) and any(loc in value.lower() for loc in preferred)
+                for value in table.locations
+            ]
+            location_hit = np.array(per_code + [False], dtype=bool)[table.location_codes]
+
+        # Interests: the first interest found in a non-empty description.
+        interest_index = np.full(rows, -1, dtype=np.int64)
+        if resume.interests:
+            has_description = table.description_lengths > 0
+            for position, interest in enumerate(resume.interests):
+                hit = table.description_mask(interest) & has_description
+                interest_index[(interest_index < 0) & hit] = position
+
+        relevance = self._table_relevance(table, resume)
+        recency = self._table_recency(table, now)
+
+        base = (
+            skill_matches * 5
+            + keyword_hits.sum(axis=1) * 3
+            + location_hit * 4
+        ).astype(np.float64) + (interest_index >= 0) * 1.5
+        return _TableScores(
+            skill_matches=skill_matches,
+            keyword_hits=keyword_hits,
+            location_hit=location_hit,
+            interest_index=interest_index,
+            relevance=relevance,
+            recency=recency,
+            total=base + relevance + recency,
+        )
+
+    def _table_relevance(self, table: JobTable, resume: ResumeProfile) -> "np.ndarray":
+        relevance = np.zeros(len(table), dtype=np.float64)
+        if self.relevance is None or not len(table):
+            return relevance
+        docs, points = self._relevance_points(self._compile(resume))
+        if docs.size:
+            # Rows whose text changed since it was indexed earn nothing, as in rank().
+            roles = table.roles
+            contents = zip([roles[code] for code in table.role_codes.tolist()], table.descriptions)
+            rows = self.relevance.doc_ids(table.job_keys, contents)
+            positions = np.minimum(np.searchsorted(docs, rows), docs.size - 1)
+            found = docs[positions] == rows
+            relevance[found] = points[positions[found]]
+        return relevance
+
+    def _table_recency(self, table: JobTable, now: datetime) -> "np.ndarray":
+        # The decay is computed in Python once per distinct age so the
+        # floating-point result is bit-identical to the scalar path.
+        posted = table.posted_at
+        dated = posted != NO_DATE
+        recency = np.zeros(len(table), dtype=np.float64)
+        if dated.any():
+            now_us = to_epoch_us(now)
+            days = np.maximum((now_us - posted[dated]) // _DAY_US, 0)
+            unique_days, inverse = np.unique(days, return_inverse=True)
+            bonus = np.array([self._decay(int(d)) for d in unique_days.tolist()], dtype=np.float64)
+            recency[dated] = bonus[inverse]
+        return recency
+
+    # ------------------------------------------------------------------
+    # many resumes x many jobs
+
+    def rank_batch(
+        self,
+        jobs: "Sequence[JobListing] | JobTable",
+        resumes: Sequence[ResumeProfile],
+        k: int = 10,
+        *,
+        chunk_size: int = 4096,
+    ) -> List[List[RankedJob]]:
+        """Return the top ``k`` jobs for every resume, in ``resumes`` order.
+
+        Job features are extracted once (``jobs`` may already be a
+        :class:`JobTable`) and scores for all resumes are computed ``chunk_size``
+        jobs at a time with matrix products, so memory stays at
+        O(chunk_size x resumes) whatever the number of jobs.  Each list equals
+        ``rank_top_k(jobs, resume, k)``: same jobs, scores, explanations and
+        tie order.  With a ``relevance`` index every resume is ranked on its own
+        with :meth:`rank_table`, as relevance points are not a sum of per-term
+        weights.
+        """
+
+        if np is None:
+            raise RuntimeError("numpy is required for batch ranking. Install via 'pip install numpy'.")
+        table = jobs if isinstance(jobs, JobTable) else JobTable.from_listings(jobs)
+        if k <= 0 or not resumes or not len(table):
+            return [[] for _ in resumes]
+        if self.relevance is not None:
+            return [self.rank_table(table, resume, k) for resume in resumes]
+        features = _BatchFeatures(table, resumes)
+        now = self.clock()
+        recency = self._table_recency(table, now)
+
+        # Running top k per resume as flat (resume, job, score) triples.
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_jobs = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float64)
+        floor = np.full(len(resumes), -np.inf)
+        for start in range(0, len(table), chunk_size):
+            stop = min(start + chunk_size, len(table))
+            scores = features.base_scores(start, stop) + recency[start:stop, None]  # (jobs, resumes)
+            scores = scores.T
+            if scores.shape[1] > k:
+                kth = np.partition(scores, scores.shape[1] - k, axis=1)[:, scores.shape[1] - k]
+                floor_now = np.maximum(floor, kth)
+            else:
+                floor_now = floor
+            # A later job never displaces an equal score, but keep ties at the
+            # threshold of this chunk: they may precede each other.
+            rows, columns = np.nonzero(scores >= floor_now[:, None])
+            best_rows = np.concatenate((best_rows, rows))
+            best_jobs = np.concatenate((best_jobs, columns + start))
+            best_scores = np.concatenate((best_scores, scores[rows, columns]))
+            # Order by resume, then score descending, then job position.
+            order = np.lexsort((best_jobs, -best_scores, best_rows))
+            best_rows, best_jobs, best_scores = best_rows[order], best_jobs[order], best_scores[order]
+            starts = np.searchsorted(best_rows, best_rows, side="left")
+            keep = np.arange(best_rows.size) - starts < k
+            best_rows, best_jobs, best_scores = best_rows[keep], best_jobs[keep], best_scores[keep]
+            full = np.bincount(best_rows, minlength=len(resumes)) >= k
+            last = np.searchsorted(best_rows, np.arange(len(resumes)), side="right") - 1
+            floor = np.where(full, best_scores[np.maximum(last, 0)], -np.inf)
+
+        listings: Dict[int, JobListing] = {}
+        explainers = [
+            _Explainer(self, resume, compiled, now) for resume, compiled in zip(resumes, features.compiled)
+        ]
+        results: List[List[RankedJob]] = [[] for _ in resumes]
+        for row, position, score in zip(best_rows.tolist(), best_jobs.tolist(), best_scores.tolist()):
+            job = listings.get(position)
+            if job is None:
+                job = listings[position] = table[position]
+            results[row].append(RankedJob(job, score, explainers[row]))
+        return results
+
+
+def _as_sequence(jobs: Iterable[JobListing], index: Optional[JobIndex]) -> Sequence[JobListing]:
+    if index is not None:
+        raise ValueError("index pruning is not supported with workers > 1")
+    return jobs if isinstance(jobs, (list, tuple)) else list(jobs)
+
+
+# Per-process scoring state of a worker started by Ranker._score_parallel.
+_worker: Optional[tuple] = None
+
+
+def _init_worker(
+    jobs: Sequence[JobListing], resume: ResumeProfile, settings: Tuple[float, datetime, Optional[Dict[str, float]]]
+) -> None:
+    global _worker
+    decay_half_life_days, now, points = settings
+    ranker = Ranker(decay_half_life_days)
+    relevance = None
+    if points is not None:
+        def relevance(job: JobListing) -> float:
+            return points.get(job_key(job), 0.0)
+    _worker = (jobs, resume, ranker, ranker._compile(resume), now, relevance)
+
+
+def _score_range(start: int, stop: int, floor: float, k: Optional[int]) -> List[Tuple[float, int]]:
+    jobs, resume, ranker, compiled, now, relevance = _worker
+    scored: List[Tuple[float, int]] = []
+    for position in range(start, stop):
+        score = ranker._score(jobs[position], resume, compiled, now, relevance=relevance)
+        if score >= floor:
+            scored.append((-score, position))
+    return sorted(scored) if k is None else heapq.nsmallest(k, scored)
+
+
+def _scored_fields(job: JobListing) -> tuple:
+    # Everything the static score and its components are computed from.
+    return (
+        job.role,
+        job.location,
+        job.description,
+        tuple(job.technologies),
+        tuple(req.skill for req in job.requirements),
+    )
+
+
+@dataclass
+class _SessionEntry:
+    job: JobListing
+    fields: tuple  # _scored_fields(job) when it was scored
+    static: float
+    components: Tuple[ScoreComponent, ...]  # everything but recency
+    arrival: int
+    days_old: Optional[int] = None
+    recency: float = 0.0
+    score: float = 0.0
+
+
+class _SessionState:
+    """Cached entries and their ordering for one resume fingerprint."""
+
+    def __init__(self, corpus: Optional[Tuple[int, int]] = None) -> None:
+        # Relevance index and generation the cached static scores were computed against.
+        self.corpus = corpus
+        self.entries: Dict[str, _SessionEntry] = {}
+        # Sorted (-score, arrival, key): best first, earlier arrival on ties.
+        self.order: List[Tuple[float, int, str]] = []
+        self.arrivals = 0
+
+    def update(self, moved: List[Tuple[str, _SessionEntry, float]]) -> None:
+        """Apply new scores, re-sorting in bulk when most entries moved."""
+
+        if len(moved) * 8 > len(self.order):
+            for key, entry, score in moved:
+                entry.score = score
+                self.entries[key] = entry
+            self.order = sorted((-e.score, e.arrival, key) for key, e in self.entries.items())
+            return
+        for key, entry, score in moved:
+            if key in self.entries:
+                self.remove(key)
+            entry.score = score
+            self.entries[key] = entry
+            bisect.insort(self.order, (-score, entry.arrival, key))
+
+    def remove(self, key: str) -> None:
+        entry = self.entries.pop(key)
+        del self.order[bisect.bisect_left(self.order, (-entry.score, entry.arrival, key))]
+
+
+class RankingSession:
+    """Re-rank a changing job set cheaply across repeated calls.
+
+    Everything but recency is cached per (resume fingerprint, job key): a job
+    is scored in full only when first seen or when the fields it is scored on
+    change (also when the same object was edited in place), and on
+    later calls only its recency bonus is recomputed, the job being moved only
+    when its age in days changed.  Results live in a sorted list maintained
+    with ``bisect`` (O(log n) comparisons per moved job; a full re-sort when
+    most jobs moved, e.g. after the clock advanced a day).  :meth:`rank`
+    returns what :meth:`Ranker.rank` would, for jobs identified by
+    ``provider:id``, with ties ordered by when a job was first seen.  When
+    the ranker's relevance index changes, every job is scored afresh.
+    """
+
+    def __init__(self, ranker: Optional[Ranker] = None) -> None:
+        self.ranker = ranker or Ranker()
+        self._states: Dict[Tuple[Tuple[str, ...], ...], _SessionState] = {}
+        # Jobs scored in full by the most recent call.
+        self.last_scored = 0
+
+    def rank(
+        self, jobs: Iterable[JobListing], resume: ResumeProfile, k: Optional[int] = None
+    ) -> List[RankedJob]:
+        ranker = self.ranker
+        compiled = ranker._compile(resume)
+        index = ranker.relevance
+        corpus = None if index is None else (id(index), index.generation)
+        state = self._states.get(compiled.key)
+        if state is None or state.corpus != corpus:
+            state = self._states[compiled.key] = _SessionState(corpus)
+        relevance = ranker._relevance(compiled)
+        now = ranker.clock()
+        current = set()
+        moved: List[Tuple[str, _SessionEntry, float]] = []
+        self.last_scored = 0
+        for job in jobs:
+            key = job_key(job)
+            current.add(key)
+            entry = state.entries.get(key)
+            days_old = ranker._days_old(job, now) if job.posted_at else None
+            fields = _scored_fields(job)
+            if entry is None or fields != entry.fields:
+                components: List[ScoreComponent] = []
+                static = ranker._static_score(job, resume, compiled, components, relevance)
+                if entry is None:
+                    arrival, state.arrivals = state.arrivals, state.arrivals + 1
+                else:
+                    arrival = entry.arrival
+                entry = _SessionEntry(job, fields, static, tuple(components), arrival)
+                self.last_scored += 1
+            else:
+                entry.job = job
+                if days_old == entry.days_old:
+                    continue
+            entry.days_old = days_old
+            entry.recency = 0.0 if days_old is None else ranker._decay(days_old)
+            moved.append((key, entry, entry.static + entry.recency))
+        state.update(moved)
+        if len(state.entries) > len(current):
+            for key in [key for key in state.entries if key not in current]:
+                state.remove(key)
+
+        order = state.order if k is None else state.order[:k]
+        entries = state.entries
+        return [
+            RankedJob.from_components(
+                entry.job, entry.score, [*entry.components, ScoreComponent("recency", entry.recency)]
+            )
+            for entry in (entries[key] for _, _, key in order)
+        ]
+
+    def forget(self, resume: Optional[ResumeProfile] = None) -> None:
+        """Drop cached scores for one resume, or for every resume."""
+
+        if resume is None:
+            self._states.clear()
+        else:
+            self._states.pop(_resume_key(resume), None)
+
 
-__all__ = ["Ranker", "RankedJob"]
+__all__ = ["Ranker", "RankedJob", "RankingSession", "ScoreComponent"]
@@ -0,0 +1,295 @@
+"""Persistent BM25 index over listing roles and descriptions."""
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .job_index import job_key
+from .schemas import JobListing
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except Exception:  # pragma: no cover - gracefully degrade when dependency missing
+    np = None
+
+DEFAULT_RELEVANCE_PATH = Path.home() / ".internship_bot" / "relevance.sqlite3"
+
+# Role terms count this many times towards a term's frequency in a listing.
+ROLE_WEIGHT = 2
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS docs (
+        doc INTEGER PRIMARY KEY,
+        job_key TEXT UNIQUE,
+        fingerprint TEXT NOT NULL,
+        length INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS postings (
+        term TEXT PRIMARY KEY,
+        docs BLOB NOT NULL,
+        tfs BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric terms of ``text``; ``+`` and ``#`` stay attached (``c++``)."""
+
+    return _TOKEN.findall(text.lower())
+
+
+def _content(job: JobListing) -> Tuple[str, str]:
+    # The fields documents are built from; see RelevanceIndex.doc_id.
+    return job.role, job.description
+
+
+def _digest(content: Tuple[str, str]) -> str:
+    return sha1("\x1f".join(content).encode("utf-8")).hexdigest()
+
+
+def _term_frequencies(job: JobListing) -> Counter:
+    counts = Counter(tokenize(job.description))
+    for term in tokenize(job.role):
+        counts[term] += ROLE_WEIGHT
+    return counts
+
+
+class RelevanceIndex:
+    """Okapi BM25 over each listing's role and description.
+
+    Every indexed version of a listing is a document with a dense number;
+    posting lists hold packed int64 document numbers and int32 term
+    frequencies per term.  When a listing changes, its previous document is
+    retired (its ``job_key`` cleared) rather than rewritten, so postings stay
+    append-only and retired documents are skipped when scoring.  Listings
+    whose role and description are unchanged are skipped by :meth:`add`, so
+    re-adding them neither grows the index nor bumps :attr:`generation`.
+
+    :meth:`scores` only reads the posting lists of the query terms, so its
+    cost grows with how many listings mention them, not with the corpus.
+    """
+
+    def __init__(
+        self, path: str | Path = DEFAULT_RELEVANCE_PATH, *, k1: float = 1.2, b: float = 0.75
+    ) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for RelevanceIndex. Install via 'pip install numpy'.")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            rows = self._conn.execute(
+                "SELECT doc, job_key, fingerprint, length FROM docs ORDER BY doc"
+            ).fetchall()
+        size = rows[-1][0] + 1 if rows else 0
+        # job_key -> (current doc, digest of the role and description it indexes)
+        self._docs: Dict[str, Tuple[int, str]] = {
+            key: (doc, digest) for doc, key, digest, _ in rows if key is not None
+        }
+        # job_key -> _content() of the listing last found to match its digest.
+        self._verified: Dict[str, Tuple[str, str]] = {}
+        self._lengths = np.zeros(size, dtype=np.float64)
+        self._live = np.zeros(size, dtype=bool)
+        for doc, key, _, length in rows:
+            self._lengths[doc] = length
+            self._live[doc] = key is not None
+        self._total_length = float(self._lengths[self._live].sum())
+        self._cache: Dict[str, Tuple["np.ndarray", "np.ndarray"]] = {}
+        # Bumped whenever the indexed corpus changes, which changes every score.
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def doc_id(self, job: JobListing) -> Optional[int]:
+        """Document number of ``job``, or ``None`` if it is not indexed as it is now.
+
+        A listing whose role or description changed since it was last added
+        would be scored on its old text, so it has no document until it is
+        added again.
+        """
+
+        return self._current(job_key(job), _content(job))
+
+    def doc_ids(
+        self, keys: Iterable[str], contents: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> "np.ndarray":
+        """Document number per ``provider:id`` key, ``-1`` for keys never indexed.
+
+        With ``contents``, the ``(role, description)`` of each key's listing,
+        keys whose indexed text differs map to ``-1`` as in :meth:`doc_id`.
+        """
+
+        if contents is None:
+            docs = self._docs
+            return np.fromiter((docs.get(key, (-1,))[0] for key in keys), dtype=np.int64)
+        current = (self._current(key, content) for key, content in zip(keys, contents))
+        return np.fromiter((-1 if doc is None else doc for doc in current), dtype=np.int64)
+
+    def _current(self, key: str, content: Tuple[str, str]) -> Optional[int]:
+        entry = self._docs.get(key)
+        if entry is None:
+            return None
+        if self._verified.get(key) != content:
+            if _digest(content) != entry[1]:
+                return None
+            self._verified[key] = content
+        return entry[0]
+
+    def add(self, jobs: Iterable[JobListing]) -> int:
+        """Index new or changed listings and return how many were written."""
+
+        pending: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths: Dict[int, int] = {}
+        retired: List[int] = []
+        written = 0
+        with self._lock, self._conn:
+            for job in jobs:
+                key = job_key(job)
+                content = _content(job)
+                entry = self._docs.get(key)
+                if entry is not None and self._verified.get(key) == content:
+                    continue
+                digest = _digest(content)
+                self._verified[key] = content
+                if entry is not None:
+                    if entry[1] == digest:
+                        continue
+                    previous = entry[0]
+                    self._conn.execute("UPDATE docs SET job_key = NULL WHERE doc = ?", (previous,))
+                    if lengths.pop(previous, None) is None:
+                        retired.append(previous)
+                written += 1
+                counts = _term_frequencies(job)
+                length = sum(counts.values())
+                doc = self._conn.execute(
+                    "INSERT INTO docs (job_key, fingerprint, length) VALUES (?, ?, ?)",
+                    (key, digest, length),
+                ).lastrowid
+                self._docs[key] = (doc, digest)
+                lengths[doc] = length
+                for term, tf in counts.items():
+                    docs, tfs = pending.setdefault(term, ([], []))
+                    docs.append(doc)
+                    tfs.append(tf)
+            for term, (docs, tfs) in pending.items():
+                row = self._conn.execute(
+                    "SELECT docs, tfs FROM postings WHERE term = ?", (term,)
+                ).fetchone()
+                packed_docs = np.array(docs, dtype=np.int64).tobytes()
+                packed_tfs = np.array(tfs, dtype=np.int32).tobytes()
+                if row:
+                    packed_docs, packed_tfs = row[0] + packed_docs, row[1] + packed_tfs
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO postings (term, docs, tfs) VALUES (?, ?, ?)",
+                    (term, packed_docs, packed_tfs),
+                )
+                self._cache.pop(term, None)
+            if lengths:
+                size = max(lengths) + 1
+                if size > self._lengths.size:
+                    self._lengths = np.concatenate((self._lengths, np.zeros(size - self._lengths.size)))
+                    self._live = np.concatenate((self._live, np.zeros(size - self._live.size, dtype=bool)))
+                for doc in retired:
+                    self._total_length -= self._lengths[doc]
+                    self._live[doc] = False
+                for doc, length in lengths.items():
+                    self._lengths[doc] = length
+                    self._live[doc] = True
+                    self._total_length += length
+                self.generation += 1
+        return written
+
+    def scores(self, terms: Iterable[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """BM25 of every current document containing any of ``terms``.
+
+        ``terms`` are tokenized like the indexed text and counted once each.
+        Returns ``(docs, scores)`` with ``docs`` sorted ascending.
+        """
+
+        query = list(dict.fromkeys(token for term in terms for token in tokenize(term)))
+        live_count = len(self._docs)
+        if not query or not live_count:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        average = self._total_length / live_count
+        doc_parts: List["np.ndarray"] = []
+        score_parts: List["np.ndarray"] = []
+        for term in query:
+            docs, tfs = self._postings(term)
+            current = self._live[docs]
+            docs, tfs = docs[current], tfs[current]
+            if not docs.size:
+                continue
+            idf = math.log(1 + (live_count - docs.size + 0.5) / (docs.size + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[docs] / average)
+            doc_parts.append(docs)
+            score_parts.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+        if not doc_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        unique, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+        return unique, np.bincount(inverse, weights=np.concatenate(score_parts))
+
+    def max_score(self, terms: Iterable[str]) -> float:
+        """Upper bound of :meth:`scores` for ``terms``: every term saturated in a document."""
+
+        query = list(dict.fromkeys(token for term in terms for token in tokenize(term)))
+        live_count = len(self._docs)
+        total = 0.0
+        for term in query:
+            docs, _ = self._postings(term)
+            frequency = int(self._live[docs].sum())
+            if frequency:
+                total += math.log(1 + (live_count - frequency + 0.5) / (frequency + 0.5)) * (self.k1 + 1)
+        return total
+
+    def _postings(self, term: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        cached = self._cache.get(term)
+        if cached is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT docs, tfs FROM postings WHERE term = ?", (term,)
+                ).fetchone()
+            if row is None:
+                cached = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+            else:
+                cached = np.frombuffer(row[0], dtype=np.int64), np.frombuffer(row[1], dtype=np.int32)
+            self._cache[term] = cached
+        return cached
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM docs")
+            self._conn.execute("DELETE FROM postings")
+            self._docs.clear()
+            self._verified.clear()
+            self._cache.clear()
+            self._lengths = np.zeros(0, dtype=np.float64)
+            self._live = np.zeros(0, dtype=bool)
+            self._total_length = 0.0
+            self.generation += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["DEFAULT_RELEVANCE_PATH", "RelevanceIndex", "ROLE_WEIGHT", "tokenize"]
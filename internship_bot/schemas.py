@@ -1,12 +1,13 @@
 """Data schemas for job listings and resume profiles."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRequirement:
     """Represents a skill requirement for a job listing."""
 
@@ -15,7 +16,7 @@ class JobRequirement:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class JobListing:
     """Canonical job listing model used across providers."""
 
@@ -31,6 +32,18 @@ class JobListing:
     posted_at: Optional[datetime] = None
     metadata: dict = field(default_factory=dict)
 
+    @property
+    def role_lower(self) -> str:
+        """Lower-cased ``role``."""
+
+        return self.role.lower()
+
+    @property
+    def description_lower(self) -> str:
+        """Lower-cased ``description``."""
+
+        return self.description.lower()
+
 
 @dataclass
 class ResumeProfile:
@@ -49,8 +62,48 @@ class ResumeProfile:
         return [skill.strip().lower() for skill in self.skills]
 
 
+class ListingCompactor:
+    """Shrink listings that repeat the same companies, locations and skills.
+
+    Strings are interned, requirement/technology lists become tuples and equal
+    :class:`JobRequirement` objects are shared between listings, so compacted
+    listings must be treated as read-only.  ``keep_metadata=False`` also drops
+    provider payloads carried in ``metadata``.
+    """
+
+    def __init__(self, keep_metadata: bool = True) -> None:
+        self.keep_metadata = keep_metadata
+        self._requirements: Dict[Tuple[str, Optional[str], bool], JobRequirement] = {}
+
+    def __call__(self, job: JobListing) -> JobListing:
+        intern = sys.intern
+        job.provider = intern(job.provider)
+        job.company = intern(job.company)
+        job.role = intern(job.role)
+        if job.location is not None:
+            job.location = intern(job.location)
+        job.requirements = tuple(self._requirement(req) for req in job.requirements)
+        job.technologies = tuple(intern(tech) for tech in job.technologies)
+        if not self.keep_metadata:
+            job.metadata = {}
+        return job
+
+    def _requirement(self, requirement: JobRequirement) -> JobRequirement:
+        key = (requirement.skill, requirement.level, requirement.required)
+        shared = self._requirements.get(key)
+        if shared is None:
+            shared = JobRequirement(
+                skill=sys.intern(requirement.skill),
+                level=sys.intern(requirement.level) if requirement.level else requirement.level,
+                required=requirement.required,
+            )
+            self._requirements[key] = shared
+        return shared
+
+
 __all__ = [
     "JobRequirement",
     "JobListing",
+    "ListingCompactor",
     "ResumeProfile",
 ]
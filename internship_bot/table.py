@@ -0,0 +1,335 @@
+"""Columnar storage for bulk filtering and ranking of job listings."""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .schemas import JobListing, JobRequirement
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except Exception:  # pragma: no cover - gracefully degrade when dependency missing
+    np = None
+
+EPOCH = datetime(1970, 1, 1)
+# Sentinel stored in ``posted_at`` for listings without a date.
+NO_DATE = -(2**63)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Return naive-UTC microseconds since the epoch for ``value``."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+class _Vocabulary:
+    """Dictionary encoder mapping strings to dense integer codes."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class JobTable:
+    """Column-oriented view over a set of listings.
+
+    Company, location and role are dictionary-encoded, ``posted_at`` is an
+    int64 array of epoch microseconds (:data:`NO_DATE` when missing) and the
+    lower-cased union of each listing's requirement skills and technologies is
+    a CSR matrix (``skill_indptr``/``skill_indices`` into ``skills``).  Filters
+    return a new table over a subset of rows and share the underlying columns;
+    :class:`JobListing` objects are only rebuilt when rows are read.
+    """
+
+    def __init__(self, columns: "_Columns", rows: "np.ndarray") -> None:
+        self._columns = columns
+        self.rows = rows
+
+    @classmethod
+    def from_listings(cls, jobs: Iterable[JobListing]) -> "JobTable":
+        if np is None:
+            raise RuntimeError("numpy is required for JobTable. Install via 'pip install numpy'.")
+        columns = _Columns.build(jobs)
+        return cls(columns, np.arange(columns.size, dtype=np.int64))
+
+    # ------------------------------------------------------------------
+    # column access (restricted to the selected rows)
+
+    def __len__(self) -> int:
+        return int(self.rows.size)
+
+    @property
+    def companies(self) -> List[str]:
+        return self._columns.companies.values
+
+    @property
+    def locations(self) -> List[str]:
+        return self._columns.locations.values
+
+    @property
+    def roles(self) -> List[str]:
+        return self._columns.roles.values
+
+    @property
+    def skills(self) -> List[str]:
+        return self._columns.skills.values
+
+    @property
+    def skill_ids(self) -> Dict[str, int]:
+        return self._columns.skills.codes
+
+    @property
+    def company_codes(self) -> "np.ndarray":
+        return self._columns.company_codes[self.rows]
+
+    @property
+    def location_codes(self) -> "np.ndarray":
+        """Location code per row, ``-1`` when the listing has no location."""
+
+        return self._columns.location_codes[self.rows]
+
+    @property
+    def role_codes(self) -> "np.ndarray":
+        return self._columns.role_codes[self.rows]
+
+    @property
+    def posted_at(self) -> "np.ndarray":
+        return self._columns.posted_at[self.rows]
+
+    def skill_matrix(self) -> "tuple[np.ndarray, np.ndarray]":
+        """Return ``(indptr, indices)`` of the skill CSR matrix for the selected rows."""
+
+        columns = self._columns
+        if self.rows.size == columns.size:
+            return columns.skill_indptr, columns.skill_indices
+        starts = columns.skill_indptr[self.rows]
+        counts = columns.skill_indptr[self.rows + 1] - starts
+        indptr = np.zeros(self.rows.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        offsets = np.repeat(starts - indptr[:-1], counts) + np.arange(indptr[-1], dtype=np.int64)
+        return indptr, columns.skill_indices[offsets]
+
+    # ------------------------------------------------------------------
+    # vectorized filters
+
+    def filter(
+        self,
+        *,
+        location: Optional[str] = None,
+        since: Optional[datetime] = None,
+        skill: Optional[str] = None,
+    ) -> "JobTable":
+        """Keep rows matching every given predicate.
+
+        ``location`` is a case-insensitive substring of the listing location,
+        ``since`` keeps listings posted at or after the timestamp and ``skill``
+        keeps listings that require or use the (case-insensitive) skill.
+        """
+
+        mask = np.ones(self.rows.size, dtype=bool)
+        if location is not None:
+            mask &= self.location_mask(location)
+        if since is not None:
+            mask &= self.posted_at >= to_epoch_us(since)
+        if skill is not None:
+            mask &= self.skill_mask(skill)
+        return self.take(mask)
+
+    def location_mask(self, location: str) -> "np.ndarray":
+        needle = location.lower()
+        codes = [code for code, value in enumerate(self.locations) if needle in value.lower()]
+        return np.isin(self.location_codes, np.array(codes, dtype=np.int32))
+
+    def skill_mask(self, skill: str) -> "np.ndarray":
+        columns = self._columns
+        code = columns.skills.codes.get(skill.lower())
+        if code is None:
+            return np.zeros(self.rows.size, dtype=bool)
+        row_of_entry = np.repeat(
+            np.arange(columns.size, dtype=np.int64), np.diff(columns.skill_indptr)
+        )
+        has_skill = np.zeros(columns.size, dtype=bool)
+        has_skill[row_of_entry[columns.skill_indices == code]] = True
+        return has_skill[self.rows]
+
+    def description_mask(self, text: str) -> "np.ndarray":
+        """Rows whose description contains ``text`` (case-insensitive substring)."""
+
+        needle = text.lower()
+        if not needle:
+            return np.ones(self.rows.size, dtype=bool)
+        columns = self._columns
+        if any(char.isspace() for char in needle):
+            has_text = columns.scan_descriptions(needle)
+        else:
+            # A needle without whitespace can only occur inside a single
+            # whitespace-delimited term, so test each distinct term once.
+            terms = columns.description_terms()
+            marked = np.fromiter(
+                (needle in term for term in terms.values), dtype=np.int64, count=len(terms.values)
+            )
+            prefix = np.concatenate(([0], np.cumsum(marked[columns.term_indices])))
+            has_text = prefix[columns.term_indptr[1:]] > prefix[columns.term_indptr[:-1]]
+        return has_text[self.rows]
+
+    @property
+    def description_lengths(self) -> "np.ndarray":
+        return self._columns.description_lengths[self.rows]
+
+    @property
+    def descriptions(self) -> List[str]:
+        """Description of every selected row."""
+
+        columns = self._columns
+        return [columns.descriptions[row] for row in self.rows.tolist()]
+
+    @property
+    def job_keys(self) -> List[str]:
+        """``provider:id`` of every selected row."""
+
+        columns = self._columns
+        return [f"{columns.providers[row]}:{columns.ids[row]}" for row in self.rows.tolist()]
+
+    def take(self, selector: "np.ndarray") -> "JobTable":
+        """Return a table over ``rows[selector]`` (boolean mask or positions)."""
+
+        return JobTable(self._columns, self.rows[selector])
+
+    # ------------------------------------------------------------------
+    # conversion back to listings
+
+    def __getitem__(self, position: int) -> JobListing:
+        return self._columns.listing(int(self.rows[position]))
+
+    def __iter__(self) -> Iterator[JobListing]:
+        for row in self.rows.tolist():
+            yield self._columns.listing(row)
+
+    def to_listings(self) -> List[JobListing]:
+        return list(self)
+
+
+class _Columns:
+    """Full-length column storage shared by every :class:`JobTable` view."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.companies = _Vocabulary()
+        self.locations = _Vocabulary()
+        self.roles = _Vocabulary()
+        self.skills = _Vocabulary()
+        self.providers: List[str] = []
+        self.ids: List[str] = []
+        self.descriptions: List[str] = []
+        self.apply_urls: List[Optional[str]] = []
+        self.requirements: List[Sequence[JobRequirement]] = []
+        self.technologies: List[Sequence[str]] = []
+        self.metadata: List[dict] = []
+        # Description term index, built lazily by :meth:`description_terms`.
+        self.terms: Optional[_Vocabulary] = None
+
+    @classmethod
+    def build(cls, jobs: Iterable[JobListing]) -> "_Columns":
+        columns = cls()
+        company_codes: List[int] = []
+        location_codes: List[int] = []
+        role_codes: List[int] = []
+        posted_at: List[int] = []
+        indptr: List[int] = [0]
+        indices: List[int] = []
+        for job in jobs:
+            columns.providers.append(job.provider)
+            columns.ids.append(job.id)
+            columns.descriptions.append(job.description)
+            columns.apply_urls.append(job.apply_url)
+            columns.requirements.append(job.requirements)
+            columns.technologies.append(job.technologies)
+            columns.metadata.append(job.metadata)
+            company_codes.append(columns.companies.encode(job.company))
+            location_codes.append(-1 if job.location is None else columns.locations.encode(job.location))
+            role_codes.append(columns.roles.encode(job.role))
+            posted_at.append(NO_DATE if job.posted_at is None else to_epoch_us(job.posted_at))
+            pool = {req.skill.lower() for req in job.requirements}
+            pool.update(tech.lower() for tech in job.technologies)
+            indices.extend(sorted(columns.skills.encode(skill) for skill in pool))
+            indptr.append(len(indices))
+
+        columns.size = len(columns.ids)
+        columns.company_codes = np.array(company_codes, dtype=np.int32)
+        columns.location_codes = np.array(location_codes, dtype=np.int32)
+        columns.role_codes = np.array(role_codes, dtype=np.int32)
+        columns.posted_at = np.array(posted_at, dtype=np.int64)
+        columns.skill_indptr = np.array(indptr, dtype=np.int64)
+        columns.skill_indices = np.array(indices, dtype=np.int32)
+        columns.description_lengths = np.fromiter(
+            (len(text) for text in columns.descriptions), dtype=np.int64, count=columns.size
+        )
+        return columns
+
+    def description_terms(self) -> _Vocabulary:
+        """Build (once) the CSR of lower-cased whitespace-delimited description terms."""
+
+        if self.terms is None:
+            terms = _Vocabulary()
+            codes = terms.codes
+            indptr: List[int] = [0]
+            indices: List[int] = []
+            for text in self.descriptions:
+                distinct = set(text.lower().split())
+                for term in distinct.difference(codes):
+                    codes[term] = len(terms.values)
+                    terms.values.append(term)
+                indices.extend(map(codes.__getitem__, distinct))
+                indptr.append(len(indices))
+            self.term_indptr = np.array(indptr, dtype=np.int64)
+            self.term_indices = np.array(indices, dtype=np.int32)
+            self.terms = terms
+        return self.terms
+
+    def scan_descriptions(self, needle: str) -> "np.ndarray":
+        """Substring search over every description in a single pass."""
+
+        lowered = [text.lower() for text in self.descriptions]
+        if "\x00" in needle:
+            return np.fromiter((needle in text for text in lowered), dtype=bool, count=self.size)
+        # Join on NUL and let each match consume the rest of its description,
+        # so there is at most one hit per row and none straddles two rows.
+        lengths = np.fromiter((len(text) + 1 for text in lowered), dtype=np.int64, count=self.size)
+        starts = np.zeros(self.size, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        blob = "\x00".join(lowered)
+        hits = [match.start() for match in re.finditer(re.escape(needle) + "[^\x00]*", blob)]
+        has_text = np.zeros(self.size, dtype=bool)
+        if hits:
+            has_text[np.searchsorted(starts, np.array(hits, dtype=np.int64), side="right") - 1] = True
+        return has_text
+
+    def listing(self, row: int) -> JobListing:
+        location_code = int(self.location_codes[row])
+        posted = int(self.posted_at[row])
+        return JobListing(
+            provider=self.providers[row],
+            id=self.ids[row],
+            company=self.companies.values[self.company_codes[row]],
+            role=self.roles.values[self.role_codes[row]],
+            location=None if location_code < 0 else self.locations.values[location_code],
+            description=self.descriptions[row],
+            requirements=self.requirements[row],
+            technologies=self.technologies[row],
+            apply_url=self.apply_urls[row],
+            posted_at=None if posted == NO_DATE else EPOCH + timedelta(microseconds=posted),
+            metadata=self.metadata[row],
+        )
+
+
+__all__ = ["EPOCH", "JobTable", "NO_DATE", "to_epoch_us"]
@@ -1,12 +1,35 @@
 import argparse
+import codecs
+import hashlib
+import heapq
 import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 
 
 ProfileDict = Dict[str, object]
 JobDict = Dict[str, object]
 
+# Characters read per refill when streaming a jobs file.
+_CHUNK_SIZE = 1 << 16
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Jobs per task when parsed jobs are sent to worker processes.
+_BATCH_SIZE = 4096
+
+# (score, tie key, overlap, job); a larger tie key means earlier in the file.
+Entry = Tuple[int, int, Set[str], JobDict]
+
 
 def load_profile(path: Path) -> Dict[str, object]:
     data = json.loads(path.read_text())
@@ -29,6 +52,92 @@ def load_jobs(path: Path) -> List[Dict[str, object]]:
     return json.loads(path.read_text())
 
 
+def iter_jobs(path: Path) -> Iterator[JobDict]:
+    """Yield the jobs of a JSON array or NDJSON file without loading it whole."""
+
+    for _, job in _iter_records(path):
+        yield job
+
+
+def _iter_records(path: Path) -> Iterator[Tuple[int, JobDict]]:
+    """Yield ``(byte offset, job)`` for every job of ``path``."""
+
+    # newline="" keeps "\r\n" intact so character counts map back to bytes.
+    with path.open(encoding="utf-8", newline="") as handle:
+        if _first_char(handle) == "[":
+            yield from _iter_json_array(handle)
+            return
+    with path.open("rb") as handle:
+        yield from _iter_ndjson(handle)
+
+
+def _first_char(handle: TextIO) -> str:
+    """First non-whitespace character of ``handle`` (``""`` if none); rewinds it."""
+
+    first = ""
+    while not first:
+        chunk = handle.read(1)
+        if not chunk:
+            break
+        first = chunk.strip()
+    handle.seek(0)
+    return first
+
+
+def _iter_json_array(handle: TextIO) -> Iterator[Tuple[int, JobDict]]:
+    buffer, pos, eof = "", 0, False
+    started = need_comma = False
+    # Byte offset of buffer[mark]; advanced lazily so each character is
+    # encoded once to track offsets.
+    mark, mark_offset = 0, 0
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError("jobs file must hold a JSON array")
+                started, pos = True, pos + 1
+                continue
+            if char == "]":
+                return
+            if need_comma:
+                if char != ",":
+                    raise ValueError(f"expected ',' between jobs, found {char!r}")
+                need_comma, pos = False, pos + 1
+                continue
+            try:
+                job, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value running up to the end of the buffer may continue in
+                # the next chunk (e.g. a number), so only trust it once more
+                # input follows or the file is exhausted.
+                if end < len(buffer) or eof:
+                    mark_offset += len(buffer[mark:pos].encode("utf-8"))
+                    mark = pos
+                    yield mark_offset, job
+                    pos, need_comma = end, True
+                    continue
+        elif eof:
+            raise ValueError("unexpected end of jobs file")
+        # Grow by at least the current size so a job larger than a chunk is
+        # re-decoded O(log size) times, not once per chunk.
+        chunk = handle.read(max(_CHUNK_SIZE, len(buffer) - pos))
+        mark_offset += len(buffer[mark:pos].encode("utf-8"))
+        buffer, pos, eof, mark = buffer[pos:] + chunk, 0, not chunk, 0
+
+
+def _iter_ndjson(handle: BinaryIO) -> Iterator[Tuple[int, JobDict]]:
+    offset = 0
+    for line in handle:
+        if line.strip():
+            yield offset, json.loads(line)
+        offset += len(line)
+
+
 def score_job(profile: Dict[str, object], job: Dict[str, object]) -> Tuple[int, Set[str]]:
     score = 0
     overlap: Set[str] = set()
@@ -53,15 +162,497 @@ def score_job(profile: Dict[str, object], job: Dict[str, object]) -> Tuple[int,
     return score, overlap
 
 
-def rank_jobs(profile: Dict[str, object], jobs: List[Dict[str, object]]) -> List[Tuple[int, Set[str], Dict[str, object]]]:
+def rank_jobs(
+    profile: Dict[str, object], jobs: List[Dict[str, object]], workers: int = 1
+) -> List[Tuple[int, Set[str], Dict[str, object]]]:
     scored_jobs = []
-    for job in jobs:
-        score, overlap = score_job(profile, job)
-        scored_jobs.append((score, overlap, job))
+    if workers > 1:
+        # Batches come back in submission order, so the stable sort below
+        # breaks ties exactly as the single-process path does.
+        batches = [jobs[start : start + _BATCH_SIZE] for start in range(0, len(jobs), _BATCH_SIZE)]
+        with _pool(profile, workers) as pool:
+            for batch, scores in zip(batches, pool.map(_score_batch, batches)):
+                scored_jobs.extend((score, overlap, job) for (score, overlap), job in zip(scores, batch))
+    else:
+        for job in jobs:
+            score, overlap = score_job(profile, job)
+            scored_jobs.append((score, overlap, job))
     scored_jobs.sort(key=lambda item: item[0], reverse=True)
     return scored_jobs
 
 
+def top_jobs(profile: Dict[str, object], jobs: Iterable[JobDict], k: int) -> List[Tuple[int, Set[str], JobDict]]:
+    """Return ``rank_jobs(profile, jobs)[:k]`` keeping only ``k`` jobs in memory."""
+
+    if k <= 0:
+        return []
+    heap: List[Entry] = []
+    for position, job in enumerate(jobs):
+        score, overlap = score_job(profile, job)
+        _push(heap, k, (score, -position, overlap, job))
+    return [(score, overlap, job) for score, _, overlap, job in _best(heap)]
+
+
+def _push(heap: List[Entry], k: int, entry: Entry) -> None:
+    # Min-heap on (score, tie key): the root is the entry to evict first, the
+    # lowest score and, on ties, the latest job, as the stable sort in
+    # rank_jobs keeps earlier jobs first.
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+
+def _best(entries: Iterable[Entry]) -> List[Entry]:
+    return sorted(entries, key=lambda entry: entry[:2], reverse=True)
+
+
+def top_jobs_parallel(profile: Dict[str, object], path: Path, k: int, workers: int) -> List[Tuple[int, Set[str], JobDict]]:
+    """Return ``top_jobs(profile, iter_jobs(path), k)`` computed on ``workers`` processes.
+
+    The profile reaches each worker once, through the pool initializer.  An
+    NDJSON file is split into line-aligned byte ranges (about four per
+    worker) that workers read, parse and score themselves, with the byte
+    offset of each line as the tie key.  A JSON array is parsed here and
+    sent in batches, at most two per worker in flight so memory stays
+    bounded, with the job position as the tie key.  Each task returns its
+    best ``k`` entries; merging them on (score, tie key) reproduces the
+    sequential order exactly.
+    """
+
+    if k <= 0:
+        return []
+    with path.open(encoding="utf-8") as handle:
+        is_array = _first_char(handle) == "["
+    with _pool(profile, workers) as pool:
+        if is_array:
+            parts: Iterable[List[Entry]] = _map_bounded(
+                pool, workers * 2, _top_of_batch, _numbered_batches(iter_jobs(path)), k
+            )
+        else:
+            ranges = _line_ranges(path, workers * 4)
+            parts = pool.map(
+                _top_of_range,
+                [str(path)] * len(ranges),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges],
+                [k] * len(ranges),
+            )
+        best = heapq.nlargest(k, chain.from_iterable(parts), key=lambda entry: entry[:2])
+    return [(score, overlap, job) for score, _, overlap, job in best]
+
+
+def _pool(profile: Dict[str, object], workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profile,))
+
+
+def _numbered_batches(jobs: Iterable[JobDict]) -> Iterator[Tuple[int, List[JobDict]]]:
+    jobs = iter(jobs)
+    start = 0
+    while True:
+        batch = list(islice(jobs, _BATCH_SIZE))
+        if not batch:
+            return
+        yield start, batch
+        start += len(batch)
+
+
+def _map_bounded(
+    pool: ProcessPoolExecutor,
+    limit: int,
+    function: Callable[..., List[Entry]],
+    items: Iterable[tuple],
+    k: int,
+) -> Iterator[List[Entry]]:
+    """``pool.map`` over ``items`` in order, submitting no more than ``limit`` ahead."""
+
+    pending: Deque = deque()
+    for item in items:
+        pending.append(pool.submit(function, *item, k))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _line_ranges(path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split ``path`` into up to ``parts`` byte ranges that start at line starts."""
+
+    size = path.stat().st_size
+    cuts = [0]
+    with path.open("rb") as handle:
+        for part in range(1, parts):
+            handle.seek(max(size * part // parts - 1, cuts[-1]))
+            handle.readline()
+            cut = handle.tell()
+            if cut >= size:
+                break
+            if cut > cuts[-1]:
+                cuts.append(cut)
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts, cuts[1:]) if stop > start]
+
+
+# Profile of a worker process, set once by ``_init_worker``.
+_profile: Optional[Dict[str, object]] = None
+
+
+def _init_worker(profile: Dict[str, object]) -> None:
+    global _profile
+    _profile = profile
+
+
+def _score_batch(jobs: List[JobDict]) -> List[Tuple[int, Set[str]]]:
+    return [score_job(_profile, job) for job in jobs]
+
+
+def _top_of_batch(start: int, jobs: List[JobDict], k: int) -> List[Entry]:
+    heap: List[Entry] = []
+    for position, job in enumerate(jobs, start):
+        score, overlap = score_job(_profile, job)
+        _push(heap, k, (score, -position, overlap, job))
+    return heap
+
+
+def _top_of_range(path: str, start: int, stop: int, k: int) -> List[Entry]:
+    heap: List[Entry] = []
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        offset = start
+        while offset < stop:
+            line = handle.readline()
+            if not line:
+                break
+            if line.strip():
+                job = json.loads(line)
+                score, overlap = score_job(_profile, job)
+                _push(heap, k, (score, -offset, overlap, job))
+            offset += len(line)
+    return heap
+
+
+# ----------------------------------------------------------------------
+# parsed-jobs cache
+
+CACHE_SUFFIX = ".rankcache"
+_CACHE_MAGIC = b"JRCACHE1"
+# source size, source mtime (ns), job count, source SHA-256, tech entries,
+# then the byte lengths of the path, location, title and technology blocks.
+_CACHE_HEADER = struct.Struct("<QqQ32sQQQQQ")
+
+
+class CachedJobs:
+    """Pre-normalized jobs of one jobs file, memory-mapped from its sidecar cache.
+
+    Locations (as written), titles and technologies (lower-cased) are
+    dictionary-encoded; per job the cache stores the location and title
+    codes, its distinct technology codes (CSR ``indptr``/``tech_codes``)
+    and the byte offset of its JSON record in the source.  Scoring reads
+    only these arrays; the JSON of the winning jobs is decoded from the
+    source afterwards.  The arrays are little-endian.
+    """
+
+    def __init__(self, source: Path, cache: Path) -> None:
+        self.source = source
+        with cache.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        view = self._view = memoryview(self._map)
+        if bytes(view[: len(_CACHE_MAGIC)]) != _CACHE_MAGIC:
+            raise ValueError(f"{cache} is not a job_ranker cache")
+        position = len(_CACHE_MAGIC)
+        (self.size, self.mtime_ns, self.count, self.digest, entries, *blocks) = _CACHE_HEADER.unpack_from(
+            view, position
+        )
+        position += _CACHE_HEADER.size
+        strings = []
+        for length in blocks:
+            # Each value is NUL-terminated, so split() leaves a trailing "".
+            strings.append(bytes(view[position : position + length]).decode("utf-8").split("\x00")[:-1])
+            position += length
+        (self.path,), self.locations, self.titles, self.technologies = strings
+        position += -position % 8
+        self.offsets = view[position : position + 8 * self.count].cast("q")
+        position += 8 * self.count
+        self.indptr = view[position : position + 8 * (self.count + 1)].cast("q")
+        position += 8 * (self.count + 1)
+        self.location_codes = view[position : position + 4 * self.count].cast("i")
+        position += 4 * self.count
+        self.title_codes = view[position : position + 4 * self.count].cast("i")
+        position += 4 * self.count
+        self.tech_codes = view[position : position + 4 * entries].cast("i")
+
+    def matches(self, path: Path, stat: os.stat_result) -> bool:
+        """Whether the cache describes ``path`` in its current state."""
+
+        return (
+            self.path == str(path.resolve())
+            and self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+            and self.digest == _file_digest(path)
+        )
+
+    def top(self, profile: Dict[str, object], k: int) -> List[Tuple[int, Set[str], JobDict]]:
+        """Same result as ``top_jobs(profile, iter_jobs(source), k)``."""
+
+        if k <= 0:
+            return []
+        # Every score_job test is evaluated once per distinct value.
+        wanted_locations = profile.get("locations", [])
+        location_points = [30 if value and value in wanted_locations else 0 for value in self.locations]
+        location_points.append(0)  # code -1: no location
+        roles = [role.lower() for role in profile.get("roles", []) or []]
+        title_points = [30 if any(role in title for role in roles) else 0 for title in self.titles]
+        skills = profile.get("skills", set())
+        skilled = [tech in skills for tech in self.technologies]
+
+        heap: List[Tuple[int, int]] = []
+        indptr, tech_codes = self.indptr, self.tech_codes
+        for position, (location, title) in enumerate(zip(self.location_codes, self.title_codes)):
+            score = location_points[location] + title_points[title]
+            for code in tech_codes[indptr[position] : indptr[position + 1]]:
+                if skilled[code]:
+                    score += 5
+            entry = (score, -position)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        ranked = []
+        with self.source.open("rb") as handle:
+            for score, position in sorted(heap, reverse=True):
+                position = -position
+                codes = tech_codes[indptr[position] : indptr[position + 1]]
+                overlap = {self.technologies[code] for code in codes if skilled[code]}
+                ranked.append((score, overlap, _decode_at(handle, self.offsets[position])))
+        return ranked
+
+    def close(self) -> None:
+        for view in (self.offsets, self.indptr, self.location_codes, self.title_codes, self.tech_codes):
+            view.release()
+        self._view.release()
+        self._map.close()
+
+
+def open_cached_jobs(path: Path) -> CachedJobs:
+    """Return the parsed-jobs cache of ``path``, rebuilding it when the source changed.
+
+    The cache lives next to the source as ``<name>.rankcache`` and is keyed by
+    the resolved path, size, modification time and SHA-256 of the source.
+    """
+
+    cache = path.with_name(path.name + CACHE_SUFFIX)
+    stat = path.stat()
+    if cache.exists():
+        try:
+            cached = CachedJobs(path, cache)
+        except (ValueError, struct.error, TypeError):
+            pass  # corrupt or from another version; rebuilt below
+        else:
+            if cached.matches(path, stat):
+                return cached
+            cached.close()
+    _write_cache(path, cache, stat)
+    return CachedJobs(path, cache)
+
+
+def _write_cache(path: Path, cache: Path, stat: os.stat_result) -> None:
+    digest = _file_digest(path)
+    locations: Dict[str, int] = {}
+    titles: Dict[str, int] = {}
+    technologies: Dict[str, int] = {}
+    offsets = array("q")
+    indptr = array("q", [0])
+    location_codes = array("i")
+    title_codes = array("i")
+    tech_codes = array("i")
+    for offset, job in _iter_records(path):
+        offsets.append(offset)
+        location = job.get("location")
+        location_codes.append(-1 if not location else locations.setdefault(location, len(locations)))
+        title = job.get("title", "").lower()
+        title_codes.append(titles.setdefault(title, len(titles)))
+        for tech in {tech.lower() for tech in job.get("technologies", [])}:
+            tech_codes.append(technologies.setdefault(tech, len(technologies)))
+        indptr.append(len(tech_codes))
+
+    blocks = [
+        "".join(value + "\x00" for value in values).encode("utf-8")
+        for values in ([str(path.resolve())], locations, titles, technologies)
+    ]
+    header = _CACHE_MAGIC + _CACHE_HEADER.pack(
+        stat.st_size, stat.st_mtime_ns, len(offsets), digest, len(tech_codes), *map(len, blocks)
+    )
+    body = header + b"".join(blocks)
+    body += b"\x00" * (-len(body) % 8)
+    for values in (offsets, indptr, location_codes, title_codes, tech_codes):
+        if sys.byteorder != "little":
+            values.byteswap()
+        body += values.tobytes()
+    partial = cache.with_name(cache.name + f".{os.getpid()}.tmp")
+    partial.write_bytes(body)
+    os.replace(partial, cache)
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _decode_at(handle: BinaryIO, offset: int) -> JobDict:
+    """Decode the JSON value starting at byte ``offset`` of ``handle``."""
+
+    size = _CHUNK_SIZE
+    while True:
+        handle.seek(offset)
+        data = handle.read(size)
+        # The incremental decoder holds back a multi-byte character cut at the end.
+        text = codecs.getincrementaldecoder("utf-8")().decode(data, final=len(data) < size)
+        try:
+            job, end = _DECODER.raw_decode(text)
+        except json.JSONDecodeError:
+            if len(data) < size:
+                raise
+        else:
+            if end < len(text) or len(data) < size:
+                return job
+        size *= 2
+
+
+# ----------------------------------------------------------------------
+# watch mode
+
+# Bytes read per refill when tailing a jobs file.
+_TAIL_CHUNK_SIZE = 1 << 20
+# Leading bytes of a watched file compared on each change to spot a rewrite.
+_HEAD_SIZE = 4096
+
+
+class JobWatcher:
+    """Live top-``k`` of an NDJSON jobs file that another process appends to.
+
+    Each :meth:`poll` reads only the complete lines written since the
+    previous poll and pushes them into a ``k``-sized heap, so an update
+    costs O(new records * log k) plus O(k log k) to diff the top jobs.  A
+    trailing line without its newline is left for the next poll.  A file
+    that is replaced, shrinks, or no longer starts with the bytes first read
+    or has no line break where the last read stopped, is read again from the
+    start and every previous top job is reported as left.
+    """
+
+    def __init__(self, profile: Dict[str, object], path: Path, k: int) -> None:
+        self.profile = profile
+        self.path = path
+        self.k = k
+        self.offset = 0
+        self._inode: Optional[int] = None
+        # (size, mtime) at the last poll; the content is only checked when it moves.
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._head = b""
+        self._heap: List[Entry] = []
+        self.top: List[Entry] = []
+
+    def poll(self) -> Tuple[List[Tuple[int, Entry]], List[Entry]]:
+        """Score newly appended jobs; return ``(entered, left)`` for the top jobs.
+
+        ``entered`` holds ``(rank, entry)`` pairs, rank 1 being the best job.
+        """
+
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return [], []
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if stamp == self._stamp and stat.st_ino == self._inode:
+            return [], []
+        previous = self.top
+        # Tie keys are byte offsets, only comparable within one version of the file.
+        rewritten = self._rewritten(stat)
+        if rewritten:
+            self._inode = stat.st_ino
+            self.offset = 0
+            self._head = b""
+            self._heap = []
+        if stat.st_size > self.offset:
+            self._read_appended()
+        self._stamp = stamp
+
+        self.top = _best(self._heap)
+        before = set() if rewritten else {entry[1] for entry in previous}
+        after = {entry[1] for entry in self.top}
+        entered = [(rank, entry) for rank, entry in enumerate(self.top, 1) if entry[1] not in before]
+        left = list(previous) if rewritten else [entry for entry in previous if entry[1] not in after]
+        return entered, left
+
+    def _rewritten(self, stat: os.stat_result) -> bool:
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            return True
+        if not self.offset:
+            return False
+        with self.path.open("rb") as handle:
+            head = handle.read(len(self._head))
+            handle.seek(self.offset - 1)
+            return head != self._head or handle.read(1) != b"\n"
+
+    def _read_appended(self) -> None:
+        with self.path.open("rb") as handle:
+            if not self.offset:
+                self._head = handle.read(_HEAD_SIZE)
+            handle.seek(self.offset)
+            pending = b""
+            while True:
+                block = handle.read(_TAIL_CHUNK_SIZE)
+                if not block:
+                    break
+                pending += block
+                end = pending.rfind(b"\n") + 1
+                for line in pending[:end].split(b"\n")[:-1]:
+                    self._add_line(line)
+                    self.offset += len(line) + 1
+                pending = pending[end:]
+
+    def _add_line(self, line: bytes) -> None:
+        if not line.strip() or self.k <= 0:
+            return
+        if self.offset == 0 and line.lstrip().startswith(b"["):
+            raise ValueError(f"{self.path} is a JSON array; --watch needs an NDJSON jobs file")
+        try:
+            job = json.loads(line)
+        except ValueError:
+            print(f"Skipping malformed job at byte {self.offset} of {self.path}", file=sys.stderr)
+            return
+        score, overlap = score_job(self.profile, job)
+        _push(self._heap, self.k, (score, -self.offset, overlap, job))
+
+
+def watch_jobs(
+    profile: Dict[str, object], path: Path, k: int, out: TextIO, interval: float = 1.0
+) -> None:
+    """Poll ``path`` every ``interval`` seconds and write top-``k`` changes as NDJSON."""
+
+    watcher = JobWatcher(profile, path, k)
+    while True:
+        entered, left = watcher.poll()
+        for score, _, overlap, job in left:
+            out.write(json.dumps({"event": "left", "score": score, "overlap": sorted(overlap), "job": job}) + "\n")
+        for rank, (score, _, overlap, job) in entered:
+            out.write(
+                json.dumps({"event": "entered", "rank": rank, "score": score, "overlap": sorted(overlap), "job": job})
+                + "\n"
+            )
+        if entered or left:
+            out.flush()
+        time.sleep(interval)
+
+
+def write_ndjson(ranked_jobs: Iterable[Tuple[int, Set[str], JobDict]], out: TextIO) -> None:
+    for score, overlap, job in ranked_jobs:
+        out.write(json.dumps({"score": score, "overlap": sorted(overlap), "job": job}) + "\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Rank job postings against a profile")
     parser.add_argument(
@@ -76,11 +667,67 @@ def main() -> None:
         default=Path("examples/sample_jobs.json"),
         help="Path to the jobs JSON file",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read the jobs file (JSON array or NDJSON) incrementally and write the top jobs as NDJSON",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Number of jobs kept in --stream and --watch mode")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"In --stream mode, keep pre-parsed jobs in a '<jobs>{CACHE_SUFFIX}' file next to the jobs file",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to score jobs",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Tail an NDJSON jobs file and write changes to the top jobs as NDJSON events",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls of the jobs file in --watch mode",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="NDJSON output file for --stream (default: standard output)",
+    )
     args = parser.parse_args()
 
     profile = load_profile(args.profile)
+    if args.watch:
+        try:
+            watch_jobs(profile, args.jobs, args.top, sys.stdout, args.interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.stream:
+        if args.cache:
+            cached = open_cached_jobs(args.jobs)
+            ranked = cached.top(profile, args.top)
+            cached.close()
+        elif args.workers > 1:
+            ranked = top_jobs_parallel(profile, args.jobs, args.top, args.workers)
+        else:
+            ranked = top_jobs(profile, iter_jobs(args.jobs), args.top)
+        if args.output is None:
+            write_ndjson(ranked, sys.stdout)
+        else:
+            with args.output.open("w", encoding="utf-8") as out:
+                write_ndjson(ranked, out)
+        return
+
     jobs = load_jobs(args.jobs)
-    ranked_jobs = rank_jobs(profile, jobs)
+    ranked_jobs = rank_jobs(profile, jobs, args.workers)
 
     print(f"Profile loaded for: {profile['name']}")
     print("\nTop matches:\n")
@@ -1,10 +1,14 @@
 """Demonstration CLI for the Internship Bot pipeline."""
 from __future__ import annotations
 
+import argparse
 from datetime import datetime
+from pathlib import Path
 from pprint import pprint
+from typing import Optional
 
 from internship_bot.aggregator import JobAggregator
+from internship_bot.connectors.cache import DEFAULT_CACHE_PATH, ResponseCache
 from internship_bot.connectors.indeed import IndeedConnector
 from internship_bot.connectors.linkedin import LinkedInConnector
 from internship_bot.connectors.scraper import CustomHTMLScraper
@@ -30,14 +34,14 @@ SAMPLE_HTML = [
 ]
 
 
-def run_demo() -> None:
+def run_demo(cache: Optional[ResponseCache] = None, top: int = 10) -> None:
     connectors = [
-        LinkedInConnector(),
+        LinkedInConnector(cache=cache),
         IndeedConnector(),
         WellfoundConnector(),
-        CustomHTMLScraper(provider_name="MLCollective", html_pages=SAMPLE_HTML),
+        CustomHTMLScraper(provider_name="MLCollective", html_pages=SAMPLE_HTML, cache=cache),
     ]
-    aggregator = JobAggregator(connectors)
+    aggregator = JobAggregator(connectors, concurrent=True, timeout=15.0)
     ranker = Ranker()
 
     resume = ResumeProfile(
@@ -50,7 +54,7 @@ def run_demo() -> None:
     )
 
     jobs = aggregator.search_jobs("software engineering")
-    ranked_jobs = ranker.rank(jobs, resume)
+    ranked_jobs = ranker.rank_top_k(jobs, resume, k=top)
 
     for ranked in ranked_jobs:
         pprint(
@@ -64,5 +68,35 @@ def run_demo() -> None:
         )
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate and rank internship listings")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Path to the on-disk HTTP response cache",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the response cache entirely",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of best-matching listings to print",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cache TTLs and re-fetch every provider",
+    )
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else ResponseCache(args.cache, refresh=args.refresh)
+    run_demo(cache, top=args.top)
+
+
 if __name__ == "__main__":
-    run_demo()
+    main()
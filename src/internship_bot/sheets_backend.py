@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional
 
 import gspread
 from google.oauth2.service_account import Credentials
@@ -16,12 +19,30 @@ SCOPE = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# Row number of the first cell in an A1 range such as "'applications'!A7:O7".
+_RANGE_ROW = re.compile(r"!\$?[A-Z]+\$?(\d+)")
+# 1-based column holding the application ID.
+_ID_COLUMN = [col.key for col in default_columns()].index("application_id") + 1
+
 
 class SheetsBackend:
     """Wrapper around Google Sheets operations for the bot."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        cache_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.settings = settings
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Row cache: sheet row number -> row, in sheet order, plus an
+        # application_id -> row numbers index.  ``None`` means not loaded.
+        self._rows: Optional[Dict[int, ApplicationRow]] = None
+        self._index: Dict[str, List[int]] = {}
+        self._loaded_at = 0.0
         self._client = self._create_client()
         self._worksheet = self._get_or_create_worksheet()
 
@@ -51,43 +72,111 @@ class SheetsBackend:
         headers = [col.header for col in default_columns()]
         worksheet.update("1:1", [headers])
 
+    # ------------------------ row cache ------------------------
+
+    def refresh(self) -> None:
+        """Reload the row cache from the worksheet."""
+
+        with self._lock:
+            self._load()
+
+    def _cached_rows(self) -> Dict[int, ApplicationRow]:
+        # Callers hold self._lock.
+        if self._rows is None or self._clock() - self._loaded_at >= self.cache_ttl:
+            self._load()
+        return self._rows
+
+    def _load(self) -> None:
+        keys = [col.key for col in default_columns()]
+        rows: Dict[int, ApplicationRow] = {}
+        self._index = {}
+        values = self._worksheet.get_all_values()
+        for row_number, cells in enumerate(values[1:], start=2):
+            record = dict(zip(keys, cells))
+            if not record.get("company"):
+                continue
+            self._store(rows, row_number, self._parse_row(record))
+        self._rows = rows
+        self._loaded_at = self._clock()
+
+    @staticmethod
+    def _parse_row(record: Dict[str, str]) -> ApplicationRow:
+        fields = ApplicationRow.__fields__
+        return ApplicationRow(
+            **{
+                key: None if value == "" and not fields[key].required else value
+                for key, value in record.items()
+            }
+        )
+
+    def _store(self, rows: Dict[int, ApplicationRow], row_number: int, row: ApplicationRow) -> None:
+        previous = rows.get(row_number)
+        if previous is not None and previous.application_id != row.application_id:
+            self._index[previous.application_id].remove(row_number)
+        if previous is None or previous.application_id != row.application_id:
+            self._index.setdefault(row.application_id, []).append(row_number)
+        rows[row_number] = row
+
     # ------------------------ public API ------------------------
 
     def log_attempt(self, attempt: ApplicationAttempt) -> ApplicationRow:
         row = ApplicationRow.from_attempt(attempt)
-        self._worksheet.append_row(row.dict().values())
+        with self._lock:
+            self._append(row)
         return row
 
+    def _append(self, row: ApplicationRow) -> None:
+        response = self._worksheet.append_row(list(row.dict().values()))
+        if self._rows is None:
+            return
+        updated_range = (response or {}).get("updates", {}).get("updatedRange", "")
+        match = _RANGE_ROW.search(updated_range)
+        if match is None:
+            # The new row's position is unknown; reload on next access.
+            self._rows = None
+            return
+        self._store(self._rows, int(match.group(1)), row)
+
     def list_rows(self) -> List[ApplicationRow]:
-        records = self._worksheet.get_all_records()
-        return [ApplicationRow(**record) for record in records if record.get("Company")]
+        with self._lock:
+            return list(self._cached_rows().values())
 
     def find_duplicates(self, attempt: ApplicationAttempt) -> List[ApplicationRow]:
         target_id = attempt.application_id()
-        matches: List[ApplicationRow] = []
-        for row in self.list_rows():
-            if row.application_id == target_id:
-                matches.append(row)
-        return matches
+        with self._lock:
+            rows = self._cached_rows()
+            return [rows[row_number] for row_number in self._index.get(target_id, [])]
 
     def upsert_attempt(self, attempt: ApplicationAttempt) -> ApplicationRow:
         """Update an existing row if duplicate, otherwise append a new one."""
 
-        matches = self.find_duplicates(attempt)
-        if not matches:
-            return self.log_attempt(attempt)
-
         updated_row = ApplicationRow.from_attempt(attempt)
-        target_row = matches[0]
-        cell = self._worksheet.find(target_row.application_id)
-        if cell is None:
-            # Shouldn't happen, fallback to append
-            return self.log_attempt(attempt)
-        row_idx = cell.row
-        values = list(updated_row.dict().values())
-        self._worksheet.update(f"{row_idx}:{row_idx}", [values])
+        with self._lock:
+            self._cached_rows()
+            matches = self._index.get(updated_row.application_id)
+            row_idx = self._current_row(matches[0], updated_row.application_id) if matches else None
+            if row_idx is None:
+                self._append(updated_row)
+                return updated_row
+            values = list(updated_row.dict().values())
+            self._worksheet.update(f"{row_idx}:{row_idx}", [values])
+            self._store(self._rows, row_idx, updated_row)
         return updated_row
 
+    def _current_row(self, row_number: int, application_id: str) -> Optional[int]:
+        """Return the row now holding ``application_id``, trying the cached ``row_number`` first.
+
+        Rows may have been sorted, inserted or deleted in the shared sheet
+        since the cache was loaded, so the cached position is checked before
+        it is written to; on a mismatch the cache is reloaded.
+        """
+
+        if self._worksheet.cell(row_number, _ID_COLUMN).value == application_id:
+            return row_number
+        self._load()
+        matches = self._index.get(application_id)
+        return matches[0] if matches else None
+
 
 def rows_to_table(rows: Iterable[ApplicationRow]) -> List[List[str]]:
     """Helper for presenting rows in tabular dashboards."""
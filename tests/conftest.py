@@ -1,7 +1,79 @@
+import json
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+import internship_bot  # noqa: E402
+
+# ``src/internship_bot`` shadows the top-level package holding the connectors,
+# aggregator and ranker.  Their module names do not overlap, so serve both
+# directories from the one ``internship_bot`` package.
+TOP_LEVEL = str(ROOT / "internship_bot")
+if TOP_LEVEL not in internship_bot.__path__:
+    internship_bot.__path__.append(TOP_LEVEL)
+
+
+class StubServer:
+    """Local HTTP server whose responses come from a ``respond(params)`` callable.
+
+    ``respond`` receives the query parameters of each GET and returns
+    ``(status, headers, payload)``; every request's parameters are kept in
+    ``requests``.
+    """
+
+    def __init__(self, respond) -> None:
+        self.respond = respond
+        self.requests = []
+        self.headers = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                params = dict(parse_qsl(urlsplit(self.path).query))
+                stub.requests.append(params)
+                stub.headers.append(dict(self.headers))
+                status, headers, payload = stub.respond(params)
+                # A 304 carries no body; the client keeps its cached copy.
+                body = b"" if status == 304 else json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:  # noqa: A002
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/jobs"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(respond) -> StubServer:
+        server = StubServer(respond)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from internship_bot.aggregator import JobAggregator
+from internship_bot.connectors.base import JobConnector
+from internship_bot.connectors.linkedin import LinkedInConnector
+from internship_bot.connectors.scraper import CustomHTMLScraper
+from internship_bot.connectors.wellfound import WellfoundConnector
+from internship_bot.crawl_state import CrawlState
+from internship_bot.job_index import JobIndex
+from internship_bot.relevance import RelevanceIndex
+from internship_bot.schemas import JobListing
+
+
+def _listing(provider: str, index: int, posted_at: Optional[datetime] = None) -> JobListing:
+    return JobListing(
+        provider=provider,
+        id=str(index),
+        company="Acme",
+        role="Software Engineering Intern",
+        location="Remote",
+        description="Build Python services.",
+        technologies=["python"],
+        posted_at=posted_at,
+    )
+
+
+class ListConnector(JobConnector):
+    def __init__(self, provider_name: str, jobs: List[JobListing], delay: float = 0.0) -> None:
+        super().__init__(provider_name=provider_name)
+        self.jobs = jobs
+        self.delay = delay
+
+    def fetch_jobs(self, query: str) -> Iterable[JobListing]:
+        time.sleep(self.delay)
+        return list(self.jobs)
+
+
+def test_fan_out_reports_each_connectors_own_elapsed_time() -> None:
+    slow = ListConnector("Slow", [_listing("Slow", 1)], delay=0.4)
+    fast = ListConnector("Fast", [_listing("Fast", 1)])
+    aggregator = JobAggregator([slow, fast], concurrent=True)
+
+    jobs = aggregator.search_jobs("intern")
+
+    assert [job.provider for job in jobs] == ["Slow", "Fast"]
+    slow_outcome, fast_outcome = aggregator.last_outcomes
+    assert slow_outcome.elapsed >= 0.4
+    assert fast_outcome.elapsed < 0.2
+
+
+def test_partial_crawl_does_not_advance_the_high_water_mark(stub_server, tmp_path) -> None:
+    # Pages after the first hang until released, so the first crawl times out.
+    released = threading.Event()
+
+    def respond(params):
+        start, count = int(params["start"]), int(params["count"])
+        if start > 0:
+            released.wait(timeout=5)
+        elements = [
+            {"id": index, "title": "Intern", "listedAt": 1_700_000_000_000 - index * 60_000}
+            for index in range(start, min(start + count, 60))
+        ]
+        return 200, {}, {"elements": elements, "paging": {"total": 60}}
+
+    server = stub_server(respond)
+    connector = LinkedInConnector(server.url, token="secret", page_size=10, timeout=0.5)
+    state = CrawlState(tmp_path / "state.sqlite3")
+    aggregator = JobAggregator([connector], concurrent=True, incremental=True, state=state)
+
+    first = aggregator.search_jobs("intern")
+    assert len(first) == 10 and aggregator.last_outcomes[0].timed_out
+    assert state.high_water_mark("LinkedIn", "intern") is None
+
+    released.set()
+    second = aggregator.search_jobs("intern")
+    assert sorted(int(job.id) for job in second) == list(range(10, 60))
+    assert state.high_water_mark("LinkedIn", "intern") == max(job.posted_at for job in first)
+    assert aggregator.search_jobs("intern") == []
+
+
+def test_stopped_stream_does_not_advance_the_high_water_mark(tmp_path) -> None:
+    posted = [datetime(2026, 1, day) for day in range(1, 6)]
+    connector = ListConnector("Board", [_listing("Board", day, at) for day, at in enumerate(posted)])
+    state = CrawlState(tmp_path / "state.sqlite3")
+    aggregator = JobAggregator([connector], incremental=True, state=state)
+
+    stream = aggregator.iter_jobs("intern")
+    next(stream)
+    stream.close()
+    assert state.high_water_mark("Board", "intern") is None
+
+    assert len(list(aggregator.iter_jobs("intern"))) == 4
+    assert state.high_water_mark("Board", "intern") == max(posted)
+
+
+def test_incremental_runs_return_unchanged_listings_once(tmp_path) -> None:
+    card = '<div class="job-card"><h2 class="job-title">{}</h2><span class="company">Acme</span></div>'
+    scraper = CustomHTMLScraper("Board", [card.format("Backend Intern") + card.format("Data Intern")])
+    state = CrawlState(tmp_path / "state.sqlite3")
+    aggregator = JobAggregator([scraper, WellfoundConnector()], incremental=True, state=state)
+
+    first = aggregator.search_jobs("python")
+    assert [job.role for job in first] == ["Backend Intern", "Data Intern", "Python Platform Intern"]
+    for _ in range(3):
+        assert aggregator.search_jobs("python") == []
+
+    scraper.html_pages = [card.format("Backend Intern") + card.format("ML Intern")]
+    assert [job.role for job in aggregator.search_jobs("python")] == ["ML Intern"]
+
+
+def test_iter_jobs_feeds_both_indexes(tmp_path) -> None:
+    jobs = [_listing("Board", index) for index in range(1_200)]
+    index = JobIndex(tmp_path / "index.sqlite3")
+    relevance = RelevanceIndex(tmp_path / "relevance.sqlite3")
+    aggregator = JobAggregator([ListConnector("Board", jobs)], index=index, relevance=relevance)
+
+    assert len(list(aggregator.iter_jobs("intern"))) == len(jobs)
+    assert len(index) == len(relevance) == len(jobs)
+    assert index.doc_id(jobs[-1]) is not None
+
+
+class AsyncConnector(JobConnector):
+    def __init__(self, provider_name: str, jobs: List[JobListing], stall: float = 0.0, timeout=None) -> None:
+        super().__init__(provider_name=provider_name, timeout=timeout)
+        self.jobs = jobs
+        self.stall = stall
+        self.loops = []
+        self.since = []
+
+    def fetch_jobs(self, query: str) -> Iterable[JobListing]:
+        raise AssertionError("async connectors are driven through afetch_jobs")
+
+    async def afetch_jobs(self, query: str, since=None):
+        self.loops.append(asyncio.get_running_loop())
+        self.since.append(since)
+        for job in self.jobs:
+            yield job
+        await asyncio.sleep(self.stall)
+
+
+def test_async_connectors_share_one_loop_and_keep_partial_results(tmp_path) -> None:
+    posted = datetime(2026, 1, 5)
+    quick = AsyncConnector("Quick", [_listing("Quick", 1, posted)], stall=0.2)
+    stuck = AsyncConnector("Stuck", [_listing("Stuck", 1), _listing("Stuck", 2)], stall=30, timeout=0.5)
+    state = CrawlState(tmp_path / "state.sqlite3")
+    aggregator = JobAggregator([quick, stuck], concurrent=True, incremental=True, state=state)
+
+    started = time.monotonic()
+    jobs = aggregator.search_jobs("intern")
+    assert time.monotonic() - started < 2
+
+    assert [(job.provider, job.id) for job in jobs] == [("Quick", "1"), ("Stuck", "1"), ("Stuck", "2")]
+    quick_outcome, stuck_outcome = aggregator.last_outcomes
+    assert not quick_outcome.partial and 0.2 <= quick_outcome.elapsed < 0.5
+    assert stuck_outcome.timed_out and len(stuck_outcome.jobs) == 2
+    assert quick.loops[0] is stuck.loops[0]
+
+    # The incremental watermark reaches afetch_jobs.
+    aggregator.search_jobs("intern")
+    assert quick.since == [None, posted]
+
+    stuck.timeout = 0.3
+    streamed = [(job.provider, job.id) for job in JobAggregator([quick, stuck]).iter_jobs("intern")]
+    assert sorted(streamed) == [("Quick", "1"), ("Stuck", "1"), ("Stuck", "2")]
+
+
+def test_iter_jobs_yields_fast_connectors_before_slow_ones_finish() -> None:
+    slow = ListConnector("Slow", [_listing("Slow", 1)], delay=0.5)
+    fast = ListConnector("Fast", [_listing("Fast", index) for index in range(3)])
+    aggregator = JobAggregator([slow, fast])
+
+    started = time.monotonic()
+    arrivals = [(job.provider, time.monotonic() - started) for job in aggregator.iter_jobs("intern")]
+
+    assert [provider for provider, _ in arrivals] == ["Fast", "Fast", "Fast", "Slow"]
+    assert arrivals[2][1] < 0.3 <= arrivals[3][1]
+
+
+def test_iter_jobs_max_seen_bounds_the_dedup_set() -> None:
+    keys = [0, 1, 2, 0, 3, 2]
+    connector = ListConnector("Board", [_listing("Board", key) for key in keys])
+
+    unbounded = [job.id for job in JobAggregator([connector]).iter_jobs("intern")]
+    bounded = [job.id for job in JobAggregator([connector]).iter_jobs("intern", max_seen=2)]
+
+    assert unbounded == ["0", "1", "2", "3"]
+    # Only the two most recent keys are remembered, so evicted keys come back.
+    assert bounded == ["0", "1", "2", "0", "3", "2"]
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from internship_bot.dedup import NearDuplicateDetector
+from internship_bot.schemas import JobListing, JobRequirement
+
+DESCRIPTION = (
+    "Build data pipelines in Python and SQL with the platform team, "
+    "own ingestion jobs end to end and ship dashboards for analysts."
+)
+
+
+def _listing(provider, job_id, *, company="Acme Inc", location="New York, NY", **overrides):
+    fields = dict(
+        provider=provider,
+        id=job_id,
+        company=company,
+        role="Data Engineering Intern",
+        location=location,
+        description=DESCRIPTION,
+    )
+    fields.update(overrides)
+    return JobListing(**fields)
+
+
+def test_cross_provider_copies_merge_with_provenance() -> None:
+    first = _listing("LinkedIn", "1", requirements=[JobRequirement("Python")], posted_at=datetime(2026, 1, 2))
+    second = _listing(
+        "Wellfound",
+        "w1",
+        company="ACME",
+        location="New York NY",
+        apply_url="https://example.com/apply",
+        technologies=["airflow"],
+        requirements=[JobRequirement("python"), JobRequirement("SQL")],
+        posted_at=datetime(2026, 1, 5),
+    )
+    third = _listing("Scraper", "s1", location=None)
+
+    merged = NearDuplicateDetector().merge([first, second, third])
+
+    assert merged == [first]
+    assert first.metadata["providers"] == ["LinkedIn", "Wellfound", "Scraper"]
+    assert first.metadata["duplicates"] == ["Wellfound:w1", "Scraper:s1"]
+    assert first.apply_url == "https://example.com/apply"
+    assert list(first.technologies) == ["airflow"]
+    assert [req.skill for req in first.requirements] == ["Python", "SQL"]
+    assert first.posted_at == datetime(2026, 1, 5)
+
+
+def test_same_provider_postings_are_not_merged() -> None:
+    jobs = [_listing("LinkedIn", "1"), _listing("LinkedIn", "2")]
+
+    assert NearDuplicateDetector().merge(jobs) == jobs
+    assert "duplicates" not in jobs[0].metadata
+
+
+def test_provider_already_folded_in_is_not_merged_again() -> None:
+    jobs = [_listing("LinkedIn", "1"), _listing("Wellfound", "w1"), _listing("Wellfound", "w2")]
+
+    merged = NearDuplicateDetector().merge(jobs)
+
+    assert merged == [jobs[0], jobs[2]]
+    assert jobs[0].metadata["duplicates"] == ["Wellfound:w1"]
+
+
+def test_different_location_or_company_is_not_merged() -> None:
+    base = _listing("LinkedIn", "1")
+    elsewhere = _listing("Wellfound", "w1", location="Boston, MA")
+    other_company = _listing("Wellfound", "w2", company="Globex")
+
+    merged = NearDuplicateDetector().merge([base, elsewhere, other_company])
+
+    assert merged == [base, elsewhere, other_company]
+    assert "providers" not in base.metadata
+
+
+def test_filter_stream_folds_late_duplicates_into_yielded_listing() -> None:
+    first = _listing("LinkedIn", "1")
+    stream = NearDuplicateDetector().filter_stream(iter([first, _listing("Wellfound", "w1")]))
+
+    assert next(stream) is first
+    assert list(stream) == []
+    assert first.metadata["duplicates"] == ["Wellfound:w1"]
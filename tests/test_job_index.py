@@ -0,0 +1,89 @@
+import sqlite3
+from datetime import datetime
+
+from internship_bot.job_index import DESCRIPTION, JobIndex
+from internship_bot.ranker import Ranker
+from internship_bot.schemas import JobListing, ResumeProfile
+
+NOW = datetime(2026, 1, 15)
+RESUME = ResumeProfile(
+    name="Sam",
+    graduation_date=datetime(2027, 5, 15),
+    skills=["Python", "SQL", "React"],
+    preferred_locations=["Remote"],
+    target_role_keywords=["backend"],
+)
+
+
+def _jobs(count: int):
+    return [
+        JobListing(
+            provider="Board",
+            id=str(index),
+            company="Acme",
+            role="Data Intern" if index % 2 else "Frontend Intern",
+            location="Austin, TX",
+            description="Ship features with the team.",
+            technologies=["python"] if index % 7 == 0 else ["go"],
+            posted_at=datetime(2026, 1, 1 + index % 14),
+        )
+        for index in range(count)
+    ]
+
+
+def _ranking(results):
+    return [(result.job.id, result.score) for result in results]
+
+
+def test_listings_edited_after_indexing_are_not_pruned(tmp_path) -> None:
+    jobs = _jobs(300)
+    index = JobIndex(tmp_path / "index.sqlite3")
+    index.add(jobs)
+    edited = jobs[150]
+    edited.role = "Backend Intern"
+    edited.location = "Remote"
+    edited.technologies.extend(["sql", "react"])
+    ranker = Ranker(clock=lambda: NOW)
+
+    expected = _ranking(ranker.rank_top_k(jobs, RESUME, 5))
+    assert expected[0][0] == "150"
+    assert index.doc_id(edited) is None
+    assert _ranking(ranker.rank_top_k(jobs, RESUME, 5, index=index)) == expected
+    assert ranker.last_pruned > 0
+    assert _ranking(ranker.rank(jobs, RESUME, min_score=20, index=index)) == _ranking(
+        ranker.rank(jobs, RESUME, min_score=20)
+    )
+
+    index.add([edited])
+    assert index.doc_id(edited) is not None
+    reopened = JobIndex(tmp_path / "index.sqlite3")
+    assert reopened.doc_id(edited) == index.doc_id(edited)
+    assert _ranking(ranker.rank_top_k(jobs, RESUME, 5, index=reopened)) == expected
+
+
+def _posting_sizes(path):
+    with sqlite3.connect(str(path)) as conn:
+        return dict(((kind, term), len(docs)) for kind, term, docs in conn.execute("SELECT kind, term, docs FROM postings"))
+
+
+def test_re_adding_listings_does_not_grow_postings(tmp_path) -> None:
+    path = tmp_path / "index.sqlite3"
+    index = JobIndex(path)
+    assert index.add(_jobs(50)) == 50
+    sizes = _posting_sizes(path)
+
+    for run in range(5):
+        # Fresh objects with a new fetch time and URL, as connectors return them.
+        jobs = _jobs(50)
+        for job in jobs:
+            job.posted_at = datetime(2026, 2, 1 + run)
+            job.apply_url = f"https://example.com/{run}/{job.id}"
+        assert index.add(jobs) == 0
+        assert JobIndex(path).add(jobs) == 0
+    assert _posting_sizes(path) == sizes
+
+    changed = _jobs(50)[7]
+    changed.description = "Ship features with the data team."
+    assert index.add([changed]) == 1
+    # Only the new term gains a document; the others already hold it.
+    assert _posting_sizes(path) == {**sizes, (DESCRIPTION, "data"): 8}
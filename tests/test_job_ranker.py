@@ -0,0 +1,178 @@
+import json
+import os
+from pathlib import Path
+
+import job_ranker
+
+PROFILE = {
+    "name": "Sam",
+    "skills": {"python", "sql", "react"},
+    "locations": ["Remote"],
+    "roles": ["backend"],
+}
+
+
+def _jobs(count: int):
+    techs = [["Python", "SQL"], ["React"], ["Go"], ["python", "React", "SQL"]]
+    return [
+        {
+            "id": index,
+            "title": "Backend Intern" if index % 3 == 0 else "Data Intern",
+            "location": "Remote" if index % 2 else "Austin, TX",
+            "technologies": techs[index % len(techs)],
+            "notes": "line one\nline \"two\" [x], {y}" * (index % 4),
+        }
+        for index in range(count)
+    ]
+
+
+def test_iter_jobs_streams_arrays_across_chunk_boundaries(tmp_path: Path, monkeypatch) -> None:
+    jobs = _jobs(50)
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(jobs, indent=2))
+    monkeypatch.setattr(job_ranker, "_CHUNK_SIZE", 7)
+
+    assert list(job_ranker.iter_jobs(path)) == jobs
+
+    ndjson = tmp_path / "jobs.ndjson"
+    ndjson.write_text("".join(json.dumps(job) + "\n\n" for job in jobs))
+    assert list(job_ranker.iter_jobs(ndjson)) == jobs
+
+
+def test_top_jobs_matches_rank_jobs_prefix() -> None:
+    jobs = _jobs(200)
+    expected = job_ranker.rank_jobs(PROFILE, jobs)
+
+    for k in (1, 5, 37, 500):
+        top = job_ranker.top_jobs(PROFILE, iter(jobs), k)
+        assert [(score, job["id"]) for score, _, job in top] == [
+            (score, job["id"]) for score, _, job in expected[:k]
+        ]
+
+
+def test_stream_mode_writes_ndjson(tmp_path: Path, monkeypatch) -> None:
+    profile = tmp_path / "profile.json"
+    profile.write_text(
+        json.dumps({"name": "Sam", "skills": ["Python", "SQL"], "preferences": {"role_types": ["Backend"]}})
+    )
+    jobs = tmp_path / "jobs.json"
+    jobs.write_text(json.dumps(_jobs(20)))
+    output = tmp_path / "top.ndjson"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["job_ranker.py", "--profile", str(profile), "--jobs", str(jobs), "--stream", "--top", "3",
+         "--output", str(output)],
+    )
+
+    job_ranker.main()
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["job"]["id"] for line in lines] == [0, 3, 12]
+    assert lines[0] == {"score": 40, "overlap": ["python", "sql"], "job": _jobs(1)[0]}
+
+
+def test_workers_give_the_same_ranking(tmp_path: Path, monkeypatch) -> None:
+    jobs = _jobs(300)
+    monkeypatch.setattr(job_ranker, "_BATCH_SIZE", 17)
+    expected = job_ranker.rank_jobs(PROFILE, jobs)
+    assert job_ranker.rank_jobs(PROFILE, jobs, workers=2) == expected
+
+    array = tmp_path / "jobs.json"
+    array.write_text(json.dumps(jobs))
+    ndjson = tmp_path / "jobs.ndjson"
+    ndjson.write_text("".join(json.dumps(job) + "\n" for job in jobs))
+    for path in (array, ndjson):
+        assert job_ranker.top_jobs_parallel(PROFILE, path, 25, workers=3) == expected[:25]
+
+
+def test_cache_is_reused_and_rebuilt_when_the_source_changes(tmp_path: Path, monkeypatch) -> None:
+    jobs = _jobs(60)
+    jobs[5]["title"] = "Backend Ingénieur Intern"
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(jobs, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    cached = job_ranker.open_cached_jobs(path)
+    assert cached.top(PROFILE, 8) == job_ranker.top_jobs(PROFILE, iter(jobs), 8)
+    cached.close()
+
+    def no_parsing(path):
+        raise AssertionError("warm run decoded the jobs file")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(job_ranker, "_iter_records", no_parsing)
+        cached = job_ranker.open_cached_jobs(path)
+        assert cached.top(PROFILE, 60) == job_ranker.rank_jobs(PROFILE, jobs)
+        cached.close()
+
+    jobs.append({"id": 99, "title": "Backend Intern", "location": "Remote", "technologies": ["SQL", "React"]})
+    path.write_text("".join(json.dumps(job) + "\n" for job in jobs))
+    cached = job_ranker.open_cached_jobs(path)
+    assert cached.count == len(jobs)
+    assert cached.top(PROFILE, 3) == job_ranker.rank_jobs(PROFILE, jobs)[:3]
+    cached.close()
+
+
+def test_watcher_scores_only_appended_jobs(tmp_path: Path, monkeypatch) -> None:
+    jobs = _jobs(40)
+    path = tmp_path / "jobs.ndjson"
+    path.write_text("".join(json.dumps(job) + "\n" for job in jobs[:20]))
+    scored = []
+    score_job = job_ranker.score_job
+    monkeypatch.setattr(
+        job_ranker, "score_job", lambda profile, job: scored.append(job["id"]) or score_job(profile, job)
+    )
+    monkeypatch.setattr(job_ranker, "_TAIL_CHUNK_SIZE", 64)
+    watcher = job_ranker.JobWatcher(PROFILE, path, 4)
+
+    entered, left = watcher.poll()
+    assert [(rank, entry[3]["id"]) for rank, entry in entered] == [(1, 3), (2, 15), (3, 9), (4, 7)]
+    assert left == [] and watcher.poll() == ([], [])
+
+    # A partially written line is held back until its newline arrives.
+    with path.open("a") as out:
+        out.write("".join(json.dumps(job) + "\n" for job in jobs[20:30]) + json.dumps(jobs[30])[:15])
+    scored.clear()
+    entered, left = watcher.poll()
+    assert scored == list(range(20, 30))
+    assert [(rank, entry[3]["id"]) for rank, entry in entered] == [(3, 27)]
+    assert [entry[3]["id"] for entry in left] == [7]
+
+    with path.open("a") as out:
+        out.write(json.dumps(jobs[30])[15:] + "\n" + "".join(json.dumps(job) + "\n" for job in jobs[31:]))
+    scored.clear()
+    watcher.poll()
+    assert scored == list(range(30, 40))
+    expected = job_ranker.top_jobs(PROFILE, iter(jobs), 4)
+    assert [(score, overlap, job) for score, _, overlap, job in watcher.top] == expected
+
+    # A rewritten, shorter file is read again from the start.
+    path.write_text(json.dumps(jobs[2]) + "\n")
+    entered, left = watcher.poll()
+    assert [(rank, entry[3]["id"]) for rank, entry in entered] == [(1, 2)]
+    assert len(left) == 4
+
+
+def test_watcher_restarts_on_files_rewritten_or_replaced(tmp_path: Path) -> None:
+    jobs = _jobs(12)
+    path = tmp_path / "jobs.ndjson"
+    path.write_text("".join(json.dumps(job) + "\n" for job in jobs[:6]))
+    watcher = job_ranker.JobWatcher(PROFILE, path, 2)
+    assert [entry[3]["id"] for _, entry in watcher.poll()[0]] == [3, 0]
+
+    # Rewritten in place (same inode) with more data than was read so far.
+    inode, size = path.stat().st_ino, path.stat().st_size
+    with path.open("r+") as out:
+        out.write("".join(json.dumps(job) + "\n" for job in jobs[6:] + jobs[1:3]))
+    assert path.stat().st_ino == inode and path.stat().st_size > size
+    entered, left = watcher.poll()
+    assert [entry[3]["id"] for entry in left] == [3, 0]
+    assert [(rank, entry[3]["id"]) for rank, entry in entered] == [(1, 9), (2, 7)]
+    assert [entry[3]["id"] for entry in watcher.top] == [9, 7]
+
+    # Replaced by a file whose best job sits at the same byte offset.
+    replacement = tmp_path / "jobs.tmp"
+    replacement.write_text(json.dumps(jobs[3]) + "\n")
+    os.replace(replacement, path)
+    entered, left = watcher.poll()
+    assert [entry[3]["id"] for entry in left] == [9, 7]
+    assert [entry[3]["id"] for _, entry in entered] == [3]
@@ -0,0 +1,54 @@
+from internship_bot.connectors.linkedin import LinkedInConnector
+
+
+def _elements(total: int, report_total: bool = True):
+    def respond(params):
+        start, count = int(params["start"]), int(params["count"])
+        elements = [
+            {"id": index, "title": f"Intern {index}", "companyName": "Acme", "listedAt": 1_700_000_000_000 - index}
+            for index in range(start, min(start + count, total))
+        ]
+        payload = {"elements": elements}
+        if report_total:
+            payload["paging"] = {"start": start, "count": count, "total": total}
+        return 200, {}, payload
+
+    return respond
+
+
+def _pages(server):
+    return sorted((int(params["start"]), int(params["count"])) for params in server.requests)
+
+
+def test_pages_stop_at_paging_total(stub_server) -> None:
+    server = stub_server(_elements(60))
+    connector = LinkedInConnector(server.url, token="secret", page_size=25, prefetch=4)
+
+    jobs = list(connector.fetch_jobs("python"))
+
+    assert [job.id for job in jobs] == [str(index) for index in range(60)]
+    # The last page only asks for what paging.total says is left.
+    assert _pages(server) == [(0, 25), (25, 25), (50, 10)]
+    assert server.headers[0]["Authorization"] == "Bearer secret"
+
+
+def test_short_last_page_ends_pagination_without_a_total(stub_server) -> None:
+    server = stub_server(_elements(30, report_total=False))
+    connector = LinkedInConnector(server.url, token="secret", page_size=25, max_results=250, prefetch=2)
+
+    jobs = list(connector.fetch_jobs("python"))
+
+    assert [job.id for job in jobs] == [str(index) for index in range(30)]
+    # Only the pages prefetched before the short page was seen were requested.
+    assert _pages(server)[:2] == [(0, 25), (25, 25)]
+    assert len(server.requests) <= 3
+
+
+def test_max_results_caps_the_requests(stub_server) -> None:
+    server = stub_server(_elements(1_000))
+    connector = LinkedInConnector(server.url, token="secret", page_size=25, max_results=40)
+
+    jobs = list(connector.fetch_jobs("python"))
+
+    assert len(jobs) == 40
+    assert _pages(server) == [(0, 25), (25, 15)]
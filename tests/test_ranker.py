@@ -0,0 +1,288 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from internship_bot.job_index import JobIndex
+from internship_bot.ranker import Ranker, RankingSession
+from internship_bot.relevance import RelevanceIndex
+from internship_bot.schemas import JobListing, JobRequirement, ResumeProfile
+from internship_bot.table import JobTable
+
+NOW = datetime(2026, 1, 15)
+RESUME = ResumeProfile(
+    name="Sam",
+    graduation_date=datetime(2027, 5, 15),
+    skills=["Python", "SQL", " React ", "python"],
+    interests=["machine learning", "Data", ""],
+    preferred_locations=["New York", "Remote"],
+    # Duplicate, empty and whitespace-only keywords on purpose.
+    target_role_keywords=["Backend", "backend", "", "  ", "data engineer"],
+)
+
+
+def _corpus():
+    roles = ["Backend Intern", "Data Engineer Intern", "Frontend Intern", "Research Assistant"]
+    locations = ["New York, NY", "Remote", None, "Austin, TX", "remote - US"]
+    descriptions = [
+        "Build backend services in Python.",
+        "",
+        "Machine learning pipelines and data tooling.",
+        "Work with the design team.",
+    ]
+    skills = [["python", "sql"], ["React"], [], ["go", "Python"], ["SQL", "react", "docker"]]
+    return [
+        JobListing(
+            provider="Board" if index % 3 else "Other",
+            id=str(index),
+            company="Acme",
+            role=roles[index % len(roles)],
+            location=locations[index % len(locations)],
+            description=descriptions[index % len(descriptions)],
+            requirements=[JobRequirement(skill=skill) for skill in skills[index % len(skills)]],
+            technologies=list(skills[(index + 1) % len(skills)]),
+            posted_at=None if index % 7 == 0 else datetime(2026, 1, 1 + index % 14),
+        )
+        for index in range(60)
+    ]
+
+
+def _ranking(results):
+    return [(result.job.provider, result.job.id, result.score) for result in results]
+
+
+def test_iter_top_k_snapshots_match_rank_prefix() -> None:
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    consumed = []
+
+    def stream():
+        for job in jobs:
+            consumed.append(job)
+            yield job
+
+    snapshots = 0
+    for snapshot in ranker.iter_top_k(stream(), RESUME, 5):
+        assert _ranking(snapshot) == _ranking(ranker.rank(list(consumed), RESUME)[:5])
+        snapshots += 1
+    assert 5 <= snapshots < len(jobs)
+
+
+@pytest.mark.parametrize("k", [None, 1, 7, 100])
+def test_rank_table_matches_rank(k) -> None:
+    pytest.importorskip("numpy")
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    expected = ranker.rank(jobs, RESUME)
+
+    ranked = ranker.rank_table(JobTable.from_listings(jobs), RESUME, k)
+
+    assert _ranking(ranked) == _ranking(expected[:k])
+    assert [result.explanation for result in ranked] == [result.explanation for result in expected[:k]]
+
+
+def test_score_table_matches_rank_on_a_view() -> None:
+    pytest.importorskip("numpy")
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    positions = [59, 0, 14, 3, 3, 28]
+    view = JobTable.from_listings(jobs).take(positions)
+
+    scores = ranker.score_table(view, RESUME).tolist()
+
+    assert scores == [ranker.rank([jobs[position]], RESUME)[0].score for position in positions]
+
+
+@pytest.mark.parametrize("k", [1, 5, 59, 60, 200])
+def test_rank_top_k_matches_rank_prefix(k) -> None:
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    expected = ranker.rank(jobs, RESUME)
+
+    assert _ranking(ranker.rank_top_k(iter(jobs), RESUME, k)) == _ranking(expected[:k])
+    floor = expected[len(expected) // 2].score
+    assert _ranking(ranker.rank_top_k(jobs, RESUME, k, min_score=floor)) == _ranking(
+        ranker.rank(jobs, RESUME, min_score=floor)[:k]
+    )
+    assert ranker.rank_top_k(jobs, RESUME, 0) == []
+
+
+def test_index_pruned_rank_top_k_matches_rank_prefix(tmp_path) -> None:
+    jobs = _corpus()
+    index = JobIndex(tmp_path / "index.sqlite3")
+    index.add(jobs)
+    ranker = Ranker(clock=lambda: NOW)
+    expected = ranker.rank(jobs, RESUME)
+
+    for k in (1, 5, 60):
+        assert _ranking(ranker.rank_top_k(jobs, RESUME, k, index=index)) == _ranking(expected[:k])
+
+
+def test_rank_batch_matches_rank_top_k_for_each_resume() -> None:
+    pytest.importorskip("numpy")
+    jobs = _corpus()
+    resumes = [
+        RESUME,
+        ResumeProfile(name="Empty", graduation_date=NOW, skills=[]),
+        ResumeProfile(
+            name="Lee",
+            graduation_date=NOW,
+            skills=["Go", "docker", "go"],
+            interests=["design"],
+            preferred_locations=["austin", ""],
+            target_role_keywords=["Research", "research"],
+        ),
+        RESUME,
+    ]
+    ranker = Ranker(clock=lambda: NOW)
+
+    for k in (1, 5, 60, 100):
+        for chunk_size in (7, 4096):
+            batch = ranker.rank_batch(jobs, resumes, k, chunk_size=chunk_size)
+            assert [_ranking(ranked) for ranked in batch] == [
+                _ranking(ranker.rank(jobs, resume)[:k]) for resume in resumes
+            ]
+    batch = ranker.rank_batch(JobTable.from_listings(jobs), resumes, 5)
+    assert [[r.explanation for r in ranked] for ranked in batch] == [
+        [r.explanation for r in ranker.rank_top_k(jobs, resume, 5)] for resume in resumes
+    ]
+    assert ranker.rank_batch(jobs, resumes, 0) == [[], [], [], []]
+
+
+def _session_ranking(results):
+    return [(result.job.provider, result.job.id, result.score, result.explanation) for result in results]
+
+
+def test_ranking_session_matches_rank_across_calls() -> None:
+    jobs = _corpus()
+    now = [NOW]
+    ranker = Ranker(clock=lambda: now[0])
+    session = RankingSession(ranker)
+
+    assert _session_ranking(session.rank(jobs, RESUME)) == _session_ranking(ranker.rank(jobs, RESUME))
+    assert session.last_scored == len(jobs)
+
+    now[0] += timedelta(days=3)
+    current = jobs[5:] + _corpus()[:3]  # refetched copies arrive last
+    assert _session_ranking(session.rank(current, RESUME, k=10)) == _session_ranking(
+        ranker.rank(current, RESUME)[:10]
+    )
+    assert session.last_scored == 0
+
+
+def test_ranking_session_rescores_jobs_edited_in_place() -> None:
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    session = RankingSession(ranker)
+    edited = jobs[2]
+    before = {result.job.id: result.score for result in session.rank(jobs, RESUME)}
+
+    edited.role = "Backend Data Engineer Intern"
+    edited.location = "Remote"
+    edited.technologies.append("SQL")
+    ranked = session.rank(jobs, RESUME)
+
+    assert session.last_scored == 1
+    assert _session_ranking(ranked) == _session_ranking(ranker.rank(jobs, RESUME))
+    assert {result.job.id: result.score for result in ranked}[edited.id] > before[edited.id]
+
+
+def test_breakdown_and_explanation_agree_with_the_score() -> None:
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    ranked = ranker.rank(jobs, RESUME)
+    paths = [ranker.rank_top_k(jobs, RESUME, len(jobs)), RankingSession(ranker).rank(jobs, RESUME)]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        paths.append(ranker.rank_table(JobTable.from_listings(jobs), RESUME))
+
+    for result in ranked:
+        breakdown = result.breakdown
+        assert sum(part["points"] for part in breakdown) == pytest.approx(result.score)
+        assert result.explanation == "; ".join(component.describe() for component in result.components)
+        for part in breakdown:
+            assert part["component"] in {"skills", "role_keyword", "location", "interest", "recency"}
+            if part["component"] == "skills":
+                assert part["detail"] == sorted(part["detail"])
+    for other in paths:
+        assert [(r.job.id, r.explanation, r.breakdown) for r in other] == [
+            (r.job.id, r.explanation, r.breakdown) for r in ranked
+        ]
+
+
+def _relevance_ranker(tmp_path, jobs):
+    pytest.importorskip("numpy")
+    relevance = RelevanceIndex(tmp_path / "relevance.sqlite3")
+    relevance.add(jobs)
+    return Ranker(clock=lambda: NOW, relevance=relevance), relevance
+
+
+def _documents(tmp_path):
+    with sqlite3.connect(str(tmp_path / "relevance.sqlite3")) as conn:
+        return conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+
+def test_relevance_component_matches_rank_on_every_path(tmp_path) -> None:
+    jobs = _corpus()
+    ranker, _ = _relevance_ranker(tmp_path, jobs)
+    expected = ranker.rank(jobs, RESUME)
+    assert any(part["component"] == "relevance" for result in expected for part in result.breakdown)
+
+    def explained(results):
+        return [(result.job.id, result.score, result.explanation) for result in results]
+
+    assert explained(ranker.rank_top_k(jobs, RESUME, 10)) == explained(expected[:10])
+    assert explained(ranker.rank_table(JobTable.from_listings(jobs), RESUME)) == explained(expected)
+    assert explained(ranker.rank_batch(jobs, [RESUME], 10)[0]) == explained(expected[:10])
+    assert explained(RankingSession(ranker).rank(jobs, RESUME)) == explained(expected)
+
+
+def test_relevance_index_ignores_refetched_copies_and_edited_text(tmp_path) -> None:
+    jobs = _corpus()
+    ranker, relevance = _relevance_ranker(tmp_path, jobs)
+    session = RankingSession(ranker)
+    session.rank(jobs, RESUME)
+    generation, documents = relevance.generation, _documents(tmp_path)
+
+    for run in range(3):
+        copies = _corpus()
+        for job in copies:
+            job.posted_at = datetime(2026, 1, 14)
+            job.apply_url = f"https://example.com/{run}/{job.id}"
+        assert relevance.add(copies) == 0
+        session.rank(copies, RESUME)
+        assert session.last_scored == 0
+    assert (relevance.generation, _documents(tmp_path)) == (generation, documents)
+
+    edited = jobs[1]
+    edited.description = "Python and SQL for machine learning data pipelines."
+    assert relevance.doc_id(edited) is None
+    expected = ranker.rank(jobs, RESUME)
+    assert all(part["component"] != "relevance" for r in expected if r.job is edited for part in r.breakdown)
+    table = JobTable.from_listings(jobs)
+    assert _ranking(ranker.rank_table(table, RESUME)) == _ranking(expected)
+
+    assert relevance.add([edited]) == 1
+    assert relevance.doc_id(edited) is not None
+    assert _ranking(ranker.rank_table(table, RESUME)) == _ranking(ranker.rank(jobs, RESUME))
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_workers_match_single_process_ranking(tmp_path, workers) -> None:
+    jobs = _corpus()
+    ranker = Ranker(clock=lambda: NOW)
+    relevance_ranker, _ = _relevance_ranker(tmp_path, jobs)
+
+    for each in (ranker, relevance_ranker):
+        expected = each.rank(jobs, RESUME)
+        ranked = each.rank(jobs, RESUME, workers=workers)
+        assert _ranking(ranked) == _ranking(expected)
+        assert [r.explanation for r in ranked] == [r.explanation for r in expected]
+        assert _ranking(each.rank_top_k(iter(jobs), RESUME, 7, workers=workers)) == _ranking(expected[:7])
+        floor = expected[20].score
+        assert _ranking(each.rank(jobs, RESUME, min_score=floor, workers=workers)) == _ranking(
+            each.rank(jobs, RESUME, min_score=floor)
+        )
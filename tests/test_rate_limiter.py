@@ -0,0 +1,63 @@
+import time
+
+import pytest
+import requests
+
+from internship_bot.connectors.linkedin import LinkedInConnector
+from internship_bot.connectors.ratelimit import RateLimiter
+
+
+def _scripted(statuses):
+    """Answer with ``statuses`` in turn (then 200s), recording when each request came in."""
+
+    arrivals = []
+
+    def respond(params):
+        arrivals.append(time.monotonic())
+        status, headers = statuses[len(arrivals) - 1] if len(arrivals) <= len(statuses) else (200, {})
+        return status, headers, {"elements": [{"id": 1, "title": "Intern"}], "paging": {"total": 1}}
+
+    return respond, arrivals
+
+
+def _connector(server, limiter):
+    return LinkedInConnector(server.url, token="secret", page_size=10, rate_limiter=limiter)
+
+
+def test_retry_after_pauses_the_provider(stub_server) -> None:
+    respond, arrivals = _scripted([(429, {"Retry-After": "1"})])
+    limiter = RateLimiter(rate=100, burst=1, backoff_factor=0.01)
+
+    jobs = list(_connector(stub_server(respond), limiter).fetch_jobs("intern"))
+
+    assert [job.id for job in jobs] == ["1"]
+    assert len(arrivals) == 2
+    assert arrivals[1] - arrivals[0] >= 0.95
+    assert limiter.stats.requests == 2 and limiter.stats.throttled == 1
+    assert limiter.stats.wait_seconds >= 0.9
+    # Halved by the 429, then one additive step back up after the success.
+    assert limiter.rate == 60 and limiter.concurrency == 2
+
+
+def test_backoff_grows_exponentially_without_retry_after(stub_server) -> None:
+    respond, arrivals = _scripted([(503, {}), (503, {}), (503, {})])
+    limiter = RateLimiter(rate=1000, burst=10, backoff_factor=0.1)
+
+    assert len(list(_connector(stub_server(respond), limiter).fetch_jobs("intern"))) == 1
+
+    gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    assert len(gaps) == 3
+    assert gaps[0] >= 0.09 and gaps[1] >= 0.19 and gaps[2] >= 0.39
+    assert limiter.stats.throttled == 3
+    assert 0 < limiter.stats.wait_ratio < 1
+
+
+def test_gives_up_after_max_retries(stub_server) -> None:
+    respond, arrivals = _scripted([(429, {})] * 10)
+    limiter = RateLimiter(rate=1000, burst=10, max_retries=2, backoff_factor=0.01)
+
+    with pytest.raises(requests.HTTPError):
+        list(_connector(stub_server(respond), limiter).fetch_jobs("intern"))
+
+    assert len(arrivals) == 3
+    assert limiter.stats.requests == 3 and limiter.stats.throttled == 3
@@ -0,0 +1,79 @@
+from internship_bot.connectors.cache import ResponseCache
+from internship_bot.connectors.linkedin import LinkedInConnector
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 14 Jan 2026 08:00:00 GMT"
+
+
+def _validated(total: int = 3):
+    """Serve ``total`` elements carrying an ETag and Last-Modified."""
+
+    def respond(params):
+        elements = [
+            {"id": index, "title": f"Intern {index}", "companyName": "Acme", "listedAt": 1_700_000_000_000 - index}
+            for index in range(total)
+        ]
+        headers = {"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        return 200, headers, {"elements": elements, "paging": {"start": 0, "count": 25, "total": total}}
+
+    return respond
+
+
+def _connector(server, cache):
+    return LinkedInConnector(server.url, token="secret", page_size=25, cache=cache)
+
+
+def _ids(connector):
+    return [job.id for job in connector.fetch_jobs("python")]
+
+
+def test_fresh_entries_are_served_without_a_request(stub_server, tmp_path) -> None:
+    server = stub_server(_validated())
+    cache = ResponseCache(tmp_path / "cache.sqlite3", default_ttl=3600)
+
+    first = _ids(_connector(server, cache))
+    second = _ids(_connector(server, cache))
+
+    assert first == second == ["0", "1", "2"]
+    assert len(server.requests) == 1
+    assert "If-None-Match" not in server.headers[0]
+    cache.close()
+
+
+def test_stale_entries_revalidate_and_keep_the_body_on_304(stub_server, tmp_path) -> None:
+    served = _validated()
+
+    def respond(params):
+        if server.headers[-1].get("If-None-Match") == ETAG:
+            return 304, {"ETag": ETAG}, None
+        return served(params)
+
+    server = stub_server(respond)
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttls={"LinkedIn": 0})
+
+    first = _ids(_connector(server, cache))
+    second = _ids(_connector(server, cache))
+
+    assert first == second == ["0", "1", "2"]
+    assert len(server.requests) == 2
+    assert "If-None-Match" not in server.headers[0]
+    assert server.headers[1]["If-None-Match"] == ETAG
+    assert server.headers[1]["If-Modified-Since"] == LAST_MODIFIED
+    cache.close()
+
+
+def test_refresh_bypasses_the_ttl(stub_server, tmp_path) -> None:
+    server = stub_server(_validated())
+    path = tmp_path / "cache.sqlite3"
+    cache = ResponseCache(path, default_ttl=3600)
+    _ids(_connector(server, cache))
+    cache.close()
+
+    refreshing = ResponseCache(path, default_ttl=3600, refresh=True)
+    assert _ids(_connector(server, refreshing)) == ["0", "1", "2"]
+    assert _ids(_connector(server, refreshing)) == ["0", "1", "2"]
+
+    # Every refreshed run goes back to the provider, still sending validators.
+    assert len(server.requests) == 3
+    assert [headers.get("If-None-Match") for headers in server.headers] == [None, ETAG, ETAG]
+    refreshing.close()
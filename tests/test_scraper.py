@@ -0,0 +1,30 @@
+import bs4
+import pytest
+
+from internship_bot.connectors import scraper
+
+PAGE = """
+<html><body>
+  <div class="job-card featured">
+    <h2 class="job-title">Backend Intern</h2><span class="company">Acme</span>
+    <ul class="requirements"><li>Python</li></ul>
+  </div>
+  <div class="job-card"><h2 class="job-title">Data Intern</h2><span class="company">Globex</span></div>
+  <div class="job-cards"><h2 class="job-title">Not a card</h2></div>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html.parser"])
+def test_parse_page_keeps_cards_with_several_classes(monkeypatch, backend) -> None:
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(scraper, "PARSER_BACKEND", backend)
+
+    listings = scraper.parse_page("Board", PAGE)
+
+    assert [(job.role, job.company) for job in listings] == [("Backend Intern", "Acme"), ("Data Intern", "Globex")]
+    assert listings[0].technologies == ["python"]
+    assert all(job.posted_at is None for job in listings)
+    unstrained = bs4.BeautifulSoup(PAGE, backend).select(".job-card")
+    assert len(listings) == len(unstrained)
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+from internship_bot.config import Settings, default_columns
+from internship_bot.models import ApplicationAttempt, ApplicationRow
+from internship_bot.sheets_backend import SheetsBackend
+
+
+class FakeWorksheet:
+    def __init__(self) -> None:
+        self.values = [[col.header for col in default_columns()]]
+        self.reads = 0
+
+    def get_all_values(self):
+        self.reads += 1
+        return [list(row) for row in self.values]
+
+    def append_row(self, values):
+        self.values.append(["" if value is None else value for value in values])
+        row = len(self.values)
+        return {"updates": {"updatedRange": f"'applications'!A{row}:O{row}"}}
+
+    def cell(self, row, col):
+        self.reads += 1
+        values = self.values[row - 1] if row <= len(self.values) else []
+        return SimpleNamespace(value=values[col - 1] if col <= len(values) else "")
+
+    def update(self, range_name, values):
+        row = int(range_name.split(":")[0])
+        self.values[row - 1] = ["" if value is None else value for value in values[0]]
+
+
+def _backend(monkeypatch, worksheet: FakeWorksheet, clock) -> SheetsBackend:
+    monkeypatch.setattr(SheetsBackend, "_create_client", lambda self: None)
+    monkeypatch.setattr(SheetsBackend, "_get_or_create_worksheet", lambda self: worksheet)
+    settings = Settings(spreadsheet_id="sheet", service_account_file="creds.json")
+    return SheetsBackend(settings, cache_ttl=60.0, clock=clock)
+
+
+def test_row_cache_serves_duplicates_without_rereading_the_sheet(monkeypatch) -> None:
+    worksheet = FakeWorksheet()
+    existing = ApplicationAttempt(company="Acme", role="Intern", last_attempt_outcome="Submitted")
+    worksheet.append_row(list(ApplicationRow.from_attempt(existing).dict().values()))
+    now = [0.0]
+    backend = _backend(monkeypatch, worksheet, lambda: now[0])
+
+    assert [row.company for row in backend.find_duplicates(existing)] == ["Acme"]
+    assert backend.find_duplicates(existing)[0].location is None
+
+    other = ApplicationAttempt(company="Globex", role="Intern", last_attempt_outcome="Draft")
+    backend.log_attempt(other)
+    updated = existing.copy(update={"status": "Interviewing"})
+    backend.upsert_attempt(updated)
+    # Two reads: the initial load and the check of the target row's ID.
+    assert worksheet.reads == 2
+    assert [row.status for row in backend.find_duplicates(updated)] == ["Interviewing"]
+    assert [row.company for row in backend.find_duplicates(other)] == ["Globex"]
+    assert [row[1] for row in worksheet.values[1:]] == ["Acme", "Globex"]
+    assert worksheet.values[1][6] == "Interviewing"
+
+    # Edits made elsewhere show up after the TTL or an explicit refresh.
+    worksheet.values.pop()
+    assert len(backend.list_rows()) == 2
+    now[0] = 60.0
+    assert backend.find_duplicates(other) == []
+    assert worksheet.reads == 3
+    backend.refresh()
+    assert worksheet.reads == 4
+
+
+def test_upsert_rechecks_rows_moved_since_the_cache_loaded(monkeypatch) -> None:
+    worksheet = FakeWorksheet()
+    attempts = [
+        ApplicationAttempt(company=company, role="Intern", last_attempt_outcome="Submitted")
+        for company in ("Acme", "Globex", "Initech")
+    ]
+    for attempt in attempts:
+        worksheet.append_row(list(ApplicationRow.from_attempt(attempt).dict().values()))
+    backend = _backend(monkeypatch, worksheet, lambda: 0.0)
+    assert len(backend.list_rows()) == 3
+
+    # Someone sorts the shared sheet by company, descending.
+    worksheet.values[1:] = sorted(worksheet.values[1:], key=lambda row: row[1], reverse=True)
+    backend.upsert_attempt(attempts[0].copy(update={"status": "Offer"}))
+
+    assert [(row[1], row[6]) for row in worksheet.values[1:]] == [
+        ("Initech", "Draft"),
+        ("Globex", "Draft"),
+        ("Acme", "Offer"),
+    ]
+    assert [row.company for row in backend.list_rows()] == ["Initech", "Globex", "Acme"]
+    assert backend.find_duplicates(attempts[0])[0].status == "Offer"
+
+    # A row deleted from the sheet is appended again rather than overwriting another.
+    del worksheet.values[1]
+    backend.upsert_attempt(attempts[2].copy(update={"status": "Rejected"}))
+    assert [(row[1], row[6]) for row in worksheet.values[1:]] == [
+        ("Globex", "Draft"),
+        ("Acme", "Offer"),
+        ("Initech", "Rejected"),
+    ]
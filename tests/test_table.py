@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from internship_bot.schemas import JobListing, JobRequirement  # noqa: E402
+from internship_bot.table import JobTable  # noqa: E402
+
+LOCATIONS = ["New York, NY", None, "Remote - US", "remote", "Austin, TX"]
+SKILLS = [["Python", "SQL"], [], ["React"], ["python", "Go"]]
+
+
+def _jobs():
+    return [
+        JobListing(
+            provider="Board" if index % 2 else "Other",
+            id=str(index),
+            company=f"Company {index % 4}",
+            role="Data Intern" if index % 3 else "Backend Intern",
+            location=LOCATIONS[index % len(LOCATIONS)],
+            description="" if index % 6 == 0 else f"Ship python services, batch {index}.",
+            requirements=[JobRequirement(skill) for skill in SKILLS[index % len(SKILLS)]],
+            technologies=["sql"] if index % 5 == 0 else [],
+            posted_at=None if index % 7 == 0 else datetime(2026, 1, 1 + index % 28),
+        )
+        for index in range(90)
+    ]
+
+
+def _keys(jobs):
+    return [f"{job.provider}:{job.id}" for job in jobs]
+
+
+def _skills(job):
+    return {req.skill.lower() for req in job.requirements} | {tech.lower() for tech in job.technologies}
+
+
+@pytest.mark.parametrize(
+    "location, since, skill",
+    [
+        ("remote", None, None),
+        ("NEW YORK", None, None),
+        ("", None, None),
+        (None, datetime(2026, 1, 10), None),
+        (None, datetime(2026, 1, 10, tzinfo=timezone.utc), None),
+        (None, None, "PYTHON"),
+        (None, None, "rust"),
+        ("remote", datetime(2026, 1, 5), "python"),
+    ],
+)
+def test_filter_matches_a_python_loop(location, since, skill) -> None:
+    jobs = _jobs()
+    naive_since = since.replace(tzinfo=None) if since else None
+    expected = [
+        job
+        for job in jobs
+        if (location is None or (job.location is not None and location.lower() in job.location.lower()))
+        and (naive_since is None or (job.posted_at is not None and job.posted_at >= naive_since))
+        and (skill is None or skill.lower() in _skills(job))
+    ]
+
+    table = JobTable.from_listings(jobs).filter(location=location, since=since, skill=skill)
+
+    assert table.job_keys == _keys(expected)
+    assert table.to_listings() == expected
+
+
+def test_take_and_skill_matrix_match_the_listings() -> None:
+    jobs = _jobs()
+    table = JobTable.from_listings(jobs)
+    positions = [89, 0, 7, 7, 42, 13]
+
+    for view, rows in ((table, list(range(len(jobs)))), (table.take(positions), positions)):
+        indptr, indices = view.skill_matrix()
+        assert len(indptr) == len(rows) + 1
+        for position, row in enumerate(rows):
+            entries = indices[indptr[position] : indptr[position + 1]].tolist()
+            assert {view.skills[code] for code in entries} == _skills(jobs[row])
+            assert view[position] == jobs[row]
+
+    # Masks select from the current view, not the full table.
+    subset = table.filter(location="remote")
+    mask = subset.skill_mask("python")
+    assert subset.take(mask).job_keys == _keys(
+        job for job in subset if "python" in _skills(job)
+    )
+
+
+def test_description_mask_matches_substring_search() -> None:
+    jobs = _jobs()
+    table = JobTable.from_listings(jobs).take(slice(5, 60))
+
+    for needle in ("python", "PYTHON SERVICES", "batch 1", "", "missing"):
+        expected = [needle.lower() in job.description.lower() for job in jobs[5:60]]
+        assert table.description_mask(needle).tolist() == expected